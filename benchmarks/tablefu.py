@@ -0,0 +1,160 @@
+#! /usr/bin/env python
+"""
+Times TableFu against the tables configured in the yaml/ directory,
+with every CSV's rows repeated to simulate a much bigger file.
+
+Usage:
+
+    $ python benchmarks/tablefu.py
+    $ python benchmarks/tablefu.py --scale 100
+"""
+import os
+import sys
+import csv
+import time
+import yaml
+import argparse
+
+ROOT_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_PATH)
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+
+import django
+if hasattr(django, 'setup'):
+    django.setup()
+
+from django.conf import settings
+from table_stacker.table_fu import TableFu, Row
+from table_stacker.table_fu.formatting import format
+
+
+def load_fixtures(scale):
+    """
+    Returns a list of (name, rows, options) for every configured table,
+    with the body of each CSV repeated scale times.
+    """
+    fixtures = []
+    for name in sorted(os.listdir(settings.YAML_DIR)):
+        if not name.endswith('.yaml'):
+            continue
+        config = yaml.load(open(os.path.join(settings.YAML_DIR, name)))
+        config = config['table']
+        path = os.path.join(settings.CSV_DIR, config['file'])
+        rows = list(csv.reader(open(path, 'rU')))
+        rows = rows[:1] + rows[1:] * scale
+        fixtures.append((name, rows, config.get('column_options', {})))
+    return fixtures
+
+
+def legacy_unicode(datum):
+    """
+    Renders a Datum the way TableFu did before formatting was compiled:
+    reading the options dict, looking up the formatter by name and
+    rebuilding the row to resolve arguments, once per cell.
+    """
+    value = datum.value
+    if isinstance(value, basestring) and not isinstance(value, unicode):
+        value = unicode(value, 'utf-8')
+    table = datum.table
+    if datum.column_name in table.formatting:
+        func = table.formatting[datum.column_name].get('method', None)
+        args = table.formatting[datum.column_name].get('arguments', [])
+        kwargs = table.formatting[datum.column_name].get('options', {})
+        if func:
+            row = Row(table.table[datum.row_num], datum.row_num, table)
+            args = [row[arg].value for arg in args]
+            return format(value, func, *args, **kwargs)
+    return value
+
+
+def render_table(table, render):
+    for row in table.rows:
+        for datum in row.data:
+            render(datum)
+
+
+def timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def bench_formatting(fixtures):
+    """
+    Compares rendering every cell through the legacy lookups against
+    the compiled per-column formatters.
+    """
+    print "Rendering every cell"
+    print "  %-45s %9s %9s %7s" % ('', 'legacy', 'compiled', 'speedup')
+    legacy_total = compiled_total = 0
+    for name, rows, options in fixtures:
+        table = TableFu([list(r) for r in rows], **options)
+        # Build the Row and Datum objects up front so only rendering is timed
+        render_table(table, id)
+        legacy = timed(render_table, table, legacy_unicode)
+        compiled = timed(render_table, table, unicode)
+        legacy_total += legacy
+        compiled_total += compiled
+        print "  %-45s %8.2fs %8.2fs %6.1fx" % (
+            name, legacy, compiled, legacy / compiled
+        )
+    print "  %-45s %8.2fs %8.2fs %6.1fx" % (
+        'total', legacy_total, compiled_total, legacy_total / compiled_total
+    )
+
+
+def bench_batch(fixtures):
+    """
+    Compares formatting whole columns one cell at a time against
+    handing each column to Formatter.many.
+    """
+    print "Formatting whole columns"
+    print "  %-45s %9s %9s %7s" % ('', 'per cell', 'many', 'speedup')
+    single_total = many_total = 0
+    for name, rows, options in fixtures:
+        table = TableFu([list(r) for r in rows], **options)
+        columns = [
+            (table.values(column), config['method'], config.get('options', {}))
+            for column, config in table.formatting.items()
+            if not config.get('arguments')
+        ]
+        if not columns:
+            continue
+        single = timed(lambda: [
+            [format(v, method, **kwargs) for v in values]
+            for values, method, kwargs in columns
+        ])
+        many = timed(lambda: [
+            format.many(values, method, **kwargs)
+            for values, method, kwargs in columns
+        ])
+        single_total += single
+        many_total += many
+        print "  %-45s %8.2fs %8.2fs %6.1fx" % (
+            name, single, many, single / many
+        )
+    print "  %-45s %8.2fs %8.2fs %6.1fx" % (
+        'total', single_total, many_total, single_total / many_total
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--scale',
+        type=int,
+        default=1000,
+        help="How many times to repeat the rows of each CSV."
+    )
+    options = parser.parse_args()
+    fixtures = load_fixtures(options.scale)
+    print "%s tables, each repeated %s times\n" % (
+        len(fixtures), options.scale
+    )
+    bench_formatting(fixtures)
+    print
+    bench_batch(fixtures)
+
+
+if __name__ == '__main__':
+    main()
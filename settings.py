@@ -11,12 +11,19 @@ CSV_DIR = os.path.join(ROOT_PATH, 'csv')
 BUILD_DIR = os.path.join(ROOT_PATH, 'build')
 BAKERY_VIEWS = [
     'table_stacker.views.TableDetailView',
+    'table_stacker.views.TableFacetView',
     'table_stacker.views.TableListView',
     'table_stacker.sitemaps.SitemapView',
     'table_stacker.feeds.LatestTablesFeed',
     'table_stacker.api.TableDetailCSVView',
-    'table_stacker.api.TableDetailXLSView',
+    'table_stacker.api.TableDetailXLSXView',
     'table_stacker.api.TableDetailJSONView',
+    'table_stacker.api.TableDetailColumnsJSONView',
+    'table_stacker.api.TableDetailNDJSONView',
+    'table_stacker.api.TableDetailPagesView',
+    'table_stacker.api.TableDetailSearchView',
+    'table_stacker.api.TableDetailFacetsView',
+    'table_stacker.api.TableDetailSummaryView',
     'bakery.views.Buildable404View',
 ]
 SITE_NAME = 'TableStacker Demonstration'
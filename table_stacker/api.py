@@ -1,11 +1,191 @@
 import os
+import re
 import csv
+import mmap
+import shutil
+import tempfile
+from wsgiref.util import FileWrapper
 from models import Table
 import json as simplejson
 from django.conf import settings
-from django.shortcuts import render
-from django.http import HttpResponse
+from django.http import HttpResponse, StreamingHttpResponse, Http404
+from django.template.loader import render_to_string
 from bakery.views import BuildableDetailView
+from table_stacker import search
+from table_stacker import xlsx
+from table_stacker.views import get_facets
+from django.utils.datastructures import SortedDict
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Cells that can be written into JSON as a bare number
+JSON_NUMBER = re.compile(r'^-?(0|[1-9][0-9]*)(\.[0-9]+)?$')
+COMPACT = (',', ':')
+CHUNK_SIZE = 1024 * 1024
+# The Linux ioctl that makes a copy-on-write clone of a file
+FICLONE = 0x40049409
+
+
+def join_chunks(pieces, chunk_size=64 * 1024):
+    """
+    Joins an iterable of small strings into chunks of about chunk_size.
+    """
+    buf, size = [], 0
+    for piece in pieces:
+        buf.append(piece)
+        size += len(piece)
+        if size >= chunk_size:
+            yield ''.join(buf)
+            buf, size = [], 0
+    if buf:
+        yield ''.join(buf)
+
+
+def iter_json_list(items, chunk_size=64 * 1024):
+    """
+    Encodes an iterable as a JSON list a piece at a time.
+
+    Yields the same text as json.dumps(list(items)) in chunks of about
+    chunk_size, without ever holding the whole list in memory.
+    """
+    def pieces():
+        yield '['
+        sep = ''
+        for item in items:
+            yield sep + simplejson.dumps(item)
+            sep = ', '
+        yield ']'
+    return join_chunks(pieces(), chunk_size)
+
+
+def iter_columns_json(rows, chunk_size=64 * 1024, spool_size=CHUNK_SIZE):
+    """
+    Encodes CSV rows, headers first, as a JSON object holding one list
+    per column.
+
+        {"columns": ["Name", "Age"], "data": {"Name": [...], "Age": [...]}}
+
+    Columns where every cell is a plain number are written as numbers,
+    with blanks as null. Everything else is written as strings.
+
+    The rows are read only once. The columns are buffered until they hold
+    about spool_size bytes, then written as one block each to a single
+    temporary file, so a wide table doesn't open a file per column. Each
+    column's blocks are read back in turn to stitch the object together.
+    """
+    rows = iter(rows)
+    headers = next(rows, [])
+    spool = tempfile.TemporaryFile()
+    buffers = [[] for h in headers]
+    # The offset and length of each column's blocks in the spool
+    blocks = [[] for h in headers]
+    numeric = [True] * len(headers)
+
+    def flush():
+        for i, buf in enumerate(buffers):
+            if buf:
+                data = ''.join(buf)
+                blocks[i].append((spool.tell(), len(data)))
+                spool.write(data)
+                del buf[:]
+
+    try:
+        buffered = 0
+        for row in rows:
+            for i, buf in enumerate(buffers):
+                value = row[i] if i < len(row) else ''
+                if numeric[i] and value and not JSON_NUMBER.match(value):
+                    numeric[i] = False
+                line = simplejson.dumps(value) + '\n'
+                buf.append(line)
+                buffered += len(line)
+            if buffered >= spool_size:
+                flush()
+                buffered = 0
+        flush()
+
+        def pieces():
+            yield '{"columns": %s, "data": {' % simplejson.dumps(headers)
+            for i, header in enumerate(headers):
+                yield '%s%s: [' % (i and ', ' or '', simplejson.dumps(header))
+                sep = ''
+                for offset, length in blocks[i]:
+                    spool.seek(offset)
+                    for value in spool.read(length)[:-1].split('\n'):
+                        if numeric[i]:
+                            # Drop the quotes around the number
+                            value = value[1:-1] or 'null'
+                        yield sep + value
+                        sep = ', '
+                yield ']'
+            yield '}}'
+        for chunk in join_chunks(pieces(), chunk_size):
+            yield chunk
+    finally:
+        spool.close()
+
+
+def iter_ndjson(rows, chunk_size=64 * 1024):
+    """
+    Encodes CSV rows, headers first, as newline-delimited JSON, with
+    one object per line and keys in the order of the columns.
+    """
+    rows = iter(rows)
+    headers = next(rows, [])
+    return join_chunks((
+        simplejson.dumps(SortedDict(zip(headers, row))) + '\n'
+        for row in rows
+    ), chunk_size)
+
+
+def has_carriage_returns(path):
+    """
+    Returns whether a file has carriage returns that reading it with
+    universal newlines would turn into line feeds.
+
+    The file is mapped into memory rather than read, so looking through
+    a big one costs no copying.
+    """
+    if not os.path.getsize(path):
+        return False
+    with open(path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return data.find('\r') != -1
+        finally:
+            data.close()
+
+
+def link_or_copy(source, target):
+    """
+    Puts a file's contents at target with as little copying as the file
+    system allows. A hard link is tried first, then a copy-on-write
+    clone and finally an ordinary copy.
+
+    Anything already at target is removed first, so a link to the source
+    is never written through.
+    """
+    if os.path.lexists(target):
+        if os.path.samefile(source, target):
+            return
+        os.remove(target)
+    try:
+        os.link(source, target)
+        return
+    except OSError:
+        pass
+    with open(source, 'rb') as src:
+        with open(target, 'wb') as dst:
+            if fcntl is not None:
+                try:
+                    fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+                    return
+                except IOError:
+                    pass
+            shutil.copyfileobj(src, dst, CHUNK_SIZE)
 
 
 class TableBaseAPIView(BuildableDetailView):
@@ -14,9 +194,31 @@ class TableBaseAPIView(BuildableDetailView):
     """
     queryset = Table.live.all()
 
+    def get_csv_path(self, obj):
+        return obj.get_csv_path()
+
     def get_csv_data(self, obj):
-        path = os.path.join(settings.CSV_DIR, obj.csv_name)
-        return open(path, 'rU')
+        return open(self.get_csv_path(obj), 'rU')
+
+    def iter_csv_rows(self, obj):
+        """
+        Yields the rows of a table's CSV, headers first, closing the file
+        when it runs out.
+        """
+        data = self.get_csv_data(obj)
+        try:
+            for row in csv.reader(data):
+                yield row
+        finally:
+            data.close()
+
+    def write_chunks(self, path, chunks):
+        """
+        Writes an iterable of strings to the build directory as it goes.
+        """
+        with open(path, 'wb') as outfile:
+            for chunk in chunks:
+                outfile.write(chunk)
 
     def get_html(self):
         return self.get(self.request).content
@@ -36,55 +238,325 @@ class TableBaseAPIView(BuildableDetailView):
 class TableDetailCSVView(TableBaseAPIView):
     """
     Publish a table as CSV.
+
+    The source file is published as it is, unless it has carriage returns
+    to turn into line feeds, so the build can link to it rather than
+    write out a copy.
     """
     def get_url(self, obj):
         return obj.get_csv_url()
 
     def render_to_response(self, context):
-        data = self.get_csv_data(context['object']).read()
-        response = HttpResponse(data, content_type='text/csv')
+        path = self.get_csv_path(context['object'])
+        if has_carriage_returns(path):
+            data = self.get_csv_data(context['object'])
+            length = None
+        else:
+            data = open(path, 'rb')
+            length = os.path.getsize(path)
+        response = StreamingHttpResponse(
+            FileWrapper(data, CHUNK_SIZE),
+            content_type='text/csv'
+        )
+        if length is not None:
+            response['Content-Length'] = length
         response['Content-Disposition'] = 'attachment; filename=%s.csv' % (
             context['object'].slug
         )
         return response
 
+    def build_object(self, obj):
+        source = self.get_csv_path(obj)
+        path = self.get_build_path(obj)
+        if not has_carriage_returns(source):
+            link_or_copy(source, path)
+            return
+        # Don't write through a link left by an earlier build
+        if os.path.lexists(path):
+            os.remove(path)
+        data = self.get_csv_data(obj)
+        try:
+            self.write_chunks(path, iter(lambda: data.read(CHUNK_SIZE), ''))
+        finally:
+            data.close()
+
 
-class TableDetailXLSView(TableBaseAPIView):
+class TableDetailXLSXView(TableBaseAPIView):
     """
-    Publish a table as XLS.
+    Publish a table as an Excel workbook.
     """
     def get_url(self, obj):
-        return obj.get_xls_url()
+        return obj.get_xlsx_url()
+
+    def write_workbook(self, obj, outfile):
+        xlsx.write_xlsx(
+            self.iter_csv_rows(obj),
+            outfile,
+            schema=obj.get_schema(),
+            sheet_name=obj.slug,
+        )
 
     def render_to_response(self, context):
-        data = self.get_csv_data(context['object'])
-        context['csv'] = csv.reader(data)
-        response = render(self.request, "table.xls.txt", context)
-        response['Content-Disposition'] = 'attachment; filename=%s.xls' % (
+        data = tempfile.TemporaryFile()
+        self.write_workbook(context['object'], data)
+        length = data.tell()
+        data.seek(0)
+        response = StreamingHttpResponse(
+            FileWrapper(data, CHUNK_SIZE),
+            content_type=xlsx.CONTENT_TYPE
+        )
+        response['Content-Length'] = length
+        response['Content-Disposition'] = 'attachment; filename=%s.xlsx' % (
             context['object'].slug
         )
-        response['Content-Type'] = 'application/vnd.ms-excel; charset=utf-8'
         return response
 
+    def build_object(self, obj):
+        path = self.get_build_path(obj)
+        with open(path, 'wb') as outfile:
+            self.write_workbook(obj, outfile)
+        # Earlier builds published an HTML table with an .xls extension
+        legacy = os.path.splitext(path)[0] + '.xls'
+        if os.path.exists(legacy):
+            os.remove(legacy)
+
+
+class TableStreamingAPIView(TableBaseAPIView):
+    """
+    A format that's written a chunk at a time, whether it's served or baked.
 
-class TableDetailJSONView(TableBaseAPIView):
+    Subclasses provide iter_content, which yields the chunks for a table.
+    """
+    content_type = "text/javascript"
+
+    def iter_content(self, obj):
+        raise NotImplementedError
+
+    def render_to_response(self, context):
+        return StreamingHttpResponse(
+            self.iter_content(context['object']),
+            content_type=self.content_type
+        )
+
+    def build_object(self, obj):
+        self.write_chunks(self.get_build_path(obj), self.iter_content(obj))
+
+
+class TableDetailJSONView(TableStreamingAPIView):
     """
     Publish a table as JSON.
     """
     def get_url(self, obj):
         return obj.get_json_url()
 
+    def iter_dicts(self, obj):
+        """
+        Yields each row of a table as a dictionary keyed by its headers.
+        """
+        rows = self.iter_csv_rows(obj)
+        headers = next(rows, [])
+        for row in rows:
+            yield dict(zip(headers, row))
+
+    def iter_content(self, obj):
+        return iter_json_list(self.iter_dicts(obj))
+
+
+class TableDetailColumnsJSONView(TableStreamingAPIView):
+    """
+    Publish a table as JSON with one list per column.
+    """
+    def get_url(self, obj):
+        return obj.get_columns_json_url()
+
+    def iter_content(self, obj):
+        return iter_columns_json(self.iter_csv_rows(obj))
+
+
+class TableDetailNDJSONView(TableStreamingAPIView):
+    """
+    Publish a table as newline-delimited JSON.
+    """
+    content_type = "application/x-ndjson"
+
+    def get_url(self, obj):
+        return obj.get_ndjson_url()
+
+    def iter_content(self, obj):
+        return iter_ndjson(self.iter_csv_rows(obj))
+
+
+class TableDetailPagesView(TableBaseAPIView):
+    """
+    Publish the pages of a paginated table after the first, each as the
+    HTML of its rows wrapped in JSON.
+    """
+    def get_url(self, obj):
+        return obj.get_page_url(self.kwargs.get('page', 1))
+
+    def get_build_path(self, obj):
+        return os.path.join(settings.BUILD_DIR, 'api', obj.slug, 'pages')
+
+    def render_page(self, table, number):
+        html = render_to_string('table_stacker/table_rows.html', {
+            'rows': table.page(number),
+        })
+        return simplejson.dumps({
+            'page': number,
+            'pages': table.total_pages,
+            'html': html,
+        })
+
+    def render_to_response(self, context):
+        table = context['object'].get_tablefu()
+        number = int(self.kwargs['page'])
+        if not table.paginated or not 1 < number <= table.total_pages:
+            raise Http404
+        return HttpResponse(
+            self.render_page(table, number),
+            content_type="text/javascript"
+        )
+
+    def build_object(self, obj):
+        path = self.get_build_path(obj)
+        # Clear out pages from earlier builds, which may have been longer
+        shutil.rmtree(path, ignore_errors=True)
+        table = obj.get_tablefu()
+        if not table.paginated:
+            try:
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+            return
+        os.makedirs(path)
+        for number in range(2, table.total_pages + 1):
+            self.write(
+                os.path.join(path, '%s.json' % number),
+                self.render_page(table, number)
+            )
+
+
+class TableDetailSearchView(TableBaseAPIView):
+    """
+    Publish the search index for a table, as a manifest named index.json
+    and a file for each shard.
+    """
+    def get_url(self, obj):
+        return obj.get_search_shard_url(self.kwargs.get('shard', 'index'))
+
+    def get_build_path(self, obj):
+        return os.path.join(settings.BUILD_DIR, 'api', obj.slug, 'search')
+
+    def get_files(self, obj):
+        """
+        Returns the contents of every file in the index, keyed by name.
+        """
+        table = obj.get_tablefu()
+        shards = search.build_index(table)
+        files = dict(
+            (name, simplejson.dumps(shard, sort_keys=True, separators=COMPACT))
+            for name, shard in shards.items()
+        )
+        files['index'] = simplejson.dumps(
+            search.get_manifest(table, shards),
+            sort_keys=True
+        )
+        return files
+
+    def render_to_response(self, context):
+        if not context['object'].show_search_field:
+            raise Http404
+        files = self.get_files(context['object'])
+        try:
+            data = files[self.kwargs['shard']]
+        except KeyError:
+            raise Http404
+        return HttpResponse(data, content_type="text/javascript")
+
+    def build_object(self, obj):
+        path = self.get_build_path(obj)
+        shutil.rmtree(path, ignore_errors=True)
+        if not obj.show_search_field:
+            try:
+                os.rmdir(os.path.dirname(path))
+            except OSError:
+                pass
+            return
+        os.makedirs(path)
+        for name, data in self.get_files(obj).items():
+            self.write(os.path.join(path, '%s.json' % name), data)
+
+
+class TableDetailFacetsView(TableBaseAPIView):
+    """
+    Publish the values of each column a table is faceted on, with how
+    many rows have each and where their pages are.
+    """
+    def get_url(self, obj):
+        return obj.get_facets_json_url()
+
+    def get_build_path(self, obj):
+        return os.path.join(settings.BUILD_DIR, self.get_url(obj)[1:])
+
+    def get_facets(self, obj):
+        return get_facets(obj, obj.get_tablefu())
+
     def render_to_response(self, context):
-        data = self.get_csv_data(context['object'])
-        data = list(csv.reader(data))
-        headers = data.pop(0)
-        dict_list = []
-        for row in data:
-            col_dict = {}
-            for i, h in enumerate(headers):
-                col_dict[h] = row[i]
-            dict_list.append(col_dict)
+        facets = self.get_facets(context['object'])
+        if not facets:
+            raise Http404
         return HttpResponse(
-            simplejson.dumps(dict_list),
+            simplejson.dumps(facets),
             content_type="text/javascript"
         )
+
+    def build_object(self, obj):
+        path = self.get_build_path(obj)
+        facets = self.get_facets(obj)
+        if not facets:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.path.exists(os.path.dirname(path)) or os.makedirs(
+            os.path.dirname(path)
+        )
+        self.write(path, simplejson.dumps(facets))
+
+
+class TableDetailSummaryView(TableBaseAPIView):
+    """
+    Publish the figures in a table's footer, as set by its summary
+    option, without any formatting.
+    """
+    def get_url(self, obj):
+        return obj.get_summary_json_url()
+
+    def get_build_path(self, obj):
+        return os.path.join(settings.BUILD_DIR, self.get_url(obj)[1:])
+
+    def get_summary(self, obj):
+        table = obj.get_tablefu()
+        if not table.summary:
+            return None
+        return table.aggregate(table.summary)
+
+    def render_to_response(self, context):
+        summary = self.get_summary(context['object'])
+        if not summary:
+            raise Http404
+        return HttpResponse(
+            simplejson.dumps(summary),
+            content_type="text/javascript"
+        )
+
+    def build_object(self, obj):
+        path = self.get_build_path(obj)
+        summary = self.get_summary(obj)
+        if not summary:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        os.path.exists(os.path.dirname(path)) or os.makedirs(
+            os.path.dirname(path)
+        )
+        self.write(path, simplejson.dumps(summary))
@@ -0,0 +1,182 @@
+"""
+Pre-compressed copies of the files in the build directory.
+
+Every text file over a minimum size gets a gzipped sibling with a .gz
+extension and, if the brotli module is installed, a .br sibling as well.
+The encodings written for each file, along with their sizes, are recorded
+in a manifest at the root of the build directory so the files can be
+uploaded with the right Content-Encoding.
+
+The manifest also keeps a hash of each file, so the next build only
+compresses files whose contents have changed. Modification times can't be
+trusted for this: static files are copied in afresh on every build, and
+CSVs linked into place share the time of their source.
+"""
+import os
+import json
+import gzip
+import multiprocessing
+from io import BytesIO
+from table_stacker.manifest import file_hash
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MANIFEST_NAME = '.encodings.json'
+MANIFEST_VERSION = 2
+MIN_SIZE = 1024
+EXTENSIONS = (
+    '.html', '.json', '.ndjson', '.csv', '.xml', '.txt', '.css',
+    '.js', '.svg',
+)
+SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+
+def get_encodings():
+    """
+    The encodings that can be written with the modules installed here.
+    """
+    if brotli is None:
+        return ['gzip']
+    return ['gzip', 'br']
+
+
+def gzip_data(data):
+    out = BytesIO()
+    # Leave the name and time out of the header so the same input always
+    # compresses to the same bytes.
+    f = gzip.GzipFile(filename='', mode='wb', fileobj=out, mtime=0)
+    f.write(data)
+    f.close()
+    return out.getvalue()
+
+
+def brotli_data(data):
+    return brotli.compress(data, quality=11)
+
+
+COMPRESSORS = {'gzip': gzip_data, 'br': brotli_data}
+
+
+def is_up_to_date(sibling, encoding, previous):
+    """
+    Whether a compressed sibling is still the one the last build wrote,
+    given that the original hasn't changed since.
+    """
+    return (
+        previous is not None and
+        os.path.exists(sibling) and
+        os.path.getsize(sibling) == previous.get(encoding)
+    )
+
+
+def compress_file(path, min_size=MIN_SIZE, encodings=None, previous=None):
+    """
+    Writes the compressed siblings of a file and returns a dictionary of
+    its size and hash and the sizes of its siblings.
+
+    Pass the file's entry from the last build's manifest as previous and,
+    if the file's size and hash still match it, siblings of the sizes it
+    lists are left alone.
+
+    Files smaller than min_size aren't compressed, and any siblings left
+    over from when they were bigger are removed.
+    """
+    encodings = encodings or get_encodings()
+    size = os.path.getsize(path)
+    sizes = {'size': size}
+    if size < min_size:
+        for suffix in SUFFIXES.values():
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        return sizes
+    sizes['md5'] = file_hash(path)
+    if previous and (previous.get('size'), previous.get('md5')) != \
+            (size, sizes['md5']):
+        previous = None
+    data = None
+    for encoding in encodings:
+        sibling = path + SUFFIXES[encoding]
+        if not is_up_to_date(sibling, encoding, previous):
+            if data is None:
+                with open(path, 'rb') as f:
+                    data = f.read()
+            with open(sibling, 'wb') as f:
+                f.write(COMPRESSORS[encoding](data))
+        sizes[encoding] = os.path.getsize(sibling)
+    return sizes
+
+
+def _compress_file(args):
+    # Pool.imap only passes one argument
+    return compress_file(*args)
+
+
+def find_files(build_dir):
+    """
+    Yields the path of every compressible file in a directory, relative
+    to it, in a fixed order. Hidden files, like the manifests, are skipped
+    and siblings whose original is gone are deleted.
+    """
+    for root, dirs, files in os.walk(build_dir):
+        dirs.sort()
+        for name in sorted(files):
+            if name.startswith('.'):
+                continue
+            path = os.path.join(root, name)
+            base, ext = os.path.splitext(path)
+            if ext in SUFFIXES.values():
+                if not os.path.exists(base):
+                    os.remove(path)
+                continue
+            if ext.lower() in EXTENSIONS:
+                yield os.path.relpath(path, build_dir)
+
+
+def compress_tree(build_dir, min_size=MIN_SIZE, workers=1):
+    """
+    Compresses every text file in a directory that has changed since the
+    last manifest was saved, spread across a number of processes, and
+    returns a manifest of what was written.
+    """
+    encodings = get_encodings()
+    paths = list(find_files(build_dir))
+    previous = (load_manifest(build_dir) or {}).get('files', {})
+    args = [
+        (os.path.join(build_dir, p), min_size, encodings, previous.get(p))
+        for p in paths
+    ]
+    if workers > 1 and len(args) > 1:
+        pool = multiprocessing.Pool(workers)
+        try:
+            results = list(pool.imap(_compress_file, args, chunksize=8))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [compress_file(*a) for a in args]
+    return {
+        'version': MANIFEST_VERSION,
+        'min_size': min_size,
+        'files': dict(zip(paths, results)),
+    }
+
+
+def load_manifest(build_dir):
+    """
+    Returns the manifest written by the last build, or None.
+    """
+    try:
+        with open(os.path.join(build_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+    except (IOError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(build_dir, manifest):
+    with open(os.path.join(build_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
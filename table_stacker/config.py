@@ -0,0 +1,250 @@
+"""
+Reading and storing the YAML configuration of each table.
+
+Configs are parsed once, by the build, and stored on each Table as
+versioned JSON, along with a hash of what they contain. Reading a config
+back is then a quick JSON load rather than another pass through YAML.
+
+The build keeps an index of every YAML file it has parsed, so a file is
+only parsed again once its modification time or size changes. The rest
+are parsed in a pool of processes.
+"""
+import os
+import json
+import yaml
+import hashlib
+import multiprocessing
+from datetime import date, time
+
+# The C loader from libyaml is many times faster, where it's installed
+try:
+    from yaml import CLoader as Loader
+except ImportError:
+    from yaml import Loader
+
+# Bump this when the way configs are stored changes
+CONFIG_VERSION = 1
+INDEX_NAME = '.yaml-index.json'
+INDEX_VERSION = 1
+
+
+def load_yaml(stream):
+    """
+    Parses a YAML string or open file with the fastest loader available.
+    """
+    return yaml.load(stream, Loader=Loader)
+
+
+def encode_value(value):
+    """
+    Stores the dates and times YAML reads as ISO 8601 strings.
+    """
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError("%r can't be stored as JSON" % value)
+
+
+def to_native(value):
+    """
+    Turns the strings json gives back into the types YAML would have,
+    with plain ASCII strings as str rather than unicode.
+    """
+    if isinstance(value, unicode):
+        try:
+            return value.encode('ascii')
+        except UnicodeEncodeError:
+            return value
+    if isinstance(value, dict):
+        return dict((to_native(k), to_native(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [to_native(v) for v in value]
+    return value
+
+
+def get_config_hash(config):
+    """
+    Returns a hash of a config that's the same whatever order its
+    keys are in.
+    """
+    canonical = json.dumps(config, sort_keys=True, default=encode_value)
+    return hashlib.sha1(canonical).hexdigest()
+
+
+def dump_config(config):
+    """
+    Returns a config as the JSON stored in Table.yaml_data.
+    """
+    return json.dumps({
+        'version': CONFIG_VERSION,
+        'hash': get_config_hash(config),
+        'config': config,
+    }, sort_keys=True, default=encode_value)
+
+
+def load_config(data):
+    """
+    Reads a config back out of Table.yaml_data. Dates and times come
+    back as ISO 8601 strings.
+
+    Anything that isn't JSON stored by this version, like data saved by an
+    older one, is parsed as YAML instead.
+    """
+    if not data:
+        return {}
+    try:
+        stored = json.loads(data)
+    except ValueError:
+        stored = None
+    if isinstance(stored, dict) and stored.get('version') == CONFIG_VERSION:
+        return to_native(stored['config'])
+    return load_yaml(data) or {}
+
+
+def find_yaml(yaml_dir):
+    """
+    Returns the name, path and stat result of every YAML file in a
+    directory and those beneath it, sorted by name.
+
+    Names are relative to yaml_dir, with forward slashes.
+    """
+    found = []
+    for root, dirs, files in os.walk(yaml_dir, followlinks=True):
+        for name in files:
+            if not name.endswith('.yaml'):
+                continue
+            path = os.path.join(root, name)
+            yaml_name = os.path.relpath(path, yaml_dir).replace(os.sep, '/')
+            found.append((yaml_name, path, os.stat(path)))
+    return sorted(found)
+
+
+def parse_yaml_file(args):
+    """
+    Parses the table config in a YAML file, given its name and path.
+
+    Returns a tuple with the name, the config and an error message, one
+    of which is None. It never raises, so it can be run in a worker process.
+    """
+    yaml_name, path = args
+    try:
+        with open(path) as f:
+            config = load_yaml(f)['table']
+        config['yaml_name'] = yaml_name
+    except IOError as e:
+        return yaml_name, None, "Could not be opened: %s" % e.strerror
+    except Exception as e:
+        return yaml_name, None, "Improperly formatted: %s" % e
+    return yaml_name, config, None
+
+
+class YAMLIndex(object):
+    """
+    The parsed config of each YAML file, along with the modification time
+    and size it had when it was parsed, stored as JSON.
+
+    Configs come back from the index as they do from load_config, with
+    dates and times as ISO 8601 strings.
+    """
+    def __init__(self, path):
+        self.path = path
+        self.data = self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return self.empty()
+        if data.get('version') != INDEX_VERSION:
+            return self.empty()
+        return data
+
+    def empty(self):
+        return {'version': INDEX_VERSION, 'files': {}}
+
+    def save(self):
+        try:
+            with open(self.path, 'w') as f:
+                json.dump(
+                    self.data, f, indent=2, sort_keys=True,
+                    default=encode_value
+                )
+        except IOError:
+            # Not being able to save it only means parsing again next time
+            pass
+
+    def get(self, yaml_name, stat):
+        """
+        Returns the config of a file, or None if it has changed since
+        it was indexed.
+        """
+        entry = self.data['files'].get(yaml_name)
+        if entry is None or entry['mtime'] != stat.st_mtime or \
+                entry['size'] != stat.st_size:
+            return None
+        return to_native(entry['config'])
+
+    def update(self, files):
+        """
+        Replaces the index with a list of (yaml_name, stat, config) tuples.
+        """
+        self.data['files'] = dict(
+            (yaml_name, {
+                'mtime': stat.st_mtime,
+                'size': stat.st_size,
+                'config': config,
+            })
+            for yaml_name, stat, config in files
+        )
+
+
+def load_all_yaml(yaml_dir, index_path=None, workers=1):
+    """
+    Returns the table configs of every YAML file in a directory.
+
+    Files that haven't changed since they were last indexed are read from
+    the index at index_path, and the rest are parsed across a number of
+    worker processes.
+
+    Returns a tuple with a list of configs and a list of (yaml_name, path,
+    message) tuples for the files that couldn't be read.
+    """
+    if index_path is None:
+        index_path = os.path.join(yaml_dir, INDEX_NAME)
+    index = YAMLIndex(index_path)
+    found = find_yaml(yaml_dir)
+    configs = {}
+    stale = []
+    for yaml_name, path, stat in found:
+        config = index.get(yaml_name, stat)
+        if config is None:
+            stale.append((yaml_name, path))
+        else:
+            configs[yaml_name] = config
+
+    if workers > 1 and len(stale) > 1:
+        pool = multiprocessing.Pool(workers)
+        try:
+            results = pool.map(parse_yaml_file, stale)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        results = [parse_yaml_file(args) for args in stale]
+
+    errors = []
+    paths = dict(stale)
+    for yaml_name, config, error in results:
+        if error:
+            errors.append((yaml_name, paths[yaml_name], error))
+        else:
+            configs[yaml_name] = config
+
+    loaded = [
+        (yaml_name, stat, configs[yaml_name])
+        for yaml_name, path, stat in found
+        if yaml_name in configs
+    ]
+    index.update(loaded)
+    index.save()
+    return [config for yaml_name, stat, config in loaded], errors
@@ -1,65 +1,299 @@
 import os
-import yaml
+import shutil
+import traceback
+import multiprocessing
+from django.db import connection
 from django.conf import settings
+from optparse import make_option
+from django.core import management
 from table_stacker.models import Table
-from toolbox.FileIterator import FileIterator
+from bakery.views import BuildableDetailView
+from django.core.urlresolvers import get_callable
+from table_stacker.manifest import BuildManifest, tree_hash
+from table_stacker import compression
+from table_stacker.config import load_all_yaml
+from django.core.management.base import CommandError
+from django.core.exceptions import ViewDoesNotExist
 from bakery.management.commands.build import Command as BaseCommand
 
+custom_options = (
+    make_option(
+        "--force",
+        action="store_true",
+        dest="force",
+        default=False,
+        help="Rebuild every table from scratch, even those that haven't \
+changed since the last build."
+    ),
+    make_option(
+        "--workers",
+        action="store",
+        type="int",
+        dest="workers",
+        default=1,
+        help="The number of processes to render tables with. \
+Tables are rendered one after another in this process by default."
+    ),
+    make_option(
+        "--skip-compress",
+        action="store_true",
+        dest="skip_compress",
+        default=False,
+        help="Don't write gzip and brotli copies of the built files."
+    ),
+)
+
 
 class Command(BaseCommand):
+    option_list = BaseCommand.option_list + custom_options
 
     def handle(self, *args, **options):
+        self.workers = max(int(options.get("workers") or 1), 1)
         # Load all YAML files into the local database
         self.stdout.write("Building database\n")
-        [Table.objects.update_or_create(i) for i in self.get_all_yaml()]
-        super(Command, self).handle(*args, **options)
+        yaml_list, yaml_errors = self.get_all_yaml()
+        for yaml_name, path, message in yaml_errors:
+            self.stderr.write("Failed to read %s\n%s\n" % (path, message))
+        # Tables whose YAML is broken are left as they were, not removed
+        created, updated, deleted = Table.objects.sync(
+            yaml_list,
+            keep=[yaml_name for yaml_name, path, message in yaml_errors]
+        )
+        self.stdout.write("%s tables added, %s updated, %s removed\n" % (
+            created, updated, deleted
+        ))
+
+        build_dir = options.get("build_dir") or settings.BUILD_DIR
+        manifest = BuildManifest(build_dir)
+        if args:
+            # Building a handful of views leaves the rest of the site
+            # in an unknown state, so start over next time.
+            super(Command, self).handle(*args, **options)
+            return
+        try:
+            if options.get("force") or not manifest.exists():
+                self.build_all(manifest, options)
+            else:
+                self.build_dir = settings.BUILD_DIR = build_dir
+                self.verbosity = int(options.get('verbosity'))
+                self.build_changed(manifest, options)
+        finally:
+            # Save whatever was finished, even if a table failed,
+            # so the next build picks up where this one left off.
+            manifest.save()
+        if not options.get("skip_compress"):
+            self.compress(build_dir)
+        if yaml_errors:
+            raise CommandError("%s YAML files could not be read: %s" % (
+                len(yaml_errors),
+                ", ".join(path for yaml_name, path, m in yaml_errors)
+            ))
 
-    def get_yaml(self, yaml_name):
+    def compress(self, build_dir):
         """
-        Retrieves the yaml file with the provided name as a Python object.
+        Writes compressed copies of every text file in the build directory
+        that's big enough to be worth it.
         """
-        yaml_path = os.path.join(settings.YAML_DIR, yaml_name)
-        try:
-            yaml_data = open(yaml_path)
-        except:
-            raise YAMLDoesNotExistError(
-                "YAML file could not be opened: %s" % yaml_name
+        self.stdout.write("Compressing files\n")
+        min_size = getattr(
+            settings,
+            'BUILD_COMPRESS_MIN_SIZE',
+            compression.MIN_SIZE
+        )
+        encodings = compression.compress_tree(
+            build_dir,
+            min_size=min_size,
+            workers=self.workers
+        )
+        compression.save_manifest(build_dir, encodings)
+
+    def build_all(self, manifest, options):
+        """
+        Wipes the build directory and renders everything from scratch.
+        """
+        # Let bakery clear out the build directory, copy static files
+        # and render the list pages, then do the tables ourselves.
+        super(Command, self).handle(*get_list_views(), **options)
+        manifest.reset()
+        for name, source in self.get_trees():
+            if os.path.exists(source):
+                manifest.record_tree(name, tree_hash([source]))
+        tables = list(Table.live.all())
+        changed = [(t, manifest.get_inputs(t)) for t in tables]
+        self.build_tables(manifest, changed)
+        manifest.record_listing(tables)
+
+    def build_changed(self, manifest, options):
+        """
+        Renders only the tables whose inputs have changed since the last
+        build, and the list pages only if the published set has.
+        """
+        if not options.get("skip_static"):
+            management.call_command(
+                "collectstatic",
+                interactive=False,
+                verbosity=0
             )
-        try:
-            yaml_obj = yaml.load(yaml_data)['table']
-            yaml_obj['yaml_name'] = yaml_name
-        except:
-            raise InvalidYAMLError("YAML file is improperly formatted.")
-        yaml_data.close()
-        return yaml_obj
+            self.copy_tree(
+                manifest, 'static', settings.STATIC_ROOT, settings.STATIC_URL
+            )
+        if not options.get("skip_media"):
+            self.copy_tree(
+                manifest, 'media', settings.MEDIA_ROOT, settings.MEDIA_URL
+            )
+
+        tables = list(Table.live.all())
+        changed = []
+        for table in tables:
+            inputs = manifest.get_inputs(table)
+            if manifest.has_changed(table, inputs):
+                changed.append((table, inputs))
+        live_slugs = set(t.slug for t in tables)
+        removed = manifest.slugs() - live_slugs
+        self.stdout.write("%s of %s tables changed, %s removed\n" % (
+            len(changed), len(tables), len(removed)
+        ))
+
+        self.build_tables(manifest, changed)
+        for slug in removed:
+            for view in get_detail_views():
+                self.unbuild_slug(get_callable(view)(), slug)
+            manifest.forget(slug)
+
+        if manifest.listing_has_changed(tables):
+            self.stdout.write("Rebuilding table lists\n")
+            for view in get_list_views():
+                get_callable(view)().build_method()
+            manifest.record_listing(tables)
+
+    def build_tables(self, manifest, changed):
+        """
+        Renders the detail views for a list of (table, inputs) pairs,
+        spread across self.workers processes.
+
+        Each table is recorded in the manifest once all its views are
+        written. Failures are collected and reported together after every
+        other table has been built.
+        """
+        for table, inputs in changed:
+            # Forget the table first so a half-finished build of it
+            # is never mistaken for an up-to-date one.
+            manifest.forget(table.slug)
+        slugs = [table.slug for table, inputs in changed]
+        if self.workers > 1 and len(slugs) > 1:
+            # Each process needs its own database connection
+            connection.close()
+            pool = multiprocessing.Pool(self.workers)
+            try:
+                results = list(pool.imap(build_table, slugs))
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            results = [build_table(slug) for slug in slugs]
+
+        failures = []
+        for (table, inputs), error in zip(changed, results):
+            if error:
+                failures.append(table.slug)
+                self.stderr.write("Failed to build %s\n%s\n" % (
+                    table.slug, error
+                ))
+            else:
+                manifest.record(table, inputs)
+        if failures:
+            raise CommandError("%s of %s tables failed to build: %s" % (
+                len(failures), len(slugs), ", ".join(failures)
+            ))
+
+    def unbuild_slug(self, view, slug):
+        """
+        Deletes what a detail view built for a table that's no longer live.
+        """
+        path = view.get_build_path(Table(slug=slug))
+        if os.path.basename(path) == 'index.html':
+            shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+        elif os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def get_trees(self):
+        """
+        The directories bakery copies into the build, by name.
+        """
+        return [
+            ('static', settings.STATIC_ROOT),
+            ('media', settings.MEDIA_ROOT),
+        ]
+
+    def copy_tree(self, manifest, name, source, url):
+        """
+        Replaces a directory of static or media files in the build
+        directory, unless nothing in it has changed since the last copy.
+
+        Copying resets the files' modification times, so skipping it also
+        saves compressing them all again.
+        """
+        if os.path.exists(source) and url:
+            target = os.path.join(self.build_dir, url[1:])
+            digest = tree_hash([source])
+            if os.path.exists(target) and \
+                    not manifest.tree_has_changed(name, digest):
+                return
+            if os.path.exists(target):
+                shutil.rmtree(target)
+            shutil.copytree(source, target)
+            manifest.record_tree(name, digest)
 
     def get_all_yaml(self):
         """
-        Returns a list of all the tables configured in the YAML_DIR
-        in dictionary form.
+        Returns the tables configured in the YAML_DIR in dictionary form,
+        and the files that couldn't be read, with what went wrong.
         """
-        file_list = FileIterator(settings.YAML_DIR)
-        yaml_list = [i for i in file_list if i.endswith('.yaml')]
-        return [self.get_yaml(i) for i in yaml_list]
+        index_path = getattr(settings, 'YAML_INDEX_PATH', None)
+        return load_all_yaml(
+            settings.YAML_DIR,
+            index_path=index_path,
+            workers=self.workers
+        )
 
 
-class YAMLDoesNotExistError(Exception):
+def get_detail_views():
     """
-    Called when you try to open a YAML that doesn't exist.
+    The views in BAKERY_VIEWS that render one page per table.
     """
-    def __init__(self, value):
-        self.parameter = value
-
-    def __str__(self):
-        return repr(self.parameter)
+    return [v for v in settings.BAKERY_VIEWS if is_detail_view(v)]
 
 
-class InvalidYAMLError(Exception):
+def get_list_views():
     """
-    Called when your YAML doesn't get with the program.
+    The views in BAKERY_VIEWS that render a single page.
     """
-    def __init__(self, value):
-        self.parameter = value
+    return [v for v in settings.BAKERY_VIEWS if not is_detail_view(v)]
+
+
+def is_detail_view(view_str):
+    try:
+        view = get_callable(view_str)
+    except (TypeError, ViewDoesNotExist):
+        raise CommandError("View %s does not work." % view_str)
+    return issubclass(view, BuildableDetailView)
 
-    def __str__(self):
-        return repr(self.parameter)
+
+def build_table(slug):
+    """
+    Renders every detail view for one table.
+
+    Returns None when it works and the traceback as a string when it
+    doesn't, so failures can be passed back from a worker process.
+    """
+    try:
+        # Every view is handed the same Table, which keeps the CSV it has
+        # read, so it's only read once
+        table = Table.objects.get(slug=slug)
+        for view_str in get_detail_views():
+            get_callable(view_str)().build_object(table)
+    except Exception:
+        return traceback.format_exc()
+    return None
@@ -0,0 +1,101 @@
+import os
+from django.conf import settings
+from optparse import make_option
+from django.core.management.base import CommandError
+from table_stacker.publishing import Publisher, LocalTarget, S3Target
+from bakery.management.commands.publish import Command as BaseCommand
+
+custom_options = (
+    make_option(
+        "--dry-run",
+        action="store_true",
+        dest="dry_run",
+        default=False,
+        help="List what would be uploaded and deleted without doing it."
+    ),
+    make_option(
+        "--workers",
+        action="store",
+        type="int",
+        dest="workers",
+        default=8,
+        help="The number of files to upload at once. 8 by default."
+    ),
+    make_option(
+        "--retries",
+        action="store",
+        type="int",
+        dest="retries",
+        default=3,
+        help="How many times to retry a failed upload. 3 by default."
+    ),
+    make_option(
+        "--keep-removed",
+        action="store_false",
+        dest="delete",
+        default=True,
+        help="Don't delete files that are no longer in the build directory."
+    ),
+    make_option(
+        "--local-dir",
+        action="store",
+        dest="local_dir",
+        default='',
+        help="Publish to a directory on this computer instead of S3."
+    ),
+)
+
+
+class Command(BaseCommand):
+    help = "Uploads what has changed in the build directory to Amazon S3"
+    # boto reads its own credentials, so bakery's s3cmd --config is dropped
+    option_list = tuple(
+        o for o in BaseCommand.option_list if o.dest != 'config'
+    ) + custom_options
+
+    def handle(self, *args, **options):
+        build_dir = options.get("build_dir") or getattr(
+            settings, 'BUILD_DIR', None
+        )
+        if not build_dir:
+            raise CommandError(self.build_unconfig_msg)
+        if not os.path.exists(build_dir):
+            raise CommandError(self.build_missing_msg)
+
+        if options.get("local_dir"):
+            target = LocalTarget(options.get("local_dir"))
+        else:
+            bucket_name = options.get("aws_bucket_name") or getattr(
+                settings, 'AWS_BUCKET_NAME', None
+            )
+            if not bucket_name:
+                raise CommandError(self.bucket_unconfig_msg)
+            try:
+                target = S3Target(bucket_name)
+            except ImportError as e:
+                raise CommandError(str(e))
+
+        publisher = Publisher(
+            build_dir,
+            target,
+            workers=options.get("workers"),
+            retries=options.get("retries"),
+            delete=options.get("delete"),
+        )
+        plan = publisher.plan()
+        self.stdout.write("%s to upload, %s to delete, %s unchanged\n" % (
+            len(plan['upload']), len(plan['delete']), plan['unchanged']
+        ))
+        if options.get("dry_run") or int(options.get('verbosity')) > 1:
+            for key in plan['upload']:
+                self.stdout.write("  upload %s\n" % key)
+            for key in plan['delete']:
+                self.stdout.write("  delete %s\n" % key)
+        if options.get("dry_run"):
+            return
+
+        failed = publisher.publish(plan)
+        for key, error in sorted(failed.items()):
+            self.stderr.write("Failed to publish %s: %s\n" % (key, error))
+        if failed:
+            raise CommandError("%s files failed to publish" % len(failed))
@@ -1,4 +1,13 @@
 from django.db import models
+from config import dump_config
+try:
+    from django.db.transaction import atomic
+except ImportError:
+    # Django 1.5
+    from django.db.transaction import commit_on_success as atomic
+
+# The most rows to delete in one query
+SYNC_BATCH_SIZE = 500
 
 
 class TableManager(models.Manager):
@@ -11,6 +20,31 @@ class TableManager(models.Manager):
         """
         return self.filter(is_published=True, show_in_feeds=True)
 
+    def get_fields(self, yaml_data):
+        """
+        Returns the field values for the Table outlined by a YAML file.
+        """
+        return dict(
+            csv_name=yaml_data['file'],
+            yaml_name=yaml_data['yaml_name'],
+            yaml_data=dump_config(yaml_data),
+            title=yaml_data['title'],
+            slug=yaml_data.get("slug", yaml_data['yaml_name']),
+            kicker=yaml_data.get("kicker", ""),
+            byline=yaml_data.get("byline", ""),
+            publication_date=yaml_data['publication_date'],
+            publication_time=yaml_data.get("publication_time", None),
+            legend=yaml_data.get('legend', ''),
+            description=yaml_data.get('description', ''),
+            footer=yaml_data.get('footer', ''),
+            sources=yaml_data.get('sources', ''),
+            credits=yaml_data.get('credits', ''),
+            is_published=yaml_data.get('is_published', False),
+            show_download_links=yaml_data.get("show_download_links", True),
+            show_search_field=yaml_data.get("show_search_field", True),
+            show_in_feeds=yaml_data.get("show_in_feeds", True),
+        )
+
     def update_or_create(self, yaml_data):
         """
         If the Table outlined by the provided YAML file exists, it's updated.
@@ -20,57 +54,86 @@ class TableManager(models.Manager):
         Returns a tuple with the object first, and then a boolean that is True
         when the object was created.
         """
+        fields = self.get_fields(yaml_data)
         try:
-            obj = self.get(slug=yaml_data.get("slug", yaml_data['yaml_name']))
+            obj = self.get(slug=fields['slug'])
         except self.model.DoesNotExist:
-            obj = None
-
-        if obj:
-            obj.csv_name = yaml_data['file']
-            obj.yaml_name = yaml_data['yaml_name']
-            obj.yaml_data = str(yaml_data)
-            obj.title = yaml_data['title']
-            obj.slug = yaml_data.get("slug", yaml_data['yaml_name'])
-            obj.kicker = yaml_data.get('kicker', '')
-            obj.byline = yaml_data.get("byline", '')
-            obj.publication_date = yaml_data['publication_date']
-            obj.publication_time = yaml_data.get("publication_time", None)
-            obj.legend = yaml_data.get('legend', '')
-            obj.description = yaml_data.get('description', '')
-            obj.footer = yaml_data.get('footer', '')
-            obj.sources = yaml_data.get('sources', '')
-            obj.credits = yaml_data.get('credits', '')
-            obj.is_published = yaml_data.get('is_published', False)
-            obj.show_download_links = yaml_data.get(
-                "show_download_links", True
-            )
-            obj.show_search_field = yaml_data.get("show_search_field", True)
-            obj.show_in_feeds = yaml_data.get("show_in_feeds", True)
-            created = False
-        else:
-            obj = self.create(
-                csv_name=yaml_data['file'],
-                yaml_name=yaml_data['yaml_name'],
-                yaml_data=str(yaml_data),
-                title=yaml_data['title'],
-                slug=yaml_data.get("slug", yaml_data['yaml_name']),
-                kicker=yaml_data.get("kicker", ""),
-                byline=yaml_data.get("byline", ""),
-                publication_date=yaml_data['publication_date'],
-                publication_time=yaml_data.get("publication_time", None),
-                legend=yaml_data.get('legend', ''),
-                description=yaml_data.get('description', ''),
-                footer=yaml_data.get('footer', ''),
-                sources=yaml_data.get('sources', ''),
-                credits=yaml_data.get('credits', ''),
-                is_published=yaml_data.get('is_published', False),
-                show_download_links=yaml_data.get("show_download_links", True),
-                show_search_field=yaml_data.get("show_search_field", True),
-                show_in_feeds=yaml_data.get("show_in_feeds", True),
-            )
-            created = True
+            obj = self.create(**fields)
+            return obj, True
+        for name, value in fields.items():
+            setattr(obj, name, value)
         obj.save()
-        return obj, created
+        return obj, False
+
+    def sync(self, yaml_list, keep=()):
+        """
+        Makes the tables in the database match a list of YAML configs.
+
+        Tables are matched up by slug. New ones are created together,
+        only those whose fields have changed are updated, and any table
+        without a config is deleted unless its yaml_name is in keep. It
+        all happens in one transaction, after a single query for what's
+        already there.
+
+        Returns a tuple with the number of tables created, updated and
+        deleted.
+        """
+        configs = {}
+        for yaml_data in yaml_list:
+            fields = self.get_fields(yaml_data)
+            # The last config with a slug wins, as it would if each was
+            # saved in turn
+            configs[fields['slug']] = self.clean_fields(fields)
+
+        pk_name = self.model._meta.pk.attname
+        names = [f.attname for f in self.model._meta.fields]
+        existing = {}
+        orphans = []
+        for row in self.values(*names).order_by('pk'):
+            if row['slug'] in configs and row['slug'] not in existing:
+                existing[row['slug']] = row
+            elif row['yaml_name'] not in keep:
+                orphans.append(row[pk_name])
+
+        created = []
+        updated = []
+        for slug, fields in configs.items():
+            row = existing.get(slug)
+            if row is None:
+                created.append(self.model(**fields))
+                continue
+            changes = dict(
+                (name, value) for name, value in fields.items()
+                if row[name] != value
+            )
+            if changes:
+                updated.append((row[pk_name], changes))
+
+        if not (created or updated or orphans):
+            return 0, 0, 0
+        with atomic():
+            if created:
+                self.bulk_create(created)
+            # Django has no bulk update, but there's only a query for
+            # each table that has actually changed
+            for pk, changes in updated:
+                self.filter(pk=pk).update(**changes)
+            # Keep each query under the database's limit on parameters
+            for i in range(0, len(orphans), SYNC_BATCH_SIZE):
+                self.filter(
+                    pk__in=orphans[i:i + SYNC_BATCH_SIZE]
+                ).delete()
+        return len(created), len(updated), len(orphans)
+
+    def clean_fields(self, fields):
+        """
+        Converts field values to the types the database hands back, so
+        they can be compared with what's stored.
+        """
+        return dict(
+            (name, self.model._meta.get_field(name).to_python(value))
+            for name, value in fields.items()
+        )
 
 
 class TableLiveManager(models.Manager):
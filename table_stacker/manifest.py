@@ -0,0 +1,209 @@
+"""
+A record of what went into each table the last time the site was built.
+
+The build command keeps a BuildManifest in the build directory so it can
+tell which tables need to be rendered again. Every table is fingerprinted
+by hashes of its YAML configuration, its CSV, the templates, the Python
+code that renders it and the project's settings and URLs. The pages that
+list tables are fingerprinted by the published tables, in order.
+
+The static and media directories copied into the build are fingerprinted
+too, so they're only copied again when something in them changes.
+"""
+import os
+import json
+import hashlib
+from django.conf import settings
+from django.utils.importlib import import_module
+
+MANIFEST_NAME = '.build-manifest.json'
+MANIFEST_VERSION = 2
+TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), 'templates')
+CODE_DIR = os.path.dirname(__file__)
+# The modules and packages in CODE_DIR that tables are rendered with.
+# Tests, migrations and management commands don't change the output.
+RENDERING_CODE = (
+    'api.py',
+    'config.py',
+    'models.py',
+    'search.py',
+    'views.py',
+    'xlsx.py',
+    'table_fu',
+    'templatetags',
+)
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    """
+    Returns the MD5 hex digest of a file, read a chunk at a time.
+    """
+    digest = hashlib.md5()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tree_hash(directories, extensions=None):
+    """
+    Returns a digest of every file in a list of directories, covering
+    both their names and their contents. Files can be listed too, and
+    paths that don't exist are skipped.
+    """
+    digest = hashlib.md5()
+    for directory in directories:
+        if os.path.isfile(directory):
+            digest.update(os.path.basename(directory))
+            digest.update(file_hash(directory))
+            continue
+        for root, dirs, files in sorted(os.walk(directory)):
+            dirs.sort()
+            for name in sorted(files):
+                if extensions and not name.endswith(extensions):
+                    continue
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, directory))
+                digest.update(file_hash(path))
+    return digest.hexdigest()
+
+
+def get_template_hash():
+    """
+    A digest of every template the site is rendered with.
+    """
+    return tree_hash([TEMPLATE_DIR] + list(settings.TEMPLATE_DIRS))
+
+
+def get_module_path(name):
+    """
+    Returns the source file of a module.
+    """
+    path = import_module(name).__file__
+    if path.endswith(('.pyc', '.pyo')):
+        path = path[:-1]
+    return path
+
+
+def get_code_hash():
+    """
+    A digest of the views, models and TableFu code the tables are
+    rendered with, along with the settings and URLs.
+    """
+    paths = [os.path.join(CODE_DIR, name) for name in RENDERING_CODE]
+    paths.append(get_module_path(settings.SETTINGS_MODULE))
+    paths.append(get_module_path(settings.ROOT_URLCONF))
+    return tree_hash(paths, extensions=('.py',))
+
+
+class BuildManifest(object):
+    """
+    The inputs each table was last built from, stored as JSON.
+    """
+    def __init__(self, build_dir):
+        self.path = os.path.join(build_dir, MANIFEST_NAME)
+        self.data = self.load()
+        self._template_hash = None
+        self._code_hash = None
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (IOError, ValueError):
+            return self.empty()
+        if data.get('version') != MANIFEST_VERSION:
+            return self.empty()
+        return data
+
+    def empty(self):
+        return {
+            'version': MANIFEST_VERSION,
+            'listing': None,
+            'tables': {},
+            'trees': {},
+        }
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def reset(self):
+        self.data = self.empty()
+
+    def save(self):
+        dirname = os.path.dirname(self.path)
+        os.path.exists(dirname) or os.makedirs(dirname)
+        with open(self.path, 'w') as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+
+    @property
+    def template_hash(self):
+        if self._template_hash is None:
+            self._template_hash = get_template_hash()
+        return self._template_hash
+
+    @property
+    def code_hash(self):
+        if self._code_hash is None:
+            self._code_hash = get_code_hash()
+        return self._code_hash
+
+    def get_inputs(self, table):
+        """
+        Returns the fingerprints of everything a table is rendered from.
+        """
+        yaml_path = os.path.join(settings.YAML_DIR, table.yaml_name)
+        csv_path = os.path.join(settings.CSV_DIR, table.csv_name)
+        return {
+            'yaml': file_hash(yaml_path),
+            'csv': file_hash(csv_path),
+            'templates': self.template_hash,
+            'code': self.code_hash,
+        }
+
+    def has_changed(self, table, inputs=None):
+        """
+        Returns True if a table's inputs differ from its last build.
+        """
+        inputs = inputs or self.get_inputs(table)
+        return self.data['tables'].get(table.slug) != inputs
+
+    def record(self, table, inputs=None):
+        self.data['tables'][table.slug] = inputs or self.get_inputs(table)
+
+    def forget(self, slug):
+        self.data['tables'].pop(slug, None)
+
+    def slugs(self):
+        return set(self.data['tables'].keys())
+
+    def get_listing(self, tables):
+        """
+        Returns a fingerprint of the published tables, in order, as they
+        appear on the list page, feed and sitemap, along with the templates
+        and code they're rendered with.
+        """
+        digest = hashlib.md5(self.template_hash)
+        digest.update(self.code_hash)
+        for table in tables:
+            digest.update(table.slug)
+            digest.update(self.data['tables'].get(table.slug, {}).get(
+                'yaml', ''
+            ))
+        return digest.hexdigest()
+
+    def listing_has_changed(self, tables):
+        return self.data.get('listing') != self.get_listing(tables)
+
+    def record_listing(self, tables):
+        self.data['listing'] = self.get_listing(tables)
+
+    def tree_has_changed(self, name, digest):
+        """
+        Returns True if a directory copied into the build, like the static
+        files, differs from the last time it was copied.
+        """
+        return self.data.get('trees', {}).get(name) != digest
+
+    def record_tree(self, name, digest):
+        self.data.setdefault('trees', {})[name] = digest
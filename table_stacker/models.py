@@ -1,11 +1,13 @@
 import os
-import yaml
+import copy
 from table_fu import TableFu
+from table_fu.schema import load_schema
 from django.db import models
 from datetime import datetime
 from django.conf import settings
 from django.contrib.sites.models import Site
 from managers import TableLiveManager, TableManager
+from config import load_config
 
 
 class Table(models.Model):
@@ -52,13 +54,53 @@ class Table(models.Model):
         return ('table-csv', [self.slug])
 
     @models.permalink
-    def get_xls_url(self):
-        return ('table-xls', [self.slug])
+    def get_xlsx_url(self):
+        return ('table-xlsx', [self.slug])
 
     @models.permalink
     def get_json_url(self):
         return ('table-json', [self.slug])
 
+    @models.permalink
+    def get_columns_json_url(self):
+        return ('table-columns-json', [self.slug])
+
+    @models.permalink
+    def get_ndjson_url(self):
+        return ('table-ndjson', [self.slug])
+
+    @models.permalink
+    def get_page_url(self, page):
+        return ('table-page', [self.slug, page])
+
+    def get_pages_url(self):
+        """
+        The directory the pages of a paginated table are published in.
+        """
+        return self.get_page_url(1).rsplit('/', 1)[0] + '/'
+
+    @models.permalink
+    def get_search_shard_url(self, shard):
+        return ('table-search', [self.slug, shard])
+
+    @models.permalink
+    def get_facet_url(self, column_slug, value_slug):
+        return ('table-facet', [self.slug, column_slug, value_slug])
+
+    @models.permalink
+    def get_facets_json_url(self):
+        return ('table-facets-json', [self.slug])
+
+    @models.permalink
+    def get_summary_json_url(self):
+        return ('table-summary-json', [self.slug])
+
+    def get_search_url(self):
+        """
+        The directory the search index for a table is published in.
+        """
+        return self.get_search_shard_url('index').rsplit('/', 1)[0] + '/'
+
     def get_share_url(self):
         """
         The link we can use for share buttons.
@@ -66,16 +108,69 @@ class Table(models.Model):
         site = Site.objects.get_current()
         return 'http://%s%s' % (site.domain, self.get_absolute_url())
 
+    def get_config(self):
+        """
+        The table's configuration, read out of yaml_data the first time
+        it's asked for and kept until yaml_data changes.
+        """
+        cached = getattr(self, '_config_cache', None)
+        if cached is None or cached[0] is not self.yaml_data:
+            cached = self._config_cache = (
+                self.yaml_data, load_config(self.yaml_data)
+            )
+        return cached[1]
+    config = property(get_config)
+
     def get_tablefu_opts(self):
-        return yaml.load(self.yaml_data).get('column_options', {})
+        """
+        A copy of the table's column options, which TableFu is free to
+        change.
+        """
+        return copy.deepcopy(self.config.get('column_options', {}))
+
+    def get_csv_path(self):
+        return os.path.join(settings.CSV_DIR, self.csv_name)
+
+    def get_csv_key(self):
+        """
+        Identifies the current version of the CSV, by its name, when it
+        was last modified and its size.
+        """
+        stat = os.stat(self.get_csv_path())
+        return (self.csv_name, stat.st_mtime, stat.st_size)
+
+    def get_schema(self):
+        """
+        The types and statistics of the CSV's columns, loaded the first
+        time they're asked for and kept until the CSV changes.
+        """
+        key = self.get_csv_key()
+        cached = getattr(self, '_schema_cache', None)
+        if cached is None or cached[0] != key:
+            cached = self._schema_cache = (
+                key, load_schema(self.get_csv_path())
+            )
+        return cached[1]
+    schema = property(get_schema)
 
     def get_tablefu(self):
         """
         Trick the data out with TableFu.
+
+        The table is read the first time it's asked for and kept until the
+        CSV or the config changes, so every view that renders this Table
+        shares it. Don't change it in place. Use filter(), where() or
+        take() for a copy.
         """
-        path = os.path.join(settings.CSV_DIR, self.csv_name)
-        data = open(path, 'r')
-        return TableFu(data, **self.get_tablefu_opts())
+        key = (self.get_csv_key(), self.yaml_data)
+        cached = getattr(self, '_tablefu_cache', None)
+        if cached is None or cached[0] != key:
+            opts = self.get_tablefu_opts()
+            opts['schema'] = self.get_schema()
+            with open(self.get_csv_path(), 'r') as data:
+                table = TableFu.from_csv(data, **opts)
+            cached = self._tablefu_cache = (key, table)
+        return cached[1]
     tablefu = property(get_tablefu)
 
     def get_publication_datetime(self):
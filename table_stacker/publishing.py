@@ -0,0 +1,304 @@
+"""
+Uploads the build directory, sending only the files that have changed.
+
+Each file is fingerprinted by its MD5 hash. A manifest of the hashes last
+uploaded is stored alongside the files in the target, so a publish only
+has to fetch that one object to know what's already there, rather than
+list or download the whole bucket.
+
+A target is anything with these five methods:
+
+    get_manifest()           returns the stored manifest, or None
+    put_manifest(data)       stores the manifest
+    list_keys()              returns every key but the manifest's
+    upload(path, key, headers)
+    delete(key)
+
+The keys are only listed when there's no manifest yet, as on the first
+publish to a bucket filled by some other tool, so that files left there
+can still be deleted.
+
+S3Target publishes to an Amazon S3 bucket using boto. LocalTarget
+publishes to a directory, for trying things out without the network.
+"""
+import os
+import json
+import time
+import shutil
+import threading
+import mimetypes
+from multiprocessing.pool import ThreadPool
+from table_stacker import compression
+from table_stacker.manifest import file_hash
+
+MANIFEST_NAME = '.publish-manifest.json'
+MANIFEST_VERSION = 1
+ENCODINGS = dict((suffix, encoding) for encoding, suffix in
+                 compression.SUFFIXES.items())
+
+
+class LocalTarget(object):
+    """
+    Publishes to a directory on this computer.
+    """
+    def __init__(self, root):
+        self.root = root
+
+    def get_path(self, key):
+        return os.path.join(self.root, *key.split('/'))
+
+    def get_manifest(self):
+        try:
+            with open(self.get_path(MANIFEST_NAME)) as f:
+                return json.load(f)
+        except (IOError, ValueError):
+            return None
+
+    def put_manifest(self, data):
+        self.upload_string(MANIFEST_NAME, json.dumps(data, sort_keys=True))
+
+    def list_keys(self):
+        keys = []
+        for root, dirs, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(root, name)
+                keys.append(
+                    os.path.relpath(path, self.root).replace(os.sep, '/')
+                )
+        return [k for k in keys if k != MANIFEST_NAME]
+
+    def upload_string(self, key, data):
+        path = self.get_path(key)
+        os.path.exists(os.path.dirname(path)) or os.makedirs(
+            os.path.dirname(path)
+        )
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    def upload(self, path, key, headers):
+        target = self.get_path(key)
+        os.path.exists(os.path.dirname(target)) or os.makedirs(
+            os.path.dirname(target)
+        )
+        shutil.copyfile(path, target)
+
+    def delete(self, key):
+        path = self.get_path(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class S3Target(object):
+    """
+    Publishes to an Amazon S3 bucket, with every file readable by the public.
+
+    Credentials are found by boto, in its config file or the
+    AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY environment variables.
+    """
+    def __init__(self, bucket_name):
+        try:
+            import boto
+        except ImportError:
+            raise ImportError("Publishing to S3 requires the boto module")
+        self.boto = boto
+        self.bucket_name = bucket_name
+        self.local = threading.local()
+        # Connect now, so bad credentials or a missing bucket are
+        # reported before anything is planned
+        self.bucket
+
+    @property
+    def bucket(self):
+        """
+        The bucket, through a connection of the calling thread's own,
+        since boto's connections can't be shared between threads.
+        """
+        bucket = getattr(self.local, 'bucket', None)
+        if bucket is None:
+            bucket = self.local.bucket = self.boto.connect_s3().get_bucket(
+                self.bucket_name
+            )
+        return bucket
+
+    def get_manifest(self):
+        key = self.bucket.get_key(MANIFEST_NAME)
+        if key is None:
+            return None
+        try:
+            return json.loads(key.get_contents_as_string())
+        except ValueError:
+            return None
+
+    def put_manifest(self, data):
+        key = self.bucket.new_key(MANIFEST_NAME)
+        key.set_contents_from_string(
+            json.dumps(data, sort_keys=True),
+            headers={'Content-Type': 'application/json'},
+        )
+
+    def list_keys(self):
+        return [k.name for k in self.bucket.list() if k.name != MANIFEST_NAME]
+
+    def upload(self, path, key, headers):
+        self.bucket.new_key(key).set_contents_from_filename(
+            path,
+            headers=headers,
+            policy='public-read',
+        )
+
+    def delete(self, key):
+        self.bucket.delete_key(key)
+
+
+def get_headers(key):
+    """
+    Returns the HTTP headers a file should be uploaded with.
+
+    Compressed copies written by the build are sent with the type of the
+    original file and the matching Content-Encoding.
+    """
+    base, ext = os.path.splitext(key)
+    headers = {}
+    if ext in ENCODINGS:
+        headers['Content-Encoding'] = ENCODINGS[ext]
+        key = base
+    content_type = mimetypes.guess_type(key)[0]
+    if content_type:
+        headers['Content-Type'] = content_type
+    return headers
+
+
+def get_local_manifest(build_dir):
+    """
+    Returns a dictionary of the MD5 hash of every file in the build
+    directory, keyed by its path relative to it. Hidden files, like the
+    build's own manifests, are left out.
+    """
+    files = {}
+    for root, dirs, names in os.walk(build_dir):
+        for name in names:
+            if name.startswith('.'):
+                continue
+            path = os.path.join(root, name)
+            key = os.path.relpath(path, build_dir).replace(os.sep, '/')
+            files[key] = file_hash(path)
+    return files
+
+
+class Publisher(object):
+    """
+    Uploads what has changed in a build directory to a target.
+
+    Usage:
+
+    >>> publisher = Publisher('build', LocalTarget('/tmp/site'))
+    >>> plan = publisher.plan()
+    >>> results = publisher.publish(plan)
+    """
+    def __init__(self, build_dir, target, workers=8, retries=3,
+                 backoff=1.0, delete=True):
+        self.build_dir = build_dir
+        self.target = target
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.delete = delete
+
+    def get_remote_manifest(self):
+        """
+        Returns the hashes of the files last published, or None if the
+        target has no manifest this version can read.
+        """
+        manifest = self.target.get_manifest()
+        if not manifest or manifest.get('version') != MANIFEST_VERSION:
+            return None
+        return manifest['files']
+
+    def plan(self):
+        """
+        Returns a dictionary listing the keys to upload, the keys to delete
+        and the keys that are already up to date, along with the local and
+        remote manifests they were worked out from.
+        """
+        local = get_local_manifest(self.build_dir)
+        remote = self.get_remote_manifest()
+        if remote is None:
+            # Without a manifest, everything is uploaded and the target
+            # itself is listed to find what to delete
+            remote = {}
+            existing = self.target.list_keys() if self.delete else []
+        else:
+            existing = remote
+        upload = sorted(k for k, h in local.items() if remote.get(k) != h)
+        if self.delete:
+            delete = sorted(k for k in existing if k not in local)
+        else:
+            delete = []
+        return {
+            'upload': upload,
+            'delete': delete,
+            'unchanged': len(local) - len(upload),
+            'local': local,
+            'remote': remote,
+        }
+
+    def retry(self, func, *args):
+        """
+        Calls a function until it works, waiting twice as long after each
+        failure. Returns None or, if it never works, the last exception.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                func(*args)
+                return None
+            except Exception as e:
+                if attempt == self.retries:
+                    return e
+                time.sleep(self.backoff * 2 ** attempt)
+
+    def upload_key(self, key):
+        path = os.path.join(self.build_dir, *key.split('/'))
+        return self.retry(self.target.upload, path, key, get_headers(key))
+
+    def delete_key(self, key):
+        return self.retry(self.target.delete, key)
+
+    def publish(self, plan=None):
+        """
+        Carries out a plan, uploading and deleting across a pool of
+        threads, then stores a manifest of what the target now holds.
+
+        Returns a dictionary of the keys that failed, with their errors.
+        Failed uploads are left out of the stored manifest, so they are
+        tried again next time.
+        """
+        plan = plan or self.plan()
+        jobs = [(self.upload_key, k) for k in plan['upload']]
+        jobs += [(self.delete_key, k) for k in plan['delete']]
+        if self.workers > 1 and len(jobs) > 1:
+            pool = ThreadPool(self.workers)
+            try:
+                errors = pool.map(lambda job: job[0](job[1]), jobs)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            errors = [func(key) for func, key in jobs]
+
+        failed = dict(
+            (key, error) for (func, key), error in zip(jobs, errors) if error
+        )
+        files = dict(plan['remote'])
+        for key in plan['upload']:
+            if key in failed:
+                files.pop(key, None)
+            else:
+                files[key] = plan['local'][key]
+        for key in plan['delete']:
+            if key not in failed:
+                files.pop(key, None)
+        self.target.put_manifest({
+            'version': MANIFEST_VERSION,
+            'files': files,
+        })
+        return failed
@@ -0,0 +1,89 @@
+"""
+An inverted index for searching a table in the browser.
+
+Every cell is rendered the way it appears on the page, stripped of HTML,
+lower-cased and split into words. Each word points to the rows it appears
+in, counting from zero in the table's default order.
+
+Words are sharded into files by their first couple of characters, so a
+search for "smi" only has to fetch the one file holding every word that
+starts with "sm". Each list of rows is stored as the differences between
+one row number and the next, which keeps the files small.
+"""
+import re
+from HTMLParser import HTMLParser
+from django.utils.html import strip_tags
+
+PREFIX_LENGTH = 2
+# Anything but whitespace and ASCII punctuation. The same pattern is used
+# by jquery.tablesorter.searchindex.js to split up what readers type.
+WORD = re.compile(u"[^\\s!-/:-@\\[-`{-~]+", re.UNICODE)
+
+
+def tokenize(text):
+    """
+    Splits a string into a list of lower-cased words.
+    """
+    if not isinstance(text, unicode):
+        text = unicode(text, 'utf-8')
+    return WORD.findall(text.lower())
+
+
+def get_text(html):
+    """
+    Returns the text a browser would show for a snippet of HTML.
+    """
+    return HTMLParser().unescape(strip_tags(html))
+
+
+def shard_name(prefix):
+    """
+    The file name for the words starting with a prefix, safe to use
+    whatever alphabet the words are in.
+    """
+    return prefix.encode('utf-8').encode('hex')
+
+
+def delta_encode(numbers):
+    previous, deltas = 0, []
+    for n in numbers:
+        deltas.append(n - previous)
+        previous = n
+    return deltas
+
+
+def delta_decode(deltas):
+    total, numbers = 0, []
+    for d in deltas:
+        total += d
+        numbers.append(total)
+    return numbers
+
+
+def build_index(table):
+    """
+    Returns the search index for a TableFu table, as a dictionary of
+    shards keyed by file name. Each shard maps words to their rows.
+    """
+    postings = {}
+    for column in table.columns:
+        for row_id, html in enumerate(table.formatted_values(column)):
+            for word in tokenize(get_text(html)):
+                postings.setdefault(word, set()).add(row_id)
+    shards = {}
+    for word, rows in postings.items():
+        shard = shards.setdefault(shard_name(word[:PREFIX_LENGTH]), {})
+        shard[word] = delta_encode(sorted(rows))
+    return shards
+
+
+def get_manifest(table, shards):
+    """
+    Describes an index, so the browser knows which shards exist before it
+    asks for them.
+    """
+    return {
+        'rows': len(table),
+        'prefix_length': PREFIX_LENGTH,
+        'shards': sorted(shards),
+    }
@@ -0,0 +1,166 @@
+/*
+ * A pager for tables too big to put on one page.
+ *
+ * The first page of rows is part of the HTML. The rest are fetched as
+ * they're needed from JSON files holding the HTML for each page's rows,
+ * named by page number, like pages/2.json, and kept once they've loaded.
+ *
+ * Given a searchIndex and a filterSelector, what's typed in the filter is
+ * looked up in the index and the first page's worth of matching rows is
+ * shown, fetched from whichever pages they're on.
+ */
+(function($) {
+    $.extend({
+        lazyPager: new function() {
+
+            function updatePageDisplay(c) {
+                $(c.cssPageDisplay, c.container).text(c.page + c.seperator + c.totalPages);
+            }
+
+            function loadPage(table, page, callback) {
+                var c = table.config;
+                if (c.pages[page] !== undefined) {
+                    callback();
+                    return;
+                }
+                $.getJSON(c.url + page + '.json', function(data) {
+                    c.pages[page] = data.html;
+                    callback();
+                });
+            }
+
+            function moveToPage(table, page) {
+                var c = table.config;
+                if (page < 1) {
+                    page = 1;
+                }
+                if (page > c.totalPages) {
+                    page = c.totalPages;
+                }
+                c.page = page;
+                loadPage(table, page, function() {
+                    // Don't draw a page that was clicked past while it loaded
+                    if (c.page === page && !c.string) {
+                        renderPage(table, page);
+                    }
+                });
+            }
+
+            /* Shows the first page's worth of rows matching a search */
+            function showRows(table, rowIds, string) {
+                var c = table.config;
+                rowIds = rowIds.slice(0, c.size);
+                var needed = [];
+                $.each(rowIds, function(i, id) {
+                    var page = Math.floor(id / c.size) + 1;
+                    if ($.inArray(page, needed) === -1) {
+                        needed.push(page);
+                    }
+                });
+                var remaining = needed.length;
+                if (remaining === 0) {
+                    $(table.tBodies[0]).empty();
+                    return;
+                }
+                $.each(needed, function(i, page) {
+                    loadPage(table, page, function() {
+                        remaining--;
+                        if (remaining > 0 || c.string !== string) {
+                            return;
+                        }
+                        var rows = [];
+                        $.each(rowIds, function(j, id) {
+                            var page = Math.floor(id / c.size) + 1;
+                            rows.push($(c.pages[page]).filter('tr').get(id % c.size));
+                        });
+                        $(table.tBodies[0]).empty().append(rows);
+                    });
+                });
+            }
+
+            function search(table) {
+                var c = table.config;
+                var string = $.trim(c.filterSelector.val());
+                if (string === c.string) {
+                    return;
+                }
+                c.string = string;
+                c.searchIndex.search(string, function(rowIds) {
+                    if (c.string !== string) {
+                        return;
+                    }
+                    if (rowIds === null) {
+                        c.string = '';
+                        c.container.show();
+                        moveToPage(table, c.page);
+                    } else {
+                        c.container.hide();
+                        showRows(table, rowIds, string);
+                    }
+                });
+            }
+
+            function renderPage(table, page) {
+                var c = table.config;
+                $(table.tBodies[0]).html(c.pages[page]);
+                updatePageDisplay(c);
+            }
+
+            this.defaults = {
+                url: null,
+                size: 50,
+                page: 1,
+                totalPages: 1,
+                container: null,
+                cssNext: '.next',
+                cssPrev: '.prev',
+                cssFirst: '.first',
+                cssLast: '.last',
+                cssPageDisplay: '.pagedisplay',
+                seperator: "/",
+                filterSelector: null,
+                searchIndex: null
+            };
+
+            this.construct = function(settings) {
+
+                return this.each(function() {
+
+                    var table = this;
+                    var config = table.config = $.extend({}, $.lazyPager.defaults, settings);
+                    var pager = config.container;
+
+                    config.pages = {1: $(table.tBodies[0]).html()};
+                    config.string = '';
+                    if (config.searchIndex) {
+                        setInterval(function() { search(table); }, 250);
+                    }
+
+                    $(config.cssFirst, pager).click(function() {
+                        moveToPage(table, 1);
+                        return false;
+                    });
+                    $(config.cssNext, pager).click(function() {
+                        moveToPage(table, config.page + 1);
+                        return false;
+                    });
+                    $(config.cssPrev, pager).click(function() {
+                        moveToPage(table, config.page - 1);
+                        return false;
+                    });
+                    $(config.cssLast, pager).click(function() {
+                        moveToPage(table, config.totalPages);
+                        return false;
+                    });
+                    updatePageDisplay(config);
+                });
+            };
+
+        }
+    });
+    // extend plugin scope
+    $.fn.extend({
+        lazyPager: $.lazyPager.construct
+    });
+
+})(jQuery);
@@ -25,7 +25,48 @@
         $(table).trigger("applyWidgets");
       }
         
+      // Look the rows up in the index baked by the build. Each row's DOM
+      // element needs a rowId, its position before the table was sorted.
+      function renderFromIndex(table){
+        var c = table.config;
+        var newString = $.trim(c.filterSelector[0].value);
+        if (newString === c.string) {
+          return false;
+        }
+        c.string = newString;
+        c.searchIndex.search(newString, function(rowIds){
+          // The search has been typed over while the index loaded
+          if (newString !== c.string) {
+            return;
+          }
+          if (rowIds === null) {
+            c.collection = c.rowsCopy.slice(0);
+            if (c.container) {
+              c.container.show();
+              c.reset = true;
+            }
+            replaceRows(table);
+            return;
+          }
+          if (c.container) {
+            c.container.hide();
+          }
+          c.reset = false;
+          var wanted = {};
+          for (var i = 0; i < rowIds.length; i++) {
+            wanted[rowIds[i]] = true;
+          }
+          c.collection = $.grep(c.rowsCopy, function(row){
+            return wanted[row[0].rowId] === true;
+          });
+          replaceRows(table);
+        });
+      }
+
       function renderTable(table){
+        if (table.config.searchIndex) {
+          return renderFromIndex(table);
+        }
         table.config.reset = false;
         var newString = table.config.filterSelector[0].value;
         if(newString.length > 1){
@@ -86,7 +127,8 @@
       }
       
       this.defaults = {
-        filterSelector: $("#filter")
+        filterSelector: $("#filter"),
+        searchIndex: null
       }
       
       this.init = function(settings) {
@@ -0,0 +1,133 @@
+/*
+ * Searches a table using the index baked by the build, rather than
+ * reading the text of every row.
+ *
+ *   var index = $.searchIndex('/api/my-table/search/');
+ *   index.search('smith john', function(rowIds) { ... });
+ *
+ * The callback gets the sorted ids of the rows that have a word starting
+ * with each of the words searched for, counting from zero in the order
+ * the rows were published. It gets null if nothing long enough to search
+ * for was typed.
+ */
+(function($) {
+    // Anything but whitespace and ASCII punctuation, like search.WORD
+    var WORD = /[^\s!-\/:-@\[-`{-~]+/g;
+
+    function shardName(prefix) {
+        var bytes = unescape(encodeURIComponent(prefix)), name = '';
+        for (var i = 0; i < bytes.length; i++) {
+            var hex = bytes.charCodeAt(i).toString(16);
+            name += (hex.length < 2 ? '0' : '') + hex;
+        }
+        return name;
+    }
+
+    function deltaDecode(deltas) {
+        var total = 0, numbers = [];
+        for (var i = 0; i < deltas.length; i++) {
+            total += deltas[i];
+            numbers.push(total);
+        }
+        return numbers;
+    }
+
+    function intersect(a, b) {
+        var out = [], i = 0, j = 0;
+        while (i < a.length && j < b.length) {
+            if (a[i] < b[j]) {
+                i++;
+            } else if (a[i] > b[j]) {
+                j++;
+            } else {
+                out.push(a[i]);
+                i++;
+                j++;
+            }
+        }
+        return out;
+    }
+
+    function SearchIndex(url) {
+        this.url = url;
+        this.manifest = null;
+        this.shards = {};
+    }
+
+    SearchIndex.prototype.load = function(name, callback) {
+        var self = this;
+        if (self.shards[name] !== undefined) {
+            callback(self.shards[name]);
+            return;
+        }
+        $.getJSON(self.url + name + '.json', function(data) {
+            self.shards[name] = data;
+            callback(data);
+        });
+    };
+
+    /* The rows with any word starting with this one */
+    SearchIndex.prototype.match = function(word, callback) {
+        var self = this;
+        var name = shardName(word.substr(0, self.manifest.prefix_length));
+        if ($.inArray(name, self.manifest.shards) === -1) {
+            callback([]);
+            return;
+        }
+        self.load(name, function(shard) {
+            var seen = {}, rows = [];
+            for (var token in shard) {
+                if (shard.hasOwnProperty(token) && token.indexOf(word) === 0) {
+                    var ids = deltaDecode(shard[token]);
+                    for (var i = 0; i < ids.length; i++) {
+                        if (!seen[ids[i]]) {
+                            seen[ids[i]] = true;
+                            rows.push(ids[i]);
+                        }
+                    }
+                }
+            }
+            rows.sort(function(a, b) { return a - b; });
+            callback(rows);
+        });
+    };
+
+    SearchIndex.prototype.search = function(text, callback) {
+        var self = this;
+        if (self.manifest === null) {
+            $.getJSON(self.url + 'index.json', function(data) {
+                self.manifest = data;
+                self.search(text, callback);
+            });
+            return;
+        }
+        var words = $.grep(text.toLowerCase().match(WORD) || [], function(w) {
+            return w.length >= self.manifest.prefix_length;
+        });
+        if (!words.length) {
+            callback(null);
+            return;
+        }
+        var results = [], remaining = words.length;
+        $.each(words, function(i, word) {
+            self.match(word, function(rows) {
+                results[i] = rows;
+                remaining--;
+                if (remaining === 0) {
+                    var rowIds = results[0];
+                    for (var j = 1; j < results.length; j++) {
+                        rowIds = intersect(rowIds, results[j]);
+                    }
+                    callback(rowIds);
+                }
+            });
+        });
+    };
+
+    $.extend({
+        searchIndex: function(url) {
+            return new SearchIndex(url);
+        }
+    });
+
+})(jQuery);
@@ -12,7 +12,15 @@ __author__ = "Chris Amico (eyeseast@gmail.com)"
 
 import csv
 import math
+from itertools import islice
 from formatting import format
+from columnar import ColumnStore
+from facets import FacetView, build_postings
+from selection import Selection
+from predicates import select
+from schema import SORT_TYPES, NUMERIC_TYPES, get_parser
+from aggregates import aggregate, parse_aggregates, AGGREGATES, LABELS
+import sorting
 
 
 class TableFu(object):
@@ -41,21 +49,48 @@ class TableFu(object):
     >>> spreadsheet.columms
     ['Style', 'Author']
 
+    Passing columnar=True keeps the table in a ColumnStore, with one typed
+    array per column, rather than a list of rows. That takes a fraction
+    of the memory on big files, and lets values(), total(), sort() and
+    filter() work on whole columns without building any rows.
+
+    >>> spreadsheet = TableFu(open('../tests/test.csv'), columnar=True)
+    >>> spreadsheet.total('Number of Pages')
+    1177.0
+
+    A schema from schema.load_schema(), passed in as the 'schema' option,
+    tells TableFu what type each column is without reading it first.
+
     """
     def __init__(self, table, **options):
         """
         Takes a table argument and optional keyword arguments.
 
         The 'table' argument should be a two-dimensional array,
-        either a list or tuple, or an open file that can be
+        either a list or tuple, an open file that can be
         parsed by Python's csv module (using csv.reader)
+        or a ColumnStore.
         """
+        self._rows = None
+        self._version = 0
+        self._renderers = None
+        self._facets = {}
         if hasattr(table, 'next'):  # for file-like objects
             reader = csv.reader(table)
-            self.table = [row for row in reader]
+            if options.get('columnar'):
+                table = reader
+            else:
+                table = [row for row in reader]
+        if isinstance(table, ColumnStore):
+            self.table = table
+            self.default_columns = list(table.headers)
+        elif options.get('columnar'):
+            rows = iter(table)
+            self.default_columns = [i.strip() for i in next(rows)]
+            self.table = ColumnStore(self.default_columns, rows)
         else:
             self.table = table
-        self.default_columns = [i.strip() for i in self.table.pop(0)]
+            self.default_columns = [i.strip() for i in self.table.pop(0)]
         self._columns = options.get('columns', [])
         self.deleted_rows = []
         self.faceted_on = None
@@ -66,20 +101,75 @@ class TableFu(object):
         self.sorters = options.get('sorters', {})
         self.tags = options.get('tags', [])
         self.per_page = options.get("per_page", 50)
+        self.paginate_after = options.get("paginate_after", None)
+        self.facet_columns = options.get("facets", [])
+        self.schema = options.get("schema", {})
+        self.summary = options.get("summary", {})
         self.options = options
-        if 'sorted_by' in list(options.keys()):
-            sort_opts = options.get("sorted_by")
-            sort_column, sort_direction = sort_opts[0].items()[0]
-            direction2reverse = {'ascending': False, 'descending': True}
-            sort_reverse = direction2reverse.get(sort_direction, False)
-            self.sort(column_name=sort_column, reverse=sort_reverse)
+        if options.get('sorted_by'):
+            self.sort()
+
+    @classmethod
+    def from_csv(cls, csv_file, chunk_size=1000, **options):
+        """
+        Streams an open CSV file into a new TableFu instance.
+
+        Rows are read chunk_size at a time and only the columns the
+        options call for are kept: those listed in 'columns', plus any
+        named by 'formatting' arguments, 'sorted_by' or 'facets'. The rest are
+        dropped as they're read, so they never take up memory.
+
+        Without a 'columns' option every column is kept.
+        """
+        reader = csv.reader(csv_file)
+        headers = [i.strip() for i in next(reader)]
+        keep = cls._columns_in_use(options)
+        if keep:
+            indexes = [i for i, h in enumerate(headers) if h in keep]
         else:
-            self.sorted_by = None
+            indexes = list(range(len(headers)))
+        selected = [headers[i] for i in indexes]
+        if options.get('columnar'):
+            table = ColumnStore(selected)
+        else:
+            table = [selected]
+        width = max(indexes) + 1 if indexes else 0
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                break
+            for row in chunk:
+                if len(row) < width:
+                    row.extend([''] * (width - len(row)))
+            table.extend([[row[i] for i in indexes] for row in chunk])
+        return cls(table, **options)
+
+    @staticmethod
+    def _columns_in_use(options):
+        """
+        Returns the set of column names a set of options needs to render,
+        or None if every column should be kept.
+        """
+        columns = options.get('columns')
+        if not columns:
+            return None
+        keep = set(columns)
+        for column_name, config in options.get('formatting', {}).items():
+            keep.add(column_name)
+            keep.update(config.get('arguments', []))
+        for column_name, reverse in parse_sort_options(
+                options.get('sorted_by')):
+            keep.add(column_name)
+        keep.update(options.get('facets', []))
+        keep.update(options.get('summary', {}))
+        return keep
 
     def __getitem__(self, row_num):
         """
         Return one row in the table
         """
+        if self._rows is not None:
+            return self._rows[row_num]
         return Row(self.table[row_num], row_num, self)
 
     def __iter__(self):
@@ -88,16 +178,108 @@ class TableFu(object):
     def __len__(self):
         return len(self.table)
 
+    def _get_default_columns(self):
+        return self._default_columns
+
+    def _set_default_columns(self, columns):
+        """
+        Sets the columns found in the source data and rebuilds the
+        map from each column name to its position in a row.
+        """
+        self._default_columns = list(columns)
+        self._column_index = {}
+        for i, name in enumerate(self._default_columns):
+            self._column_index.setdefault(name, i)
+        self._renderers = None
+        self._invalidate()
+
+    default_columns = property(_get_default_columns, _set_default_columns)
+
+    def _get_formatting(self):
+        return self._formatting
+
+    def _set_formatting(self, formatting):
+        self._formatting = formatting
+        self._renderers = None
+
+    formatting = property(_get_formatting, _set_formatting)
+
+    @property
+    def renderers(self):
+        """
+        The formatting options compiled into one callable per column,
+        in the same order as default_columns. Columns without formatting
+        get None.
+
+        Each callable takes a cell's value and its row's list of cells,
+        with the formatting function, its options and the positions of
+        any argument columns all looked up ahead of time.
+        """
+        if self._renderers is None:
+            renderers = [None] * len(self.default_columns)
+            for column_name, config in self.formatting.items():
+                index = self._column_index.get(column_name)
+                func = config.get('method', None)
+                if index is None or not func:
+                    continue
+                arg_indexes = []
+                for arg in config.get('arguments', []):
+                    if arg not in self._column_index:
+                        raise KeyError(
+                            "%s isn't a column in this table" % arg
+                        )
+                    arg_indexes.append(self._column_index[arg])
+                renderers[index] = compile_formatter(
+                    format.get(func),
+                    arg_indexes,
+                    config.get('options', {})
+                )
+            self._renderers = renderers
+        return self._renderers
+
+    def _index(self, column_name):
+        """
+        Returns the position of a column in each row, or raises
+        ValueError if it isn't in the table.
+        """
+        try:
+            return self._column_index[column_name]
+        except KeyError:
+            raise ValueError("%s isn't a column in this table" % column_name)
+
+    @property
+    def columnar(self):
+        return isinstance(self.table, ColumnStore)
+
     def add_rows(self, *rows):
         for row in rows:
             self.table.append(row)
+        self._invalidate()
 
     def count(self):
         return len(self)
 
     @property
     def rows(self):
-        return [Row(row, i, self) for i, row in enumerate(self.table)]
+        """
+        The list of Row objects in the table. It's built on first access
+        and reused until the table is sorted, added to or its columns
+        are changed.
+        """
+        if self._rows is None:
+            self._rows = [
+                Row(row, i, self) for i, row in enumerate(self.table)
+            ]
+        return self._rows
+
+    def _invalidate(self):
+        """
+        Throws out the cached Row and Datum objects after the table changes.
+        """
+        self._rows = None
+        self._version += 1
+        self._facets = {}
+        self.totals = {}
 
     @property
     def headers(self):
@@ -119,41 +301,220 @@ class TableFu(object):
 
     def _set_columns(self, columns):
         self._columns = self.options['columns'] = list(columns)
+        self._invalidate()
 
     columns = property(_get_columns, _set_columns)
 
     def delete_row(self, row_num):
-        self.deleted_rows.append(self.table.rows.pop(row_num))
+        self.deleted_rows.append(self.table.pop(row_num))
+        self._invalidate()
 
-    def sort(self, column_name=None, reverse=False):
+    def sort(self, column_name=None, reverse=False, keys=None):
         """
         Sort rows in this table, preserving a record of how that
         sorting is done in TableFu.options['sorted_by']
+
+        Sort on more than one column by passing a list of
+        (column_name, reverse) pairs as keys, most significant first.
+        With no arguments the table is sorted by options['sorted_by'].
+
+        Each column is compared according to its type, declared with the
+        'sorters' option or inferred from its values, so numbers sort by
+        value and dates by time.
         """
-        if not column_name and 'sorted_by' in list(self.options.keys()):
-            column_name = self.options['sorted_by'].keys()[0]
-        if column_name not in self.default_columns:
-            raise ValueError("%s isn't a column in this table" % column_name)
-        index = self.default_columns.index(column_name)
-        self.table.sort(key=lambda row: row[index], reverse=reverse)
-        self.options['sorted_by'] = {column_name: {'reverse': reverse}}
+        if column_name:
+            keys = [(column_name, reverse)]
+        elif keys is None:
+            keys = parse_sort_options(self.options.get('sorted_by'))
+        decoded = [(self.sort_keys(name), rev) for name, rev in keys]
+        order = sorting.sort_order(len(self.table), decoded)
+        if self.columnar:
+            self.table.reorder(order)
+        else:
+            self.table[:] = [self.table[i] for i in order]
+        self.options['sorted_by'] = [
+            {name: 'descending' if rev else 'ascending'} for name, rev in keys
+        ]
+        self._invalidate()
+
+    def column_type(self, column_name):
+        """
+        Returns whether a column holds numbers, dates or strings.
+
+        A type declared with the 'sorters' option wins, followed by the
+        one in the schema. Otherwise it's inferred from the column's values.
+        """
+        sorter = self.sorters.get(column_name)
+        if sorter in sorting.SORTER_TYPES:
+            return sorting.SORTER_TYPES[sorter]
+        index = self._index(column_name)
+        if self.columnar and self.table.is_numeric(index):
+            return sorting.NUMBER
+        if column_name in self.schema:
+            return SORT_TYPES[self.schema[column_name]['type']]
+        return sorting.infer_type(self.values(column_name))
+
+    def sort_keys(self, column_name):
+        """
+        Returns a column decoded into a list of sort keys, one per row.
+        """
+        index = self._index(column_name)
+        if self.columnar and self.table.is_numeric(index):
+            return self.table.number_keys(index)
+        kind = self.column_type(column_name)
+        return sorting.sort_keys(self.values(column_name), kind)
 
     def values(self, column_name):
-        if column_name not in self.default_columns:
-            raise ValueError("%s isn't a column in this table" % column_name)
-        index = self.default_columns.index(column_name)
+        index = self._index(column_name)
+        if self.columnar:
+            return self.table.values(index)
         return [row[index] for row in self.table]
 
+    def formatted_values(self, column_name):
+        """
+        Returns every value in a column with its formatting applied.
+
+        Columns whose formatting doesn't draw on other columns are handed
+        to the formatter as one list, so formatters with a batch version
+        can work through the whole column in a single pass. If the schema
+        says the column repeats itself, each value is only formatted once.
+        """
+        index = self._index(column_name)
+        values = [
+            unicode(v, 'utf-8') if isinstance(v, str) else v
+            for v in self.values(column_name)
+        ]
+        render = self.renderers[index]
+        if render is None:
+            return values
+        config = self.formatting[column_name]
+        if config.get('arguments'):
+            return [render(v, row) for v, row in zip(values, self.table)]
+        stats = self.schema.get(column_name)
+        if stats and stats['distinct'] * 2 <= len(values):
+            many = format.many_distinct
+        else:
+            many = format.many
+        return many(
+            values,
+            config['method'],
+            **config.get('options', {})
+        )
+
     def total(self, column_name):
-        if column_name not in self.default_columns:
-            raise ValueError("%s isn't a column in this table" % column_name)
+        """
+        Adds up the numbers in a column. The result is kept until the
+        table changes.
+
+        If the schema says the column is numeric, blank cells are skipped
+        and numbers are read however they're written, like '$1,200'.
+        """
+        if column_name not in self.totals:
+            self.totals[column_name] = self.sum_rows(column_name)
+        return self.totals[column_name]
+
+    def sum_rows(self, column_name, row_ids=None):
+        """
+        Adds up the numbers in a column, or only those in the rows at the
+        positions in row_ids, the way total() does.
+        """
+        stats = self.schema.get(column_name)
         try:
-            values = [float(v) for v in self.values(column_name)]
+            if stats and stats['type'] in NUMERIC_TYPES and \
+                    self.column_type(column_name) == sorting.NUMBER:
+                keys = self.sort_keys(column_name)
+                values = self.values(column_name)
+                if row_ids is None:
+                    row_ids = xrange(len(keys))
+                total = 0.0
+                for i in row_ids:
+                    key = keys[i]
+                    if key == sorting.MISSING:
+                        if values[i].strip():
+                            raise ValueError(values[i])
+                        continue
+                    total += key
+                return total
+            if self.columnar and row_ids is None:
+                return self.table.total(self._index(column_name))
+            values = self.values(column_name)
+            if row_ids is not None:
+                values = [values[i] for i in row_ids]
+            return sum(float(v) for v in values)
         except ValueError:
             raise ValueError(
                 'Column %s contains non-numeric values' % column_name
             )
-        return sum(values)
+
+    def aggregate(self, aggregates, group_by=None):
+        """
+        Summarises columns in a single pass down the table.
+
+        Takes a dictionary mapping column names to one or a list of
+        'sum', 'mean', 'min', 'max', 'count' and 'count_distinct', and
+        returns a dictionary mapping the same names to their figures.
+
+        >>> spreadsheet.aggregate({'Number of Pages': ['sum', 'max']})
+        {'Number of Pages': {'sum': 1177.0, 'max': 644.0}}
+
+        Pass a list of columns as group_by to get a list of (group, figures)
+        pairs instead, one for each distinct combination of their values.
+        """
+        return aggregate(self, aggregates, group_by or ())
+
+    @property
+    def summary_rows(self):
+        """
+        The rows of the table's footer, worked out from the 'summary'
+        option. There's one for each function it calls for, with a label
+        and a formatted cell for each column on display.
+        """
+        if not self.summary:
+            return []
+        figures = self.aggregate(self.summary)
+        used = set()
+        for column_name, funcs in parse_aggregates(self.summary):
+            used.update(funcs)
+        rows = []
+        for func in AGGREGATES:
+            if func not in used:
+                continue
+            cells = []
+            for column_name in self.columns:
+                if func in figures.get(column_name, {}):
+                    cells.append(self.format_figure(
+                        column_name, func, figures[column_name][func]
+                    ))
+                else:
+                    cells.append(u'')
+            label = LABELS[func]
+            if cells and cells[0]:
+                cells[0] = u'%s: %s' % (label, cells[0])
+            elif cells:
+                cells[0] = label
+            rows.append({'label': label, 'cells': cells})
+        return rows
+
+    def format_figure(self, column_name, func, value):
+        """
+        Formats a figure from aggregate() like the rest of its column.
+        Counts are always shown as whole numbers.
+        """
+        if value is None:
+            return u''
+        if func in ('count', 'count_distinct'):
+            return format(value, 'intcomma')
+        if isinstance(value, float):
+            if value.is_integer():
+                value = '%d' % value
+            else:
+                value = '%.2f' % value
+        if isinstance(value, str):
+            value = unicode(value, 'utf-8')
+        config = self.formatting.get(column_name, {})
+        if not config.get('method') or config.get('arguments'):
+            return value
+        return format(value, config['method'], **config.get('options', {}))
 
     def html(self):
         table = '<table>\n%s\n%s\n</table>'
@@ -172,45 +533,96 @@ class TableFu(object):
          - Pass in a function and return rows where that function
            evaluates to True
 
-        In either case, a new TableFu instance is returned
+        A filter expression, as taken by where(), can be passed in place
+        of the function.
+
+        In either case, a new TableFu instance is returned. The matching
+        rows are found in one pass and copied once, in their current order.
         """
         if callable(func):
-            result = filter(func, self)
-            result.insert(0, self.default_columns)
-            return TableFu(result, **self.options)
+            row_ids = [i for i, row in enumerate(self.rows) if func(row)]
+            if query:
+                row_ids = select(self, query, row_ids)
         else:
-            result = self
-            for column, value in query.items():
-                result = result.filter(lambda r: r[column] == value)
-            return result
+            row_ids = select(self, dict(func or {}, **query))
+        return self.take(row_ids)
+
+    def where(self, expression=None, **query):
+        """
+        Returns a Selection of the rows matching a filter expression and
+        any keyword arguments, which match values exactly.
+
+        >>> spreadsheet.where({'Number of Pages': {'gt': 200}}, Style='Satire')
+        <Selection: 1 rows>
+
+        Expressions can match values exactly, in a list, against a regular
+        expression or within a range, and be combined with '$and' and '$or'.
+        See predicates.py for how they're written. Nothing is copied, and
+        the rows aren't looked for until the selection is first used.
+        """
+        return Selection(self, expression=dict(expression or {}, **query))
+
+    def take(self, row_ids):
+        """
+        Copies the rows at a list of positions into a new TableFu instance
+        with the same options. The rows are kept in the order given rather
+        than sorted again.
+        """
+        if self.columnar:
+            table = self.table.take(row_ids)
+        else:
+            table = [list(self.default_columns)]
+            table.extend(list(self.table[i]) for i in row_ids)
+        options = dict(self.options)
+        sorted_by = options.pop('sorted_by', None)
+        copy = TableFu(table, **options)
+        if sorted_by:
+            copy.options['sorted_by'] = sorted_by
+        return copy
+
+    def facet_index(self, column_name):
+        """
+        Returns a dictionary mapping each value in a column to an array of
+        the positions of its rows. It's built in one pass down the column
+        and kept until the table changes.
+        """
+        if column_name not in self._facets:
+            self._facets[column_name] = build_postings(
+                self.values(column_name)
+            )
+        return self._facets[column_name]
+
+    def facet_counts(self, column_name):
+        """
+        Returns a list of (value, number of rows) pairs for a column,
+        sorted by value.
+        """
+        return sorted(
+            (value, len(rows))
+            for value, rows in self.facet_index(column_name).items()
+        )
 
     def facet_by(self, column):
         """
-        Faceting creates new TableFu instances with rows matching
-        each possible value.
+        Faceting returns a FacetView of the rows matching each possible
+        value, sorted by value.
+
+        Views are selections that read their rows from this table rather
+        than copying them.
+        Call to_table() on a view to get a TableFu instance of its own.
         """
-        faceted_spreadsheets = {}
-        for row in self.rows:
-            if row[column]:
-                col = row[column].value
-                if col in list(faceted_spreadsheets.keys()):
-                    faceted_spreadsheets[col].append(row.cells)
-                else:
-                    faceted_spreadsheets[col] = []
-                    faceted_spreadsheets[col].append(row.cells)
-
-        # create a new TableFu instance for each facet
-        tables = []
-        for k, v in faceted_spreadsheets.items():
-            v.insert(0, self.default_columns)
-            table = TableFu(v)
-            table.faceted_on = k
-            table.formatting = self.formatting
-            table.options = self.options
-            tables.append(table)
-
-        tables.sort(key=lambda t: t.faceted_on)
-        return tables
+        postings = self.facet_index(column)
+        return [
+            FacetView(self, column, value, postings[value])
+            for value in sorted(postings)
+        ]
+
+    def facet_by_value(self, column, value):
+        """
+        Returns a FacetView of the rows with one value in a column, or
+        raises KeyError if there aren't any.
+        """
+        return FacetView(self, column, value, self.facet_index(column)[value])
 
     def sorted_by(self):
         """
@@ -230,27 +642,37 @@ class TableFu(object):
         Source:
             http://tablesorter.com/docs/
         """
-        # If it's not sorted, don't worry.
-        if 'sorted_by' not in list(self.options.keys()):
-            return None
-        # Otherwise, get the index of the column
-        column_name = self.options.get('sorted_by').keys()[0]
-        column_index = self.columns.index(column_name)
-        # And the sort order
-        descending = self.options.get("sorted_by").values()[0].get("reverse")
-        if descending:
-            sort_direction = 1
-        else:
-            sort_direction = 0
-        # Then nest that in a list to the tablesorter standard
-        return [[column_index, sort_direction]]
+        sort_list = []
+        keys = parse_sort_options(self.options.get('sorted_by'))
+        for column_name, descending in keys:
+            # Columns that aren't on display can't be handed to tablesorter
+            if column_name not in self.columns:
+                continue
+            column_index = self.columns.index(column_name)
+            if descending:
+                sort_direction = 1
+            else:
+                sort_direction = 0
+            sort_list.append([column_index, sort_direction])
+        return sort_list
 
     def get_sorter_config(self):
         """
         Prepare the parser config for usage in tablesorter's initilization.
+
+        Columns without a sorter declared in the options get the parser
+        their type in the schema calls for, as long as their formatting
+        leaves them readable by it.
         """
         col_list = self.columns
         js_dict = {}
+        for i, column_name in enumerate(col_list):
+            if column_name not in self.schema:
+                continue
+            method = self.formatting.get(column_name, {}).get('method')
+            parser = get_parser(self.schema[column_name], method)
+            if parser:
+                js_dict[i] = parser
         for key, value in self.sorters.items():
             js_dict[col_list.index(key)] = value
         return js_dict
@@ -262,15 +684,46 @@ class TableFu(object):
         The number of pages the table will be broken into according to the
         `per_page` setting.
         """
-        row_count = len(self.rows)
+        row_count = len(self.table)
         return int(math.ceil(row_count / float(self.per_page)))
 
+    @property
+    def paginated(self):
+        """
+        Whether the table is long enough to be published a page at a time
+        according to the `paginate_after` setting.
+        """
+        if self.paginate_after is None:
+            return False
+        return len(self.table) > self.paginate_after
+
+    def page(self, number):
+        """
+        Returns the rows on one page of the table, counting from one.
+        Only that page's rows are built, unless they all have been.
+        """
+        start = (number - 1) * self.per_page
+        if self._rows is not None:
+            return self._rows[start:start + self.per_page]
+        positions = slice(start, start + self.per_page).indices(len(self))
+        return [Row(self.table[i], i, self) for i in range(*positions)]
+
+    @property
+    def page_rows(self):
+        """
+        The rows to write into the HTML table: only the first page if the
+        table is paginated, and otherwise all of them.
+        """
+        if self.paginated:
+            return self.page(1)
+        return self.rows
+
     @property
     def page_size_list(self):
         """
         Returns a list of page total choices for the jQuery table.
         """
-        row_count = len(self.rows)
+        row_count = len(self.table)
         page_size_list = []
         for i in range(1, 5):
             page_size = i * self.per_page
@@ -292,6 +745,19 @@ class Row(object):
         self.table = table
         self.row_num = row_num
         self.cells = list(cells)
+        self._datums = {}
+        self._data = None
+        self._version = table._version
+
+    def _check_version(self):
+        """
+        Drops cached Datum objects if the table has changed since
+        they were made.
+        """
+        if self._version != self.table._version:
+            self._datums = {}
+            self._data = None
+            self._version = self.table._version
 
     def __eq__(self, other):
         if not type(other) == type(self):
@@ -310,15 +776,23 @@ class Row(object):
         """
         Return the Datum for column_name, or default.
         """
-        if column_name in self.table.default_columns:
-            index = self.table.default_columns.index(column_name)
-            return Datum(
-                self.cells[index],
-                self.row_num,
-                column_name,
-                self.table
-            )
-        return default
+        self._check_version()
+        try:
+            return self._datums[column_name]
+        except KeyError:
+            pass
+        index = self.table._column_index.get(column_name)
+        if index is None:
+            return default
+        datum = self._datums[column_name] = Datum(
+            self.cells[index],
+            self.row_num,
+            column_name,
+            self.table,
+            col_num=index,
+            cells=self.cells
+        )
+        return datum
 
     def keys(self):
         return self.table.columns
@@ -342,12 +816,22 @@ class Row(object):
 
     def __setitem__(self, column_name, value):
         """
-        Set the value for a given cell
+        Set the value for a given cell, in both this row and its table
         """
-        if column_name not in self.table.default_columns:
+        index = self.table._column_index.get(column_name)
+        if index is None:
             raise KeyError("%s isn't a column in this table" % column_name)
-        index = self.table.default_columns.index(column_name)
         self.cells[index] = value
+        self.table._facets.pop(column_name, None)
+        self.table.totals.pop(column_name, None)
+        # Selections of the table may no longer hold
+        self.table._version += 1
+        if self.table.columnar:
+            self.table.table.set_cell(self.row_num, index, value)
+        else:
+            self.table.table[self.row_num][index] = value
+        self._datums.pop(column_name, None)
+        self._data = None
 
     def __iter__(self):
         """
@@ -375,19 +859,37 @@ class Row(object):
 
     @property
     def data(self):
-        print [self[col] for col in self.table.columns]
-        return [self[col] for col in self.table.columns]
+        self._check_version()
+        if self._data is None:
+            self._data = [self[col] for col in self.table.columns]
+        return self._data
 
 
 class Datum(object):
     """
     A piece of data, with a table, row and column
+
+    Rows pass in the column's position and the row's cells so rendering
+    doesn't have to look them up again.
     """
-    def __init__(self, value, row_num, column_name, table):
+    def __init__(
+            self, value, row_num, column_name, table,
+            col_num=None, cells=None
+            ):
         self.value = value
         self.row_num = row_num
         self.column_name = column_name
         self.table = table
+        if col_num is None:
+            col_num = table._column_index.get(column_name)
+        self.col_num = col_num
+        self._cells = cells
+
+    def _get_cells(self):
+        if self._cells is None:
+            self._cells = self.table[self.row_num].cells
+        return self._cells
+    cells = property(_get_cells)
 
     def __repr__(self):
         return "<%s: %s>" % (self.column_name, self.value)
@@ -406,16 +908,12 @@ class Datum(object):
             if not isinstance(self.value, unicode):
                 value = unicode(self.value, 'utf-8')
         # Apply any formatting
-        if self.table.formatting.has_key(self.column_name):
-            func = self.table.formatting[self.column_name].get('method', None)
-            args = self.table.formatting[self.column_name].get('arguments', [])
-            kwargs = self.table.formatting[self.column_name].get('options', {})
-            if func:
-                row = self.table[self.row_num]
-                args = [row[arg].value for arg in args]
-                return format(value, func, *args, **kwargs)
-        else:
+        if self.col_num is None:
             return value
+        render = self.table.renderers[self.col_num]
+        if render is None:
+            return value
+        return render(value, self.cells)
 
     def __eq__(self, other):
         if type(other) == type(self):
@@ -496,6 +994,51 @@ class Header(object):
         )
 
 
+def parse_sort_options(sort_opts):
+    """
+    Converts the 'sorted_by' option into a list of (column_name, reverse)
+    pairs.
+
+    The option is a list with one single-item dictionary per column,
+    mapping its name to 'ascending' or 'descending', as in the YAML
+    configuration. A direction can also be given as {'reverse': True}.
+    """
+    if not sort_opts:
+        return []
+    if isinstance(sort_opts, dict):
+        sort_opts = [dict([item]) for item in sort_opts.items()]
+    keys = []
+    for sort_opt in sort_opts:
+        for column_name, direction in sort_opt.items():
+            if isinstance(direction, dict):
+                reverse = bool(direction.get('reverse', False))
+            else:
+                reverse = direction == 'descending'
+            keys.append((column_name, reverse))
+    return keys
+
+
+def compile_formatter(func, arg_indexes, kwargs):
+    """
+    Binds a formatting function to its options and the positions of the
+    columns it takes as arguments.
+
+    Returns a callable that takes a value and the list of cells in its
+    row and returns the formatted value.
+    """
+    if arg_indexes:
+        def render(value, cells):
+            args = [cells[i] for i in arg_indexes]
+            return func(value, *args, **kwargs)
+    elif kwargs:
+        def render(value, cells):
+            return func(value, **kwargs)
+    else:
+        def render(value, cells):
+            return func(value)
+    return render
+
+
 def odd_even(num):
     if num % 2 == 0:
         return "even"
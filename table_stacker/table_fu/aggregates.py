@@ -0,0 +1,163 @@
+"""
+Aggregation for TableFu.
+
+Totals, averages and counts are worked out in one pass down the table.
+Each column being summarised is first decoded into sort keys, the same
+way it is for sorting, so numbers are read once however they're written.
+Then every row adds its keys to the running figures for its group.
+
+Blank cells, and cells that can't be read as the column's type, are left
+out of every figure.
+"""
+import sorting
+
+AGGREGATES = ('sum', 'mean', 'min', 'max', 'count', 'count_distinct')
+
+# The functions that only make sense for a column of numbers
+NUMERIC_AGGREGATES = ('sum', 'mean')
+
+# How each function is labelled in a table's footer
+LABELS = {
+    'sum': 'Total',
+    'mean': 'Average',
+    'min': 'Lowest',
+    'max': 'Highest',
+    'count': 'Count',
+    'count_distinct': 'Distinct',
+}
+
+
+class Accumulator(object):
+    """
+    The running figures for one column in one group.
+
+    The smallest and largest values are kept as row positions, so they
+    can be read back as they were written.
+    """
+    __slots__ = ('count', 'total', 'low', 'high', 'low_row', 'high_row',
+                 'seen')
+
+    def __init__(self, numeric, distinct):
+        self.count = 0
+        self.total = 0.0 if numeric else None
+        self.low = self.high = None
+        self.low_row = self.high_row = None
+        self.seen = set() if distinct else None
+
+    def add(self, key, row):
+        if self.count == 0 or key < self.low:
+            self.low, self.low_row = key, row
+        if self.count == 0 or key > self.high:
+            self.high, self.high_row = key, row
+        self.count += 1
+        if self.total is not None:
+            self.total += key
+        if self.seen is not None:
+            self.seen.add(key)
+
+
+def parse_aggregates(aggregates):
+    """
+    Converts a dictionary mapping column names to a function, or a list
+    of them, into a list of (column_name, functions) pairs.
+    """
+    parsed = []
+    for column_name, funcs in sorted(aggregates.items()):
+        if isinstance(funcs, basestring):
+            funcs = [funcs]
+        for func in funcs:
+            if func not in AGGREGATES:
+                raise ValueError("%s isn't an aggregate function" % func)
+        parsed.append((column_name, list(funcs)))
+    return parsed
+
+
+def aggregate(table, aggregates, group_by=()):
+    """
+    Summarises the columns of a TableFu table.
+
+    The aggregates argument maps column names to one or a list of the
+    functions in AGGREGATES. The result maps each of those columns to a
+    dictionary of the figures asked for.
+
+    With a list of columns to group_by, a list of (group, result) pairs is
+    returned instead, one per group, where group is the tuple of values
+    its rows share. They're sorted by group.
+    """
+    specs = []
+    for column_name, funcs in parse_aggregates(aggregates):
+        kind = table.column_type(column_name)
+        if kind != sorting.NUMBER and set(funcs) & set(NUMERIC_AGGREGATES):
+            raise ValueError(
+                'Column %s contains non-numeric values' % column_name
+            )
+        if kind == sorting.NUMBER:
+            values = None
+        else:
+            values = table.values(column_name)
+        specs.append((
+            column_name,
+            funcs,
+            table.sort_keys(column_name),
+            values,
+            'count_distinct' in funcs,
+        ))
+    group_columns = [table.values(column_name) for column_name in group_by]
+
+    def new_group():
+        return [
+            Accumulator(values is None, distinct)
+            for name, funcs, keys, values, distinct in specs
+        ]
+
+    groups = {}
+    if not group_columns:
+        groups[()] = new_group()
+    for i in xrange(len(table)):
+        group = tuple([column[i] for column in group_columns])
+        try:
+            accumulators = groups[group]
+        except KeyError:
+            accumulators = groups[group] = new_group()
+        for acc, spec in zip(accumulators, specs):
+            key = spec[2][i]
+            if key == sorting.MISSING:
+                continue
+            if spec[3] is not None and not spec[3][i].strip():
+                continue
+            acc.add(key, i)
+
+    results = []
+    for group in sorted(groups):
+        result = {}
+        for acc, spec in zip(groups[group], specs):
+            result[spec[0]] = summarise(acc, spec[1], spec[3])
+        results.append((group, result))
+    if not group_columns:
+        return results[0][1]
+    return results
+
+
+def summarise(acc, funcs, values):
+    """
+    Reads the figures for a list of functions off an Accumulator.
+    """
+    summary = {}
+    for func in funcs:
+        if func == 'sum':
+            summary[func] = acc.total
+        elif func == 'mean':
+            summary[func] = acc.total / acc.count if acc.count else None
+        elif func == 'count':
+            summary[func] = acc.count
+        elif func == 'count_distinct':
+            summary[func] = len(acc.seen)
+        else:
+            row = acc.low_row if func == 'min' else acc.high_row
+            if row is None:
+                summary[func] = None
+            elif values is None:
+                summary[func] = acc.low if func == 'min' else acc.high
+            else:
+                summary[func] = values[row]
+    return summary
@@ -0,0 +1,244 @@
+"""
+A column-oriented storage backend for TableFu.
+
+Instead of a list of rows, each holding a list of strings, ColumnStore
+keeps one container per column. Columns whose every cell is a plain number
+are parsed once into an array('d'). Everything else is kept as a list of
+interned strings, so the handful of distinct values that repeat down a
+column are only stored once.
+
+The store still answers to the handful of list methods TableFu relies on
+-- len(), indexing, append and sort -- so Row and Datum objects can be
+built from it on demand.
+"""
+from array import array
+
+BLANK = float('nan')
+NEGATIVE_INFINITY = float('-inf')
+
+
+def _format_number(f):
+    """
+    Returns the string a number parsed out of a CSV cell came from.
+    """
+    if f != f:
+        return ''
+    if f.is_integer():
+        return '%d' % f
+    return repr(f)
+
+
+def _parse_number(value):
+    """
+    Returns the float for a cell, or None if the cell can't be kept in a
+    numeric column without changing how it reads when it comes back out.
+    """
+    if value == '':
+        return BLANK
+    try:
+        f = float(value)
+    except (TypeError, ValueError):
+        return None
+    if _format_number(f) != value:
+        return None
+    return f
+
+
+def _intern(value):
+    if type(value) is str:
+        return intern(value)
+    return value
+
+
+class ColumnStore(object):
+    """
+    A table kept as one typed array per column.
+
+    Usage:
+
+    >>> store = ColumnStore(['Author', 'Pages'])
+    >>> store.append(['James Joyce', '644'])
+    >>> store.append(['Samuel Beckett', '120'])
+    >>> store.is_numeric(1)
+    True
+    >>> store[0]
+    ['James Joyce', '644']
+    >>> store.total(1)
+    764.0
+    """
+    def __init__(self, headers, rows=()):
+        self.headers = list(headers)
+        self.columns = [array('d') for h in self.headers]
+        self._length = 0
+        self.extend(rows)
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        """
+        Returns one row as a list of strings.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("row index out of range")
+        return [
+            _format_number(column[index])
+            if type(column) is array else column[index]
+            for column in self.columns
+        ]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def append(self, row):
+        """
+        Adds a row to the bottom of the table.
+
+        Short rows are padded out with empty cells. Cells beyond the
+        headers are dropped since no column can reach them.
+        """
+        width = len(self.headers)
+        row = list(row[:width])
+        if len(row) < width:
+            row.extend([''] * (width - len(row)))
+        for i, value in enumerate(row):
+            column = self.columns[i]
+            if type(column) is array:
+                f = _parse_number(value)
+                if f is not None:
+                    column.append(f)
+                    continue
+                column = self._demote(i)
+            column.append(_intern(value))
+        self._length += 1
+
+    def set_cell(self, row_index, column_index, value):
+        """
+        Replaces the value of a single cell.
+        """
+        column = self.columns[column_index]
+        if type(column) is array:
+            f = _parse_number(value)
+            if f is not None:
+                column[row_index] = f
+                return
+            column = self._demote(column_index)
+        column[row_index] = _intern(value)
+
+    def pop(self, index=-1):
+        """
+        Removes a row and returns it as a list of strings.
+        """
+        row = self[index]
+        if index < 0:
+            index += len(self)
+        for column in self.columns:
+            column.pop(index)
+        self._length -= 1
+        return row
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(row)
+
+    def _demote(self, index):
+        """
+        Converts a numeric column to strings once a cell turns up
+        that isn't a number.
+        """
+        column = [_intern(_format_number(f)) for f in self.columns[index]]
+        self.columns[index] = column
+        return column
+
+    def is_numeric(self, index):
+        """
+        Returns True if the column at index is stored as numbers.
+        """
+        return type(self.columns[index]) is array
+
+    def values(self, index):
+        """
+        Returns every cell in a column as a list of strings.
+        """
+        column = self.columns[index]
+        if type(column) is array:
+            return [_format_number(f) for f in column]
+        return list(column)
+
+    def total(self, index):
+        """
+        Sums a column in a single pass, raising ValueError if it
+        contains something that isn't a number.
+        """
+        column = self.columns[index]
+        if type(column) is not array:
+            raise ValueError("Column contains non-numeric values")
+        total = sum(column)
+        if total != total:
+            raise ValueError("Column contains empty values")
+        return total
+
+    def find(self, index, value):
+        """
+        Returns the positions of the rows where the column equals value.
+        """
+        column = self.columns[index]
+        if type(column) is array:
+            target = _parse_number(value)
+            if target is None:
+                return []
+            if target != target:
+                return [i for i, f in enumerate(column) if f != f]
+            return [i for i, f in enumerate(column) if f == target]
+        return [i for i, v in enumerate(column) if v == value]
+
+    def number_keys(self, index):
+        """
+        Returns a numeric column as sort keys, with blank cells
+        ahead of every number.
+        """
+        return array('d', [
+            f if f == f else NEGATIVE_INFINITY for f in self.columns[index]
+        ])
+
+    def sort(self, key=None, reverse=False):
+        """
+        Sorts the rows in place like list.sort. Passing a key means
+        rebuilding each row once to hand it over, so TableFu works out
+        the order itself and calls reorder.
+        """
+        if key is None:
+            key = list
+        order = list(range(len(self)))
+        order.sort(key=lambda i: key(self[i]), reverse=reverse)
+        self.reorder(order)
+
+    def take(self, indexes):
+        """
+        Returns a new ColumnStore with only the rows at the provided
+        positions, in that order.
+        """
+        store = ColumnStore(self.headers)
+        store.columns = self._select(indexes)
+        store._length = len(indexes)
+        return store
+
+    def reorder(self, order):
+        """
+        Rearranges the rows in place to match a list of positions.
+        """
+        self.columns = self._select(order)
+
+    def _select(self, indexes):
+        selected = []
+        for column in self.columns:
+            if type(column) is array:
+                selected.append(array('d', [column[i] for i in indexes]))
+            else:
+                selected.append([column[i] for i in indexes])
+        return selected
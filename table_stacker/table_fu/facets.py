@@ -0,0 +1,50 @@
+"""
+Faceting for TableFu.
+
+A facet is the set of rows sharing one value in a column. Rather than
+copying those rows into a new table, TableFu makes one pass down the
+column to build a posting list of row positions for each value, and hands
+back FacetView selections that read their rows straight out of the parent.
+"""
+from array import array
+from selection import Selection
+
+
+def build_postings(values):
+    """
+    Returns a dictionary mapping each value in a column to an array of
+    the positions of the rows it appears in, in order.
+    """
+    postings = {}
+    for i, value in enumerate(values):
+        try:
+            postings[value].append(i)
+        except KeyError:
+            postings[value] = array('l', [i])
+    return postings
+
+
+class FacetView(Selection):
+    """
+    The rows of a TableFu table that share one value in a column.
+
+    Like any Selection, a view reads its rows out of the parent table.
+    Call to_table() for a standalone copy that can be changed.
+    """
+    def __init__(self, parent, column_name, value, row_ids):
+        super(FacetView, self).__init__(parent, row_ids)
+        self.faceted_on = value
+        self.facet_column = column_name
+
+    def __repr__(self):
+        return "<FacetView: %s=%s (%s rows)>" % (
+            self.facet_column, self.faceted_on, len(self)
+        )
+
+    def to_table(self):
+        """
+        Copies the rows into a new TableFu instance.
+        """
+        copy = super(FacetView, self).to_table()
+        copy.faceted_on = self.faceted_on
+        return copy
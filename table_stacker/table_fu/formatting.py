@@ -10,6 +10,10 @@ from toolbox.dateutil.parser import parse as dateparse
 from django.template.defaultfilters import date as dateformater
 from django.template.defaultfilters import capfirst as djcapfirst
 
+LEADING_DIGITS = re.compile(r"^(-?)(\d+)")
+TITLE_APOSTROPHE = re.compile(r"([a-z])'([A-Z])")
+TITLE_DIGIT = re.compile(r"\d([A-Z])")
+
 
 def _saferound(value, decimal_places):
     """
@@ -23,6 +27,16 @@ def _saferound(value, decimal_places):
     return format % f
 
 
+def _group_digits(digits):
+    """
+    Puts a comma between every three digits, counting from the right.
+    """
+    head = len(digits) % 3 or 3
+    groups = [digits[:head]]
+    groups.extend([digits[i:i + 3] for i in range(head, len(digits), 3)])
+    return ','.join(groups)
+
+
 def ap_state(value):
     """
     Converts a state's name or postal abbreviation to .A.P. style.
@@ -140,6 +154,26 @@ def dollars(value, decimal_places=2):
     return format % intcomma(safevalue)
 
 
+def dollars_many(values, decimal_places=2):
+    """
+    Formats a list of values with dollars, parsing each number only once.
+    """
+    pattern = '%%.%df' % decimal_places
+    formatted = []
+    append = formatted.append
+    for value in values:
+        try:
+            f = float(value or 0)
+        except (TypeError, ValueError):
+            append(dollars(value, decimal_places))
+            continue
+        if f < 0:
+            append(u'($%s)' % intcomma((pattern % f).replace("-", "")))
+        else:
+            append(u'$%s' % intcomma(pattern % f))
+    return formatted
+
+
 def email_address(title, address):
     """
     Wrap the email address in mailto: tag, if the link exists.
@@ -158,11 +192,29 @@ def intcomma(value):
     For example, 3000 becomes '3,000' and 45000 becomes '45,000'.
     """
     orig = str(value)
-    new = re.sub("^(-?\d+)(\d{3})", '\g<1>,\g<2>', orig)
-    if orig == new:
-        return new
-    else:
-        return intcomma(new)
+    match = LEADING_DIGITS.match(orig)
+    if not match:
+        return orig
+    sign, digits = match.groups()
+    return sign + _group_digits(digits) + orig[match.end():]
+
+
+def intcomma_many(values):
+    """
+    Formats a list of values with intcomma.
+    """
+    match = LEADING_DIGITS.match
+    formatted = []
+    append = formatted.append
+    for value in values:
+        orig = str(value)
+        m = match(orig)
+        if m:
+            sign, digits = m.groups()
+            append(sign + _group_digits(digits) + orig[m.end():])
+        else:
+            append(orig)
+    return formatted
 
 
 def image(value, width='', height=''):
@@ -205,6 +257,24 @@ def percentage(value, decimal_places=1, multiply=True):
     return _saferound(value, decimal_places) + '%'
 
 
+def percentage_many(values, decimal_places=1, multiply=True):
+    """
+    Formats a list of values with percentage, parsing each number only once.
+    """
+    pattern = '%%.%df%%%%' % decimal_places
+    factor = 100 if multiply else 1
+    formatted = []
+    append = formatted.append
+    for value in values:
+        try:
+            f = float(value)
+        except (TypeError, ValueError):
+            append(percentage(value, decimal_places, multiply))
+            continue
+        append(pattern % (f * factor))
+    return formatted
+
+
 def percent_change(value, decimal_places=1, multiply=True):
     """
     Converts a floating point value into a percentage change value.
@@ -230,6 +300,31 @@ def percent_change(value, decimal_places=1, multiply=True):
         return s + '%'
 
 
+def percent_change_many(values, decimal_places=1, multiply=True):
+    """
+    Formats a list of values with percent_change, parsing each number
+    only once.
+    """
+    pattern = '%%.%df%%%%' % decimal_places
+    factor = 100 if multiply else 1
+    formatted = []
+    append = formatted.append
+    for value in values:
+        try:
+            f = float(value) * factor
+        except ValueError:
+            append('N/A')
+            continue
+        except TypeError:
+            append(percent_change(value, decimal_places, multiply))
+            continue
+        if f > 0:
+            append('+' + pattern % f)
+        else:
+            append(pattern % f)
+    return formatted
+
+
 def short_ap_date(value, date_format=None):
     """
     Reformats a date string as in an abbreviated AP format.
@@ -310,8 +405,26 @@ def title(value):
     Converts a string into titlecase. Lifted from Django.
     """
     value = value.lower()
-    t = re.sub("([a-z])'([A-Z])", lambda m: m.group(0).lower(), value.title())
-    return re.sub("\d([A-Z])", lambda m: m.group(0).lower(), t)
+    t = TITLE_APOSTROPHE.sub(_lower_match, value.title())
+    return TITLE_DIGIT.sub(_lower_match, t)
+
+
+def title_many(values):
+    """
+    Formats a list of values with title.
+    """
+    apostrophe = TITLE_APOSTROPHE.sub
+    digit = TITLE_DIGIT.sub
+    formatted = []
+    append = formatted.append
+    for value in values:
+        t = apostrophe(_lower_match, value.lower().title())
+        append(digit(_lower_match, t))
+    return formatted
+
+
+def _lower_match(match):
+    return match.group(0).lower()
 
 
 def tribubble(
@@ -386,6 +499,108 @@ DEFAULT_FORMATTERS = {
     'vote': vote,
 }
 
+# Formatters whose output depends only on their input. Formatter caches
+# their recent results, since the same few values tend to repeat down a column.
+PURE_FORMATTERS = (
+    'ap_state',
+    'capfirst',
+    'short_ap_date',
+    'title',
+)
+
+# Versions of formatters that work through a whole list of values at once.
+# Formatter.many uses them when they're available.
+DEFAULT_BATCH_FORMATTERS = {
+    'dollars': dollars_many,
+    'intcomma': intcomma_many,
+    'percentage': percentage_many,
+    'percent_change': percent_change_many,
+    'title': title_many,
+}
+
+
+class MemoizedFormatter(object):
+    """
+    Wraps a formatting function with a cache of its most recent results.
+
+    Results are keyed on the value and any arguments. Once the cache holds
+    maxsize results, the one used least recently is thrown out to make room.
+    Calls with arguments that can't be hashed go straight through.
+
+    >>> cached = MemoizedFormatter(title, maxsize=2)
+    >>> cached('LOS ANGELES')
+    'Los Angeles'
+    >>> cached('LOS ANGELES')
+    'Los Angeles'
+    >>> cached.cache_info()
+    {'hits': 1, 'misses': 1, 'maxsize': 2, 'currsize': 1}
+    """
+    # Positions in the linked list entries
+    PREV, NEXT, KEY, RESULT = 0, 1, 2, 3
+
+    def __init__(self, func, maxsize=1024):
+        self.func = func
+        self.maxsize = maxsize
+        self.__name__ = getattr(func, '__name__', self.__class__.__name__)
+        self.__doc__ = func.__doc__
+        self.cache_clear()
+
+    def __call__(self, value, *args, **kwargs):
+        if kwargs:
+            key = (type(value), value, args, tuple(sorted(kwargs.items())))
+        else:
+            key = (type(value), value, args)
+        try:
+            link = self._cache.get(key)
+        except TypeError:
+            return self.func(value, *args, **kwargs)
+        root = self._root
+        if link is not None:
+            # Move the entry to the front of the list
+            link_prev, link_next = link[self.PREV], link[self.NEXT]
+            link_prev[self.NEXT] = link_next
+            link_next[self.PREV] = link_prev
+            last = root[self.PREV]
+            last[self.NEXT] = root[self.PREV] = link
+            link[self.PREV] = last
+            link[self.NEXT] = root
+            self.hits += 1
+            return link[self.RESULT]
+        result = self.func(value, *args, **kwargs)
+        self.misses += 1
+        if self.maxsize <= 0:
+            return result
+        if len(self._cache) >= self.maxsize:
+            # Drop the entry used least recently
+            oldest = root[self.NEXT]
+            root[self.NEXT] = oldest[self.NEXT]
+            oldest[self.NEXT][self.PREV] = root
+            del self._cache[oldest[self.KEY]]
+        last = root[self.PREV]
+        link = [last, root, key, result]
+        last[self.NEXT] = root[self.PREV] = self._cache[key] = link
+        return result
+
+    def cache_info(self):
+        """
+        Returns a dictionary with the cache's hits, misses and sizes.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maxsize': self.maxsize,
+            'currsize': len(self._cache),
+        }
+
+    def cache_clear(self):
+        """
+        Empties the cache and resets its counters.
+        """
+        self._cache = {}
+        self._root = []
+        self._root[:] = [self._root, self._root, None, None]
+        self.hits = self.misses = 0
+
 
 class Formatter(object):
     """
@@ -409,19 +624,104 @@ class Formatter(object):
     '1,200'
     >>> formatter(1200, 'dollars')
     '$1,200'
+
+    A whole list of values can be formatted in one go with many. Formatters
+    registered with a batch version use it, and the rest are called once
+    per value.
+
+    >>> formatter.many([1200, 45000], 'intcomma')
+    ['1,200', '45,000']
+
+    Formatters registered as pure remember their most recent results, up to
+    cache_size of them each.
+
+    >>> formatter('CAMARILLO', 'title')
+    'Camarillo'
+    >>> formatter.cache_info('title')['misses']
+    1
     """
 
-    def __init__(self):
+    def __init__(self, cache_size=1024):
         self._filters = {}
+        self._batch_filters = {}
+        self.cache_size = cache_size
         for name, func in DEFAULT_FORMATTERS.items():
-            self.register(name, func)
+            self.register(
+                name,
+                func,
+                many=DEFAULT_BATCH_FORMATTERS.get(name),
+                pure=name in PURE_FORMATTERS,
+            )
 
     def __call__(self, value, func, *args, **kwargs):
+        func = self.get(func)
+        return func(value, *args, **kwargs)
+
+    def get(self, func):
+        """
+        Returns the function registered under a name. Callables are
+        passed straight through.
+        """
         if not callable(func):
             func = self._filters[func]
-        return func(value, *args, **kwargs)
+        return func
+
+    def many(self, values, func, *args, **kwargs):
+        """
+        Formats every value in a list with the same function and options,
+        returning a list.
+        """
+        if not callable(func) and func in self._batch_filters:
+            batch = self._batch_filters[func]
+            if isinstance(self._filters[func], MemoizedFormatter):
+                return self._many_distinct(values, batch, *args, **kwargs)
+            return batch(values, *args, **kwargs)
+        func = self.get(func)
+        return [func(value, *args, **kwargs) for value in values]
+
+    def many_distinct(self, values, func, *args, **kwargs):
+        """
+        Like many, but formats each distinct value only once. It's the
+        faster choice for a column that repeats the same few values.
+        """
+        if not callable(func) and func in self._batch_filters:
+            batch = self._batch_filters[func]
+        else:
+            single = self.get(func)
 
-    def register(self, name=None, func=None):
+            def batch(values, *args, **kwargs):
+                return [single(value, *args, **kwargs) for value in values]
+        return self._many_distinct(values, batch, *args, **kwargs)
+
+    def _many_distinct(self, values, batch, *args, **kwargs):
+        """
+        Runs a pure batch formatter over each distinct value only once.
+        """
+        try:
+            distinct = list(set(values))
+        except TypeError:
+            return batch(values, *args, **kwargs)
+        lookup = dict(zip(distinct, batch(distinct, *args, **kwargs)))
+        return [lookup[value] for value in values]
+
+    def cache_info(self, name):
+        """
+        Returns the cache statistics for a pure formatter, or None if
+        its results aren't cached.
+        """
+        func = self._filters[name]
+        if isinstance(func, MemoizedFormatter):
+            return func.cache_info()
+        return None
+
+    def register(self, name=None, func=None, many=None, pure=False):
+        """
+        Adds a formatting function, by default under its own name.
+
+        A batch version that takes a list of values and returns a list can
+        be passed in as many. Functions whose output depends only on
+        their input can be marked pure to have their results cached.
+        """
         if not func and not name:
             return
 
@@ -431,7 +731,13 @@ class Formatter(object):
         elif func and not name:
             name = func.__name__
 
+        if pure:
+            func = MemoizedFormatter(func, self.cache_size)
         self._filters[name] = func
+        if many:
+            self._batch_filters[name] = many
+        else:
+            self._batch_filters.pop(name, None)
 
     def unregister(self, name=None, func=None):
         if not func and not name:
@@ -443,6 +749,7 @@ class Formatter(object):
             return
 
         del self._filters[name]
+        self._batch_filters.pop(name, None)
 
 
 # Unless you need to subclass or keep formatting functions
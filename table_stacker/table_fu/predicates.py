@@ -0,0 +1,177 @@
+"""
+Filtering for TableFu.
+
+A filter expression is compiled into one test of a row's position, with
+every column it refers to read out of the table before the first row is
+tried. The table can then be filtered in a single pass, without building
+Row objects or copying anything.
+
+An expression is a dictionary. Each key is a column name, and its value
+is either the value to match exactly or a dictionary of operators:
+
+    {
+        'Style': 'Modernism',
+        'Number of Pages': {'gte': 100, 'lt': 500},
+        'Author': {'regex': '^J'},
+    }
+
+Every condition has to hold. Use '$or' for a list of expressions any one
+of which can match, and '$and' for a list that all have to:
+
+    {'$or': [{'Style': 'Satire'}, {'Number of Pages': {'gt': 600}}]}
+
+Values are matched exactly as they're written, so '1200' doesn't find
+'1,200'. Use 'num_eq' to match a number by value in a numeric column.
+Ranges compare numbers by value and dates by time, according to the
+column's type. Blank cells never fall within a range.
+"""
+import re
+import operator
+from array import array
+import sorting
+
+RANGES = {
+    'lt': operator.lt,
+    'lte': operator.le,
+    'gt': operator.gt,
+    'gte': operator.ge,
+}
+OPERATORS = ('eq', 'ne', 'in', 'regex', 'num_eq') + tuple(RANGES)
+
+
+def to_cell(value):
+    """
+    Converts a value to match into a string like those in a table.
+    """
+    if isinstance(value, unicode):
+        return value.encode('utf-8')
+    if not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def compile_expression(table, expression):
+    """
+    Returns a function that takes the position of a row in a table and
+    returns whether the row matches an expression.
+    """
+    tests = []
+    for key, condition in sorted(expression.items()):
+        if key in ('$or', '$and'):
+            branches = [compile_expression(table, e) for e in condition]
+            if key == '$or':
+                tests.append(lambda i, b=branches: any(t(i) for t in b))
+            else:
+                tests.append(lambda i, b=branches: all(t(i) for t in b))
+        else:
+            tests.extend(compile_condition(table, key, condition))
+    if not tests:
+        return lambda i: True
+    if len(tests) == 1:
+        return tests[0]
+
+    def test(i):
+        for t in tests:
+            if not t(i):
+                return False
+        return True
+    return test
+
+
+def compile_condition(table, column_name, condition):
+    """
+    Returns a list of tests of a row's position, one for each operator
+    applied to a column.
+    """
+    if column_name not in table._column_index:
+        raise KeyError("%s isn't a column in this table" % column_name)
+    if not isinstance(condition, dict):
+        condition = {'eq': condition}
+    index = table._column_index[column_name]
+    tests = []
+    for op, operand in sorted(condition.items()):
+        if op not in OPERATORS:
+            raise ValueError("%s isn't a filter operator" % op)
+        if op in RANGES:
+            tests.append(compile_range(
+                table.sort_keys(column_name),
+                table.column_type(column_name),
+                RANGES[op],
+                operand,
+            ))
+        elif op == 'num_eq':
+            if table.column_type(column_name) != sorting.NUMBER:
+                raise ValueError("%s isn't a numeric column" % column_name)
+            tests.append(compile_range(
+                table.sort_keys(column_name),
+                sorting.NUMBER,
+                operator.eq,
+                operand,
+            ))
+        elif op == 'regex':
+            search = re.compile(operand).search
+            values = table.values(column_name)
+            tests.append(lambda i, v=values: search(v[i]) is not None)
+        else:
+            if op == 'in':
+                targets = [to_cell(o) for o in operand]
+            else:
+                targets = [to_cell(operand)]
+            if table.columnar:
+                # The store can look up a value without turning a column
+                # of numbers back into strings
+                found = set()
+                for target in targets:
+                    found.update(table.table.find(index, target))
+                found = frozenset(found)
+                if op == 'ne':
+                    tests.append(lambda i, f=found: i not in f)
+                else:
+                    tests.append(lambda i, f=found: i in f)
+                continue
+            values = table.values(column_name)
+            targets = frozenset(targets)
+            if op == 'ne':
+                tests.append(lambda i, v=values, t=targets: v[i] not in t)
+            else:
+                tests.append(lambda i, v=values, t=targets: v[i] in t)
+    return tests
+
+
+def compile_range(keys, kind, compare, operand):
+    """
+    Returns a test of whether a row's sort key falls on the right side
+    of a bound, read as the same type as the column.
+    """
+    if kind == sorting.STRING:
+        bound = to_cell(operand)
+
+        def test(i):
+            key = keys[i]
+            return bool(key.strip()) and compare(key, bound)
+        return test
+
+    if kind == sorting.NUMBER and isinstance(operand, (int, long, float)):
+        bound = float(operand)
+    elif kind == sorting.NUMBER:
+        bound = sorting.parse_number(to_cell(operand))
+    else:
+        bound = sorting.parse_date(to_cell(operand))
+    if bound is None:
+        raise ValueError("%s can't be compared to the column" % operand)
+
+    def test(i):
+        key = keys[i]
+        return key != sorting.MISSING and compare(key, bound)
+    return test
+
+
+def select(table, expression, row_ids=None):
+    """
+    Returns the positions of the rows in a table that match an expression,
+    in order. Pass a list of row_ids to only try those rows.
+    """
+    test = compile_expression(table, expression)
+    if row_ids is None:
+        row_ids = xrange(len(table))
+    return array('l', [i for i in row_ids if test(i)])
@@ -0,0 +1,335 @@
+"""
+Column types and statistics for TableFu.
+
+Inferring what a column holds means reading every value in it, so it's
+done once per CSV and saved in a file next to it, keyed by a hash of the
+CSV's contents. A schema maps each column name to a dictionary like:
+
+    {
+        "type": "currency",
+        "min": -300.0,
+        "max": 1200.5,
+        "nulls": 2,
+        "distinct": 118
+    }
+
+Numeric columns get their smallest and largest values as numbers, dates
+as ISO strings and everything else as text. The count of distinct values
+is exact up to SKETCH_SIZE and estimated beyond that.
+"""
+import re
+import csv
+import json
+import heapq
+import hashlib
+from datetime import datetime
+from table_stacker.manifest import file_hash
+import sorting
+
+INTEGER = 'integer'
+FLOAT = 'float'
+CURRENCY = 'currency'
+PERCENT = 'percent'
+DATE = 'date'
+CATEGORICAL = 'categorical'
+TEXT = 'text'
+
+NUMERIC_TYPES = (INTEGER, FLOAT, CURRENCY, PERCENT)
+
+# The type of sort key each column type calls for
+SORT_TYPES = {
+    INTEGER: sorting.NUMBER,
+    FLOAT: sorting.NUMBER,
+    CURRENCY: sorting.NUMBER,
+    PERCENT: sorting.NUMBER,
+    DATE: sorting.DATE,
+    CATEGORICAL: sorting.STRING,
+    TEXT: sorting.STRING,
+}
+
+# The jQuery tablesorter parser that reads each type of column as it's
+# written in the CSV
+PARSERS = {
+    INTEGER: 'digit',
+    FLOAT: 'digit',
+    CURRENCY: 'currency',
+    PERCENT: 'percent',
+}
+
+# The parser that reads a column once it's been through a formatter, and
+# the types of column the formatter leaves readable by it
+FORMATTED_PARSERS = {
+    'intcomma': ('digit', (INTEGER, FLOAT)),
+    'dollars': ('currency', (INTEGER, FLOAT)),
+    'percentage': ('percent', (INTEGER, FLOAT)),
+    'percent_change': ('percent', (INTEGER, FLOAT)),
+    'short_ap_date': ('shortApDate', (DATE,)),
+}
+
+# Bump this when the way columns are described changes, so schemas
+# saved by an earlier version are inferred again.
+SCHEMA_VERSION = 3
+SCHEMA_SUFFIX = '.schema.json'
+SKETCH_SIZE = 1024
+# Numbers win over dates, so a column that's numeric is only checked for
+# dates in case a later value isn't a number. After this many numbers
+# the check stops, and a column like that is taken for text.
+NUMERIC_DATE_CHECKS = 100
+INFINITY = float('inf')
+# A text column is categorical if it has no more than this many values,
+# and each appears at least twice on average.
+CATEGORY_LIMIT = 50
+
+INTEGER_VALUE = re.compile(r"^[-+]?(0|[1-9][\d,]*)$")
+# Codes like ZIPs and FIPS numbers, which would lose their leading zeros
+# if they were read as numbers
+LEADING_ZERO = re.compile(r"^[-+(]?\$?0\d")
+
+
+class DistinctSketch(object):
+    """
+    Counts the distinct values in a column without keeping them all.
+
+    Each value is hashed to a number between zero and one, and only the
+    SKETCH_SIZE smallest are kept. Up to that many values the count is
+    exact. Past it, how tightly the kept hashes are packed together says
+    how many values there must have been to produce them.
+    """
+    def __init__(self, size=SKETCH_SIZE):
+        self.size = size
+        self._heap = []
+        self._seen = set()
+
+    def add(self, value):
+        if isinstance(value, unicode):
+            value = value.encode('utf-8')
+        h = int(hashlib.md5(value).hexdigest()[:15], 16) / float(16 ** 15)
+        if h in self._seen:
+            return
+        if len(self._heap) < self.size:
+            heapq.heappush(self._heap, -h)
+            self._seen.add(h)
+        elif h < -self._heap[0]:
+            self._seen.discard(-heapq.heappushpop(self._heap, -h))
+            self._seen.add(h)
+
+    def count(self):
+        if len(self._heap) < self.size:
+            return len(self._heap)
+        return int(round((self.size - 1) / -self._heap[0]))
+
+
+def read_number(value):
+    """
+    Returns the number in a cell, or None if it isn't one or would read
+    differently as a number, like '01234'.
+    """
+    if LEADING_ZERO.match(value):
+        return None
+    number = sorting.parse_number(value)
+    if number is None or number in (INFINITY, -INFINITY):
+        return None
+    return number
+
+
+def number_kind(value):
+    """
+    Returns the numeric type of a single value, or None if it isn't one.
+    """
+    if read_number(value) is None:
+        return None
+    if '$' in value:
+        return CURRENCY
+    if value.endswith('%'):
+        return PERCENT
+    if INTEGER_VALUE.match(value):
+        return INTEGER
+    return FLOAT
+
+
+class ColumnStats(object):
+    """
+    The running type and statistics of a column, fed one value at a time,
+    so a CSV can be described in a single pass without holding it all.
+    """
+    def __init__(self):
+        self.sketch = DistinctSketch()
+        self.nulls = 0
+        self.present = 0
+        self.kinds = set()
+        # Whether every value so far could be a number or a date
+        self.numeric = True
+        self.dated = True
+        self.low = self.high = None
+        self.low_number = self.high_number = None
+        self.low_date = self.high_date = None
+        # Dates repeat, so each one is only parsed once, up to a point
+        self.date_keys = {}
+
+    def add(self, value):
+        value = value.strip()
+        if not value:
+            self.nulls += 1
+            return
+        self.present += 1
+        self.sketch.add(value)
+        if self.low is None or value < self.low:
+            self.low = value
+        if self.high is None or value > self.high:
+            self.high = value
+        if self.numeric:
+            kind = number_kind(value)
+            if kind is None:
+                self.numeric = False
+            else:
+                self.kinds.add(kind)
+                number = read_number(value)
+                if self.low_number is None or number < self.low_number:
+                    self.low_number = number
+                if self.high_number is None or number > self.high_number:
+                    self.high_number = number
+        if self.dated and self.numeric and self.present > NUMERIC_DATE_CHECKS:
+            self.dated = False
+            self.date_keys = {}
+        if self.dated:
+            try:
+                key = self.date_keys[value]
+            except KeyError:
+                key = sorting.parse_date(value)
+                if len(self.date_keys) < SKETCH_SIZE:
+                    self.date_keys[value] = key
+            if key is None:
+                self.dated = False
+                self.date_keys = {}
+            else:
+                if self.low_date is None or key < self.low_date:
+                    self.low_date = key
+                if self.high_date is None or key > self.high_date:
+                    self.high_date = key
+
+    def to_dict(self):
+        stats = {
+            'type': TEXT,
+            'min': None,
+            'max': None,
+            'nulls': self.nulls,
+            'distinct': self.sketch.count(),
+        }
+        if not self.present:
+            return stats
+        if self.numeric:
+            if self.kinds == set([PERCENT]):
+                stats['type'] = PERCENT
+            elif CURRENCY in self.kinds:
+                stats['type'] = CURRENCY
+            elif self.kinds == set([INTEGER]):
+                stats['type'] = INTEGER
+            else:
+                stats['type'] = FLOAT
+            stats['min'], stats['max'] = self.low_number, self.high_number
+            return stats
+        if self.dated:
+            stats['type'] = DATE
+            stats['min'] = to_iso(self.low_date)
+            stats['max'] = to_iso(self.high_date)
+            return stats
+        if stats['distinct'] <= min(CATEGORY_LIMIT, self.present / 2):
+            stats['type'] = CATEGORICAL
+        stats['min'], stats['max'] = self.low, self.high
+        return stats
+
+
+def infer_column(values):
+    """
+    Returns the type and statistics of a sequence of strings.
+    """
+    column = ColumnStats()
+    for value in values:
+        column.add(value)
+    return column.to_dict()
+
+
+def to_iso(key):
+    """
+    Converts a date sort key back into an ISO 8601 string.
+    """
+    days, seconds = divmod(int(key), 86400)
+    dt = datetime.fromordinal(days)
+    hours, seconds = divmod(seconds, 3600)
+    minutes, seconds = divmod(seconds, 60)
+    return dt.replace(hour=hours, minute=minutes, second=seconds).isoformat()
+
+
+def infer_schema(headers, rows):
+    """
+    Returns the schema of a table, given its headers and an iterable of
+    rows, which is read once.
+    """
+    columns = []
+    names = set()
+    for i, name in enumerate(headers):
+        # Only the first column with a name is described
+        if name not in names:
+            names.add(name)
+            columns.append((i, name, ColumnStats()))
+    for row in rows:
+        size = len(row)
+        for i, name, column in columns:
+            column.add(row[i] if i < size else '')
+    return dict((name, column.to_dict()) for i, name, column in columns)
+
+
+def get_parser(stats, method=None):
+    """
+    Returns the tablesorter parser for a column with the given statistics
+    and formatting method, or None if there isn't one it can be sure of.
+    """
+    if method:
+        parser, types = FORMATTED_PARSERS.get(method, (None, ()))
+        if stats['type'] in types:
+            return parser
+        return None
+    return PARSERS.get(stats['type'])
+
+
+def get_schema_path(csv_path):
+    return csv_path + SCHEMA_SUFFIX
+
+
+def load_schema(csv_path):
+    """
+    Returns the schema of a CSV file.
+
+    It's read from the file saved next to the CSV if that was made from
+    the same contents, and otherwise inferred and saved for next time.
+    """
+    md5 = file_hash(csv_path)
+    schema_path = get_schema_path(csv_path)
+    try:
+        with open(schema_path, 'r') as f:
+            cached = json.load(f)
+        if cached.get('version') == SCHEMA_VERSION and \
+                cached.get('md5') == md5:
+            # Column names come out of the CSV as bytes
+            return dict(
+                (name.encode('utf-8'), stats)
+                for name, stats in cached['columns'].items()
+            )
+    except (IOError, ValueError):
+        pass
+
+    with open(csv_path, 'r') as f:
+        reader = csv.reader(f)
+        headers = [i.strip() for i in next(reader)]
+        schema = infer_schema(headers, reader)
+    try:
+        with open(schema_path, 'w') as f:
+            json.dump({
+                'version': SCHEMA_VERSION,
+                'md5': md5,
+                'columns': schema,
+            }, f, indent=2, sort_keys=True)
+    except IOError:
+        # Not being able to save it only means inferring it again next time
+        pass
+    return schema
@@ -0,0 +1,132 @@
+"""
+Views of some of the rows in a TableFu table.
+
+A Selection holds the positions of its rows rather than the rows
+themselves, and reads them out of the parent table as they're needed.
+"""
+import math
+from predicates import select
+
+
+class Selection(object):
+    """
+    Some of the rows of a TableFu table, picked by position or by a
+    filter expression.
+
+    A selection is read-only. It looks up its rows in the parent table by
+    position and passes the parent's column, formatting and display
+    settings through, so it can be rendered like the table itself.
+    Call to_table() for a standalone copy that can be changed.
+
+    A selection made from an expression doesn't look for its rows until
+    it's first used.
+    """
+    # Settings read straight from the parent table
+    DELEGATED = (
+        'columns', 'default_columns', 'headers', 'formatting', 'style',
+        'header_style', 'sorters', 'sorter_config', 'tags', 'per_page',
+        'paginate_after', 'options', 'renderers', 'columnar', 'sorted_by',
+        'column_type', 'schema', '_column_index', '_index',
+    )
+
+    def __init__(self, parent, row_ids=None, expression=None, within=None):
+        self.parent = parent
+        self.expression = expression
+        self.within = within
+        self._row_ids = row_ids
+        self._version = parent._version
+
+    def __getattr__(self, name):
+        if name in Selection.DELEGATED:
+            return getattr(self.parent, name)
+        raise AttributeError(name)
+
+    def _check_version(self):
+        if self._version != self.parent._version:
+            raise ValueError(
+                "The table has changed since this selection was made"
+            )
+
+    def __repr__(self):
+        return "<%s: %s rows>" % (self.__class__.__name__, len(self))
+
+    @property
+    def row_ids(self):
+        """
+        The positions of the selected rows in the parent table, in order.
+        """
+        if self._row_ids is None:
+            self._check_version()
+            within = self.within.row_ids if self.within else None
+            self._row_ids = select(self.parent, self.expression, within)
+        return self._row_ids
+
+    def where(self, expression=None, **query):
+        """
+        Narrows the selection down to the rows that also match a filter
+        expression.
+        """
+        expression = dict(expression or {}, **query)
+        return Selection(self.parent, expression=expression, within=self)
+
+    def __len__(self):
+        return len(self.row_ids)
+
+    def count(self):
+        return len(self)
+
+    @property
+    def rows(self):
+        self._check_version()
+        rows = self.parent.rows
+        return [rows[i] for i in self.row_ids]
+
+    def __getitem__(self, row_num):
+        self._check_version()
+        return self.parent[self.row_ids[row_num]]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def values(self, column_name):
+        self._check_version()
+        values = self.parent.values(column_name)
+        return [values[i] for i in self.row_ids]
+
+    def formatted_values(self, column_name):
+        self._check_version()
+        values = self.parent.formatted_values(column_name)
+        return [values[i] for i in self.row_ids]
+
+    def total(self, column_name):
+        self._check_version()
+        return self.parent.sum_rows(column_name, self.row_ids)
+
+    @property
+    def total_pages(self):
+        return int(math.ceil(len(self) / float(self.per_page)))
+
+    @property
+    def page_size_list(self):
+        page_size_list = []
+        for i in range(1, 5):
+            page_size = i * self.per_page
+            page_size_list.append(page_size)
+            if page_size > len(self):
+                break
+        return page_size_list
+
+    @property
+    def paginated(self):
+        return False
+
+    @property
+    def page_rows(self):
+        return self.rows
+
+    def to_table(self):
+        """
+        Copies the rows into a new TableFu instance.
+        """
+        self._check_version()
+        return self.parent.take(self.row_ids)
@@ -0,0 +1,115 @@
+"""
+Sort keys for TableFu.
+
+Each column is decoded once, according to its type, into a list of keys
+that compare the way a reader would expect: numbers by value, dates by
+time and everything else as text. Sorting then reorders a list of row
+positions by looking those keys up, rather than comparing raw strings.
+"""
+import re
+from array import array
+from toolbox.dateutil.parser import parse as dateparse
+
+NUMBER = 'number'
+DATE = 'date'
+STRING = 'string'
+
+# The type of key implied by each jQuery tablesorter parser that can be
+# declared with the `sorters` option.
+SORTER_TYPES = {
+    'digit': NUMBER,
+    'currency': NUMBER,
+    'percent': NUMBER,
+    'fancyNumber': NUMBER,
+    'simpleBulletGraph': NUMBER,
+    'isoDate': DATE,
+    'shortDate': DATE,
+    'usLongDate': DATE,
+    'ApDatetime': DATE,
+    'shortApDate': DATE,
+    'text': STRING,
+    'url': STRING,
+}
+
+# Blank and unreadable cells sort ahead of everything else
+MISSING = float('-inf')
+NUMBER_NOISE = re.compile(r"[\s,$%]")
+
+
+def parse_number(value):
+    """
+    Returns the float in a cell like '1,200', '$5.50', '12%' or '(300)',
+    or None if it isn't a number.
+    """
+    s = NUMBER_NOISE.sub('', value)
+    negative = s.startswith('(') and s.endswith(')')
+    if negative:
+        s = s[1:-1]
+    try:
+        f = float(s)
+    except ValueError:
+        return None
+    if f != f:
+        return None
+    return -f if negative else f
+
+
+def parse_date(value):
+    """
+    Returns a date cell as seconds since the start of year one, or None
+    if it can't be read as a date.
+    """
+    try:
+        dt = dateparse(value)
+    except (ValueError, OverflowError, TypeError):
+        return None
+    seconds = dt.hour * 3600 + dt.minute * 60 + dt.second
+    return dt.toordinal() * 86400.0 + seconds
+
+
+def infer_type(values):
+    """
+    Guesses whether a column of strings holds numbers, dates or text.
+
+    Blank cells are ignored. A column is only numeric, or only a date,
+    if every other cell can be read that way.
+    """
+    present = [v for v in values if v.strip()]
+    if not present:
+        return STRING
+    for kind, parse in ((NUMBER, parse_number), (DATE, parse_date)):
+        for value in present:
+            if parse(value) is None:
+                break
+        else:
+            return kind
+    return STRING
+
+
+def sort_keys(values, kind):
+    """
+    Decodes a column of strings into a list of sort keys of the given type.
+    """
+    if kind == STRING:
+        return list(values)
+    parse = parse_number if kind == NUMBER else parse_date
+    keys = array('d')
+    for value in values:
+        key = parse(value) if value.strip() else None
+        keys.append(MISSING if key is None else key)
+    return keys
+
+
+def sort_order(length, keys):
+    """
+    Returns the row positions of a table in sorted order.
+
+    The keys argument is a list of (key list, reverse) pairs, most
+    significant first. Each pass is a stable sort on one key list, working
+    from the least significant up, so ties keep the order set by the keys
+    that follow them.
+    """
+    order = list(range(length))
+    for key_list, reverse in reversed(keys):
+        order.sort(key=key_list.__getitem__, reverse=reverse)
+    return order
@@ -1,7 +1,1224 @@
+import shutil
+import tempfile
+from StringIO import StringIO
 from django.test import TestCase
+from table_stacker.models import Table
+from table_stacker.table_fu import TableFu
+from table_stacker.manifest import BuildManifest
+
+CSV = """Author,Best Book,Number of Pages,Style
+Samuel Beckett,Malone Muert,120,Modernism
+James Joyce,Ulysses,644,Modernism
+Nicholson Baker,Mezannine,150,Minimalism
+Vladimir Sorokin,The Queue,263,Satire
+"""
 
 
 class TableStackerTest(TestCase):
 
     def test_foo(self):
         pass
+
+
+class TableFuTest(TestCase):
+
+    def get_table(self, **options):
+        return TableFu(StringIO(CSV), **options)
+
+    def test_columnar_matches_rows(self):
+        rows = self.get_table()
+        columns = self.get_table(columnar=True)
+        self.assertTrue(columns.columnar)
+        self.assertFalse(rows.columnar)
+        self.assertEqual(len(rows), len(columns))
+        self.assertEqual(
+            rows.values('Number of Pages'),
+            columns.values('Number of Pages'),
+        )
+        self.assertEqual([r.cells for r in rows], [r.cells for r in columns])
+        self.assertEqual(columns.total('Number of Pages'), 1177.0)
+        self.assertTrue(columns.table.is_numeric(2))
+        self.assertFalse(columns.table.is_numeric(0))
+        self.assertRaises(ValueError, columns.total, 'Style')
+
+    def test_columnar_sort(self):
+        table = self.get_table(columnar=True)
+        table.sort('Number of Pages', reverse=True)
+        self.assertEqual(
+            table.values('Number of Pages'),
+            ['644', '263', '150', '120'],
+        )
+        self.assertEqual(table[0]['Author'].value, 'James Joyce')
+
+    def test_columnar_filter(self):
+        table = self.get_table(columnar=True)
+        modernists = table.filter(Style='Modernism')
+        self.assertTrue(modernists.columnar)
+        self.assertEqual(len(modernists), 2)
+        self.assertEqual(
+            modernists.values('Author'),
+            self.get_table().filter(Style='Modernism').values('Author'),
+        )
+        self.assertEqual(len(table.filter(**{'Number of Pages': '150'})), 1)
+        short = table.filter(lambda r: int(r['Number of Pages'].value) < 200)
+        self.assertEqual(len(short), 2)
+
+    def test_columnar_demotes_mixed_columns(self):
+        table = self.get_table(columnar=True)
+        table.add_rows(['Anonymous', 'Beowulf', 'unknown', 'Epic'])
+        self.assertFalse(table.table.is_numeric(2))
+        self.assertEqual(table.values('Number of Pages')[-1], 'unknown')
+        self.assertEqual(table.values('Number of Pages')[0], '120')
+
+    def test_from_csv_keeps_only_columns_in_use(self):
+        options = {
+            'columns': ['Author', 'Style'],
+            'formatting': {
+                'Author': {'method': 'link', 'arguments': ['Best Book']},
+            },
+        }
+        table = TableFu.from_csv(StringIO(CSV), chunk_size=3, **options)
+        self.assertEqual(
+            table.default_columns,
+            ['Author', 'Best Book', 'Style'],
+        )
+        self.assertEqual(table.columns, ['Author', 'Style'])
+        self.assertEqual(len(table), 4)
+        self.assertEqual(
+            table[1].cells,
+            ['James Joyce', 'Ulysses', 'Modernism'],
+        )
+
+    def test_from_csv_columnar(self):
+        table = TableFu.from_csv(
+            StringIO(CSV),
+            chunk_size=2,
+            columnar=True,
+            columns=['Author', 'Number of Pages'],
+        )
+        self.assertTrue(table.columnar)
+        self.assertEqual(table.default_columns, ['Author', 'Number of Pages'])
+        self.assertEqual(table.total('Number of Pages'), 1177.0)
+        full = TableFu.from_csv(StringIO(CSV))
+        self.assertEqual(
+            full.default_columns,
+            self.get_table().default_columns,
+        )
+
+    def test_rows_are_cached_until_the_table_changes(self):
+        for table in (self.get_table(), self.get_table(columnar=True)):
+            rows = table.rows
+            self.assertTrue(table.rows is rows)
+            self.assertTrue(table[0] is rows[0])
+            data = rows[0].data
+            self.assertTrue(rows[0].data is data)
+            table.columns = ['Style', 'Author']
+            self.assertFalse(table.rows is rows)
+            self.assertEqual(len(rows[0].data), 2)
+            self.assertEqual(table[0].data[0].value, 'Modernism')
+            table.sort('Author')
+            self.assertEqual(table[0]['Author'].value, 'James Joyce')
+            table.add_rows(['Anonymous', 'Beowulf', '3182', 'Epic'])
+            self.assertEqual(len(table.rows), 5)
+            table[0]['Style'] = 'Irish'
+            self.assertEqual(table[0]['Style'].value, 'Irish')
+            self.assertEqual(table.values('Style')[0], 'Irish')
+            table.delete_row(4)
+            self.assertEqual(len(table.rows), 4)
+            self.assertEqual(table.total_pages, 1)
+
+    def test_column_index(self):
+        table = self.get_table()
+        self.assertEqual(table._column_index['Style'], 3)
+        self.assertRaises(ValueError, table.values, 'Publisher')
+        self.assertRaises(KeyError, table[0].__getitem__, 'Publisher')
+        table.default_columns = ['Writer', 'Title', 'Pages', 'Movement']
+        self.assertFalse('Author' in table._column_index)
+        self.assertEqual(table[0]['Pages'].value, '120')
+
+    def test_compiled_formatting(self):
+        table = self.get_table(formatting={
+            'Best Book': {'method': 'link', 'arguments': ['Author']},
+            'Number of Pages': {
+                'method': 'dollars',
+                'options': {'decimal_places': 0},
+            },
+            'Style': {'method': 'capfirst'},
+        })
+        self.assertEqual(len(table.renderers), 4)
+        self.assertTrue(table.renderers[0] is None)
+        row = table[1]
+        self.assertEqual(unicode(row['Number of Pages']), u'$644')
+        self.assertEqual(unicode(row['Style']), u'Modernism')
+        self.assertTrue('href="James Joyce"' in unicode(row['Best Book']))
+        self.assertEqual(unicode(row['Author']), u'James Joyce')
+        table.formatting = {}
+        self.assertEqual(unicode(row['Number of Pages']), u'644')
+
+    def test_formatted_values(self):
+        formatting = {
+            'Number of Pages': {'method': 'dollars'},
+            'Best Book': {'method': 'link', 'arguments': ['Author']},
+        }
+        table = self.get_table(formatting=formatting)
+        for column in table.columns:
+            self.assertEqual(
+                table.formatted_values(column),
+                [unicode(row[column]) for row in table],
+            )
+
+    def test_sort_is_type_aware(self):
+        for columnar in (False, True):
+            table = self.get_table(columnar=columnar)
+            table.add_rows(['Anonymous', 'Beowulf', '3182', 'Epic'])
+            table.sort('Number of Pages', reverse=True)
+            self.assertEqual(
+                table.values('Number of Pages'),
+                ['3182', '644', '263', '150', '120'],
+            )
+            self.assertEqual(table.sorted_by(), [[2, 1]])
+
+    def test_multi_key_sort(self):
+        table = self.get_table(
+            columns=['Style', 'Author', 'Number of Pages'],
+            sorted_by=[
+                {'Style': 'ascending'},
+                {'Number of Pages': 'descending'},
+            ],
+        )
+        self.assertEqual(
+            table.values('Author'),
+            ['Nicholson Baker', 'James Joyce', 'Samuel Beckett',
+             'Vladimir Sorokin'],
+        )
+        self.assertEqual(table.sorted_by(), [[0, 0], [2, 1]])
+        table.sort(keys=[('Style', True), ('Author', False)])
+        self.assertEqual(table.values('Author')[:2], [
+            'Vladimir Sorokin', 'James Joyce'
+        ])
+
+    def test_column_types(self):
+        from table_stacker.table_fu import sorting
+        table = TableFu([
+            ['Date', 'Amount', 'Name'],
+            ['12/1/10', '$1,200', 'b'],
+            ['1/5/11', '(300)', 'a'],
+            ['', '12', 'c'],
+        ], sorters={'Name': 'digit'})
+        self.assertEqual(table.column_type('Date'), sorting.DATE)
+        self.assertEqual(table.column_type('Amount'), sorting.NUMBER)
+        self.assertEqual(table.column_type('Name'), sorting.NUMBER)
+        table.sort('Date')
+        self.assertEqual(table.values('Date'), ['', '12/1/10', '1/5/11'])
+        table.sort('Amount')
+        self.assertEqual(table.values('Amount'), ['(300)', '12', '$1,200'])
+
+    def test_pagination(self):
+        table = self.get_table(per_page=3)
+        self.assertFalse(table.paginated)
+        self.assertEqual(len(table.page_rows), 4)
+        table = self.get_table(per_page=3, paginate_after=3)
+        self.assertTrue(table.paginated)
+        self.assertEqual(table.total_pages, 2)
+        self.assertEqual(
+            [r['Author'].value for r in table.page_rows],
+            ['Samuel Beckett', 'James Joyce', 'Nicholson Baker'],
+        )
+        self.assertEqual(table.page(2)[0]['Author'].value, 'Vladimir Sorokin')
+        self.assertEqual(table.page(3), [])
+        # A page doesn't build the rows of the whole table
+        self.assertEqual(table._rows, None)
+        self.assertEqual(table.page(2), table.rows[3:6])
+
+    def test_facets(self):
+        for columnar in (False, True):
+            table = self.get_table(
+                columnar=columnar,
+                sorted_by=[{'Number of Pages': 'descending'}],
+                formatting={'Number of Pages': {'method': 'intcomma'}},
+            )
+            self.assertEqual(
+                table.facet_counts('Style'),
+                [('Minimalism', 1), ('Modernism', 2), ('Satire', 1)],
+            )
+            facets = table.facet_by('Style')
+            self.assertEqual(
+                [f.faceted_on for f in facets],
+                ['Minimalism', 'Modernism', 'Satire'],
+            )
+            modernism = facets[1]
+            self.assertEqual(len(modernism), 2)
+            self.assertEqual(
+                modernism.values('Author'),
+                ['James Joyce', 'Samuel Beckett'],
+            )
+            self.assertTrue(modernism.rows[0] is table.rows[0])
+            self.assertEqual(modernism.formatted_values('Number of Pages'),
+                             [u'644', u'120'])
+            self.assertEqual(modernism.total('Number of Pages'), 764.0)
+            self.assertEqual(modernism.columns, table.columns)
+            copy = modernism.to_table()
+            self.assertEqual(copy.values('Author'), modernism.values('Author'))
+            self.assertEqual(copy.faceted_on, 'Modernism')
+            self.assertRaises(KeyError, table.facet_by_value, 'Style', 'Epic')
+            table.add_rows(['Anonymous', 'Beowulf', '3182', 'Epic'])
+            self.assertRaises(ValueError, getattr, modernism, 'rows')
+            self.assertEqual(len(table.facet_by_value('Style', 'Epic')), 1)
+
+    def test_from_csv_keeps_facet_columns(self):
+        table = TableFu.from_csv(
+            StringIO(CSV),
+            columns=['Author'],
+            facets=['Style'],
+        )
+        self.assertEqual(table.default_columns, ['Author', 'Style'])
+        self.assertEqual(table.facet_columns, ['Style'])
+
+    def test_schema(self):
+        from table_stacker.table_fu import schema
+        rows = [
+            ['12/1/10', '$1,200', '1,500', '2.5', '12%', 'CA', 'x'],
+            ['1/5/11', '(300)', '-20', '', '3%', 'CA', 'y'],
+            ['', '12', '7', '1', '0.5%', 'NV', 'z'],
+            ['1/5/11', '$5', '7', '3', '1%', 'CA', 'w'],
+        ]
+        headers = ['Date', 'Amount', 'Count', 'Rate', 'Share', 'State', 'ID']
+        columns = schema.infer_schema(headers, rows)
+        self.assertEqual(
+            [columns[h]['type'] for h in headers],
+            ['date', 'currency', 'integer', 'float', 'percent',
+             'categorical', 'text'],
+        )
+        self.assertEqual(columns['Date']['min'], '2010-12-01T00:00:00')
+        self.assertEqual(columns['Date']['nulls'], 1)
+        self.assertEqual(columns['Date']['distinct'], 2)
+        self.assertEqual(columns['Amount']['min'], -300.0)
+        self.assertEqual(columns['Count']['max'], 1500.0)
+        # Rows are read in a single pass, so a reader will do
+        self.assertEqual(
+            schema.infer_schema(headers, (list(r) for r in rows)), columns
+        )
+
+        table = TableFu(
+            [list(headers)] + rows,
+            schema=columns,
+            formatting={'Date': {'method': 'short_ap_date'},
+                        'Amount': {'method': 'dollars'}},
+            sorters={'ID': False},
+        )
+        self.assertEqual(table.sorter_config, {
+            0: 'shortApDate', 2: 'digit', 3: 'digit', 4: 'percent', 6: False
+        })
+        self.assertEqual(table.total('Rate'), 6.5)
+        self.assertEqual(table.total('Amount'), 917.0)
+        self.assertRaises(ValueError, table.total, 'State')
+        table[2]['Rate'] = '10'
+        self.assertEqual(table.total('Rate'), 15.5)
+        table.sort('Date')
+        self.assertEqual(table.values('Date')[0], '')
+
+    def test_numeric_columns_stop_checking_dates(self):
+        from table_stacker.table_fu import schema
+        parse_date = schema.sorting.parse_date
+        calls = []
+
+        def counting_parse_date(value):
+            calls.append(value)
+            return parse_date(value)
+        schema.sorting.parse_date = counting_parse_date
+        try:
+            years = [str(1900 + i) for i in range(500)]
+            column = schema.infer_column(years)
+            self.assertEqual(column['type'], 'integer')
+            self.assertEqual(len(calls), schema.NUMERIC_DATE_CHECKS)
+            # A few numbers followed by dates still make a date column
+            column = schema.infer_column(years[:5] + ['May 1, 2012'])
+            self.assertEqual(column['type'], 'date')
+            column = schema.infer_column(years + ['May 1, 2012'])
+            self.assertEqual(column['type'], 'text')
+        finally:
+            schema.sorting.parse_date = parse_date
+
+    def test_where(self):
+        for columnar in (False, True):
+            table = self.get_table(columnar=columnar)
+            table.add_rows(['Anonymous', 'Beowulf', '', 'Epic'])
+            selection = table.where({'Number of Pages': {'gte': 150}})
+            self.assertTrue(selection._row_ids is None)
+            self.assertEqual(list(selection.row_ids), [1, 2, 3])
+            self.assertEqual(
+                table.where({'Number of Pages': {'gt': 120, 'lt': '644'}},
+                            Style='Minimalism').values('Author'),
+                ['Nicholson Baker'],
+            )
+            self.assertEqual(len(table.where({'Number of Pages': ''})), 1)
+            self.assertEqual(len(table.where({'Number of Pages': 644})), 1)
+            self.assertEqual(
+                table.where({'$or': [
+                    {'Author': {'regex': '^J'}},
+                    {'Style': {'in': ['Satire', 'Epic']}},
+                ]}).values('Author'),
+                ['James Joyce', 'Vladimir Sorokin', 'Anonymous'],
+            )
+            narrowed = table.where(Style={'ne': 'Epic'}).where(
+                {'Author': {'lt': 'O'}}
+            )
+            self.assertEqual(
+                narrowed.values('Author'),
+                ['James Joyce', 'Nicholson Baker'],
+            )
+            self.assertEqual(narrowed.to_table().values('Author'),
+                             narrowed.values('Author'))
+            self.assertEqual(len(table.where()), 5)
+            self.assertRaises(KeyError, table.where({'Publisher': 'x'}).count)
+            self.assertRaises(
+                ValueError, table.where({'Style': {'like': 'x'}}).count
+            )
+
+    def test_selections_total_and_go_stale_like_their_table(self):
+        from table_stacker.table_fu.schema import infer_schema
+        rows = [['Name', 'N'], ['a', '1,200'], ['b', '300'], ['c', '']]
+        schema = infer_schema(rows[0], rows[1:])
+        for columnar in (False, True):
+            table = TableFu([list(r) for r in rows], schema=schema,
+                            columnar=columnar)
+            self.assertEqual(table.total('N'), 1500.0)
+            selection = table.where({'Name': {'in': ['a', 'c']}})
+            self.assertEqual(selection.total('N'), 1200.0)
+            self.assertEqual(
+                table.facet_by_value('Name', 'b').total('N'), 300.0
+            )
+            table[0]['N'] = '5'
+            self.assertRaises(ValueError, selection.total, 'N')
+            self.assertEqual(table.total('N'), 305.0)
+
+    def test_where_matches_the_same_in_both_backends(self):
+        rows = [
+            ['Name', 'N', 'M', 'Zip'],
+            ['a', '1200', '1200', '01234'],
+            ['b', '1,200', '300', '1234'],
+            ['c', '1200.0', '', 'N/A'],
+            ['d', '', '5', ''],
+        ]
+        for columnar in (False, True):
+            table = TableFu([list(r) for r in rows], columnar=columnar)
+            # Values are matched exactly as they're written
+            self.assertEqual(table.where(N=1200).values('Name'), ['a'])
+            self.assertEqual(table.where(N='1,200').values('Name'), ['b'])
+            self.assertEqual(table.where(M=1200.0).values('Name'), [])
+            self.assertEqual(
+                table.where(M={'in': ['', 300]}).values('Name'), ['b', 'c']
+            )
+            self.assertEqual(
+                table.where(M={'ne': '1200'}).values('Name'),
+                ['b', 'c', 'd'],
+            )
+            self.assertEqual(table.where(Zip='01234').values('Name'), ['a'])
+            self.assertEqual(table.where(Zip='N/A').values('Name'), ['c'])
+            self.assertEqual(table.where(Zip='').values('Name'), ['d'])
+            # Unless num_eq asks for them to be matched by value
+            self.assertEqual(
+                table.where(N={'num_eq': 1200}).values('Name'),
+                ['a', 'b', 'c'],
+            )
+            self.assertEqual(
+                table.where(M={'num_eq': '$1,200'}).values('Name'), ['a']
+            )
+            self.assertRaises(
+                ValueError, table.where(Zip={'num_eq': 1234}).count
+            )
+
+    def test_filter_copies_once_without_sorting_again(self):
+        table = self.get_table(sorted_by=[{'Author': 'ascending'}])
+        table.add_rows(['Anonymous', 'Beowulf', '300', 'Epic'])
+        short = table.filter({'Number of Pages': {'lt': 600}})
+        self.assertEqual(
+            short.values('Author'),
+            ['Nicholson Baker', 'Samuel Beckett', 'Vladimir Sorokin',
+             'Anonymous'],
+        )
+        self.assertEqual(short.options['sorted_by'],
+                         table.options['sorted_by'])
+        self.assertEqual(
+            len(table.filter(lambda r: r['Style'].value == 'Modernism',
+                             Author='James Joyce')),
+            1,
+        )
+
+    def test_aggregate(self):
+        from table_stacker.table_fu.aggregates import AGGREGATES
+        for columnar in (False, True):
+            table = self.get_table(columnar=columnar)
+            table.add_rows(['Anonymous', 'Beowulf', '', 'Epic'])
+            figures = table.aggregate({
+                'Number of Pages': list(AGGREGATES),
+                'Author': ['min', 'count'],
+                'Style': 'count_distinct',
+            })
+            self.assertEqual(figures['Number of Pages'], {
+                'sum': 1177.0, 'mean': 294.25, 'min': 120.0, 'max': 644.0,
+                'count': 4, 'count_distinct': 4,
+            })
+            self.assertEqual(figures['Author'], {
+                'min': 'Anonymous', 'count': 5
+            })
+            self.assertEqual(figures['Style'], {'count_distinct': 4})
+            groups = table.aggregate(
+                {'Number of Pages': ['sum', 'count']},
+                group_by=['Style'],
+            )
+            self.assertEqual(groups[0], (('Epic',), {
+                'Number of Pages': {'sum': 0.0, 'count': 0}
+            }))
+            self.assertEqual(groups[2], (('Modernism',), {
+                'Number of Pages': {'sum': 764.0, 'count': 2}
+            }))
+            self.assertRaises(ValueError, table.aggregate, {'Style': 'sum'})
+            self.assertRaises(ValueError, table.aggregate, {'Style': 'median'})
+
+    def test_summary_rows(self):
+        table = self.get_table(
+            columns=['Author', 'Number of Pages', 'Style'],
+            formatting={'Number of Pages': {'method': 'dollars'}},
+            summary={'Number of Pages': ['sum', 'mean'],
+                     'Style': 'count_distinct'},
+        )
+        self.assertEqual(
+            [(r['label'], r['cells']) for r in table.summary_rows],
+            [('Total', ['Total', '$1,177.00', '']),
+             ('Average', ['Average', '$294.25', '']),
+             ('Distinct', ['Distinct', '', '3'])],
+        )
+        self.assertEqual(self.get_table().summary_rows, [])
+
+    def test_schema_is_cached_next_to_the_csv(self):
+        import os
+        from table_stacker.table_fu import schema
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, 'books.csv')
+            with open(path, 'w') as f:
+                f.write(CSV)
+            columns = schema.load_schema(path)
+            self.assertEqual(columns['Number of Pages']['type'], 'integer')
+            self.assertTrue(os.path.exists(path + '.schema.json'))
+            self.assertEqual(schema.load_schema(path), columns)
+            with open(path, 'a') as f:
+                f.write('Homer,The Odyssey,many,Epic\n')
+            columns = schema.load_schema(path)
+            self.assertEqual(columns['Number of Pages']['type'], 'text')
+        finally:
+            shutil.rmtree(tmp)
+
+
+class FormatterTest(TestCase):
+
+    def test_intcomma(self):
+        from table_stacker.table_fu.formatting import intcomma
+        self.assertEqual(intcomma(3000), '3,000')
+        self.assertEqual(intcomma('-1234567.891'), '-1,234,567.891')
+        self.assertEqual(intcomma('0012345'), '0,012,345')
+        self.assertEqual(intcomma(''), '')
+        self.assertEqual(intcomma('N/A'), 'N/A')
+
+    def test_many_matches_one_at_a_time(self):
+        from table_stacker.table_fu.formatting import format
+        values = ['1234.5', '-0.25', '', '0', 'x', '98279377', "o'neil 3d"]
+        cases = [
+            ('intcomma', values, {}),
+            ('dollars', values, {}),
+            ('dollars', values, {'decimal_places': 0}),
+            ('percent_change', values, {}),
+            ('percent_change', values, {'multiply': False}),
+            ('percentage', ['0.5', '-1', '12'], {'decimal_places': 2}),
+            ('title', values, {}),
+            ('capfirst', values, {}),
+        ]
+        for name, items, kwargs in cases:
+            self.assertEqual(
+                format.many(items, name, **kwargs),
+                [format(v, name, **kwargs) for v in items],
+            )
+            self.assertEqual(
+                format.many_distinct(items + items, name, **kwargs),
+                [format(v, name, **kwargs) for v in items + items],
+            )
+        self.assertRaises(ValueError, format.many, ['x'], 'percentage')
+
+    def test_memoized_formatters(self):
+        from table_stacker.table_fu.formatting import (
+            Formatter,
+            MemoizedFormatter,
+            title,
+        )
+        formatter = Formatter(cache_size=2)
+        self.assertTrue(formatter.cache_info('intcomma') is None)
+        for value in ['ONE', 'TWO', 'ONE', 'THREE', 'TWO']:
+            formatter(value, 'title')
+        info = formatter.cache_info('title')
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 4)
+        self.assertEqual(info['currsize'], 2)
+        self.assertEqual(formatter('TWO', 'title'), 'Two')
+        self.assertEqual(formatter.cache_info('title')['hits'], 2)
+        self.assertEqual(
+            formatter.many(['A B', 'C', 'A B'], 'title'),
+            ['A B', 'C', 'A B'],
+        )
+        cached = MemoizedFormatter(title, maxsize=0)
+        cached('FOO')
+        self.assertEqual(cached.cache_info()['currsize'], 0)
+        formatter.register(
+            'shout', lambda v, end='!': v + ''.join(end), pure=True
+        )
+        self.assertEqual(formatter('hey', 'shout', end='?'), 'hey?')
+        self.assertEqual(formatter('hey', 'shout'), 'hey!')
+        self.assertEqual(formatter('hey', 'shout', end=['?']), 'hey?')
+
+
+class ConfigTest(TestCase):
+
+    def test_config_round_trips_as_versioned_json(self):
+        import json
+        from datetime import date
+        from table_stacker.config import (
+            dump_config,
+            load_config,
+            get_config_hash,
+            CONFIG_VERSION,
+        )
+        config = {
+            'title': 'Cubs',
+            'pub_date': date(2010, 4, 1),
+            'column_options': {'columns': ['Date', u'Se\xf1or']},
+        }
+        data = dump_config(config)
+        stored = json.loads(data)
+        self.assertEqual(stored['version'], CONFIG_VERSION)
+        self.assertEqual(stored['hash'], get_config_hash(dict(config)))
+        loaded = load_config(data)
+        self.assertEqual(loaded['pub_date'], '2010-04-01')
+        self.assertEqual(
+            loaded['column_options'], {'columns': ['Date', u'Se\xf1or']}
+        )
+        self.assertTrue(isinstance(loaded['title'], str))
+        # Older tables stored the config as a Python repr
+        self.assertEqual(
+            load_config(str({'column_options': {'per_page': 10}})),
+            {'column_options': {'per_page': 10}},
+        )
+        self.assertEqual(load_config(''), {})
+
+    def test_yaml_is_indexed_and_errors_are_collected(self):
+        import os
+        from table_stacker.config import load_all_yaml, INDEX_NAME
+        yaml_dir = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(yaml_dir, 'sports'))
+            files = {
+                'a.yaml': 'table: {title: A, file: a.csv}',
+                'sports/b.yaml': 'table: {title: B, file: b.csv}',
+                'broken.yaml': 'table: [unclosed',
+                'notes.txt': 'not a config',
+            }
+            for name, text in files.items():
+                with open(os.path.join(yaml_dir, name), 'w') as f:
+                    f.write(text)
+                os.utime(os.path.join(yaml_dir, name), (1000000000,) * 2)
+            configs, errors = load_all_yaml(yaml_dir, workers=2)
+            self.assertEqual(
+                [(c['yaml_name'], c['title']) for c in configs],
+                [('a.yaml', 'A'), ('sports/b.yaml', 'B')],
+            )
+            self.assertEqual(len(errors), 1)
+            self.assertEqual(errors[0][:2], (
+                'broken.yaml', os.path.join(yaml_dir, 'broken.yaml')
+            ))
+            self.assertTrue(os.path.exists(os.path.join(yaml_dir, INDEX_NAME)))
+            # A file with the same time and size is read from the index,
+            # not parsed again
+            path = os.path.join(yaml_dir, 'a.yaml')
+            with open(path, 'w') as f:
+                f.write('table: {title: Z, file: a.csv}')
+            os.utime(path, (1000000000, 1000000000))
+            self.assertEqual(load_all_yaml(yaml_dir)[0], configs)
+            with open(path, 'a') as f:
+                f.write('\n')
+            os.remove(os.path.join(yaml_dir, 'broken.yaml'))
+            configs, errors = load_all_yaml(yaml_dir)
+            self.assertEqual(configs[0]['title'], 'Z')
+            self.assertEqual(errors, [])
+        finally:
+            shutil.rmtree(yaml_dir)
+
+    def test_config_is_cached_on_the_table(self):
+        from table_stacker.config import dump_config
+        table = Table(yaml_data=dump_config({
+            'column_options': {'columns': ['Date']}
+        }))
+        self.assertTrue(table.config is table.config)
+        opts = table.get_tablefu_opts()
+        opts['columns'].append('Opponent')
+        self.assertEqual(table.get_tablefu_opts(), {'columns': ['Date']})
+        table.yaml_data = dump_config({'column_options': {}})
+        self.assertEqual(table.get_tablefu_opts(), {})
+
+
+class TableManagerTest(TestCase):
+
+    def get_config(self, name, **options):
+        from datetime import date
+        config = {
+            'file': '%s.csv' % name,
+            'yaml_name': '%s.yaml' % name,
+            'title': name.title(),
+            'slug': name,
+            'publication_date': date(2010, 4, 1),
+        }
+        config.update(options)
+        return config
+
+    def count_queries(self, func, *args, **kwargs):
+        """
+        Returns what a function returns and the number of queries it ran,
+        leaving out the savepoints that differ between Django versions.
+        """
+        from django.db import connection
+        debug = connection.use_debug_cursor
+        connection.use_debug_cursor = True
+        start = len(connection.queries)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            connection.use_debug_cursor = debug
+        queries = [
+            q for q in connection.queries[start:]
+            if 'SAVEPOINT' not in q['sql']
+        ]
+        return result, len(queries)
+
+    def test_sync(self):
+        configs = [self.get_config('table-%s' % i) for i in range(20)]
+        # One to look and one to insert
+        self.assertEqual(
+            self.count_queries(Table.objects.sync, configs), ((20, 0, 0), 2)
+        )
+        # Nothing has changed, so there's nothing to save
+        self.assertEqual(
+            self.count_queries(Table.objects.sync, configs), ((0, 0, 0), 1)
+        )
+        configs[0]['title'] = 'Changed'
+        configs[1]['publication_time'] = '10:30'
+        removed = configs.pop()
+        configs.append(self.get_config('new-table'))
+        self.assertEqual(Table.objects.sync(configs), (1, 2, 1))
+        self.assertEqual(Table.objects.get(slug='table-0').title, 'Changed')
+        self.assertEqual(Table.objects.count(), 20)
+        self.assertFalse(
+            Table.objects.filter(slug=removed['slug']).exists()
+        )
+        self.assertEqual(
+            Table.objects.get(slug='new-table').config['title'], 'New-Table'
+        )
+        # Tables whose YAML can't be read are kept as they were
+        self.assertEqual(
+            Table.objects.sync(configs[1:], keep=['table-0.yaml']),
+            (0, 0, 0),
+        )
+
+
+class BuildManifestTest(TestCase):
+
+    def setUp(self):
+        self.build_dir = tempfile.mkdtemp()
+        self.table = Table(
+            slug='cubs-home-run-tracker',
+            yaml_name='cubs-home-run-tracker.yaml',
+            csv_name='cubs-home-run-tracker.csv',
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.build_dir)
+
+    def test_changes_are_tracked(self):
+        manifest = BuildManifest(self.build_dir)
+        self.assertFalse(manifest.exists())
+        self.assertTrue(manifest.has_changed(self.table))
+        manifest.record(self.table)
+        manifest.record_listing([self.table])
+        manifest.save()
+        manifest = BuildManifest(self.build_dir)
+        self.assertTrue(manifest.exists())
+        self.assertFalse(manifest.has_changed(self.table))
+        self.assertFalse(manifest.listing_has_changed([self.table]))
+        self.assertTrue(manifest.listing_has_changed([]))
+        manifest._code_hash = 'something else'
+        self.assertTrue(manifest.listing_has_changed([self.table]))
+        inputs = manifest.get_inputs(self.table)
+        inputs['csv'] = 'something else'
+        self.assertTrue(manifest.has_changed(self.table, inputs))
+        manifest.forget(self.table.slug)
+        self.assertEqual(manifest.slugs(), set())
+
+    def test_code_hash_covers_only_rendering_code(self):
+        import os
+        from table_stacker import manifest
+        code_dir = tempfile.mkdtemp()
+        code_dir_was = manifest.CODE_DIR
+        manifest.CODE_DIR = code_dir
+        try:
+            for name in ('views.py', 'tests.py'):
+                with open(os.path.join(code_dir, name), 'w') as f:
+                    f.write('x = 1\n')
+            before = manifest.get_code_hash()
+            with open(os.path.join(code_dir, 'tests.py'), 'a') as f:
+                f.write('y = 2\n')
+            self.assertEqual(manifest.get_code_hash(), before)
+            with open(os.path.join(code_dir, 'views.py'), 'a') as f:
+                f.write('y = 2\n')
+            self.assertNotEqual(manifest.get_code_hash(), before)
+        finally:
+            manifest.CODE_DIR = code_dir_was
+            shutil.rmtree(code_dir)
+
+
+class BuildCommandTest(TestCase):
+
+    def test_failures_are_returned_not_raised(self):
+        from table_stacker.management.commands.build import (
+            build_table,
+            get_detail_views,
+            get_list_views,
+        )
+        error = build_table('no-such-table')
+        self.assertTrue('DoesNotExist' in error)
+        self.assertTrue('table_stacker.views.TableDetailView' in
+                        get_detail_views())
+        self.assertTrue('table_stacker.views.TableListView' in
+                        get_list_views())
+
+
+class APITest(TestCase):
+
+    def setUp(self):
+        self.table = Table(
+            slug='cubs-home-run-tracker',
+            csv_name='cubs-home-run-tracker.csv',
+        )
+
+    def test_json_streams_the_same_text(self):
+        import csv
+        import json
+        import os
+        from django.conf import settings
+        from table_stacker.api import TableDetailJSONView, iter_json_list
+        self.assertEqual(''.join(iter_json_list([])), '[]')
+        items = [{'a': 1}, [2, 'b'], 'c'] * 10
+        self.assertEqual(
+            ''.join(iter_json_list(iter(items), chunk_size=16)),
+            json.dumps(items),
+        )
+        path = os.path.join(settings.CSV_DIR, self.table.csv_name)
+        rows = list(csv.reader(open(path, 'rU')))
+        expected = json.dumps([dict(zip(rows[0], r)) for r in rows[1:]])
+        view = TableDetailJSONView()
+        self.assertEqual(''.join(view.iter_content(self.table)), expected)
+
+    def test_summary(self):
+        import json
+        from django.http import Http404
+        from table_stacker.api import TableDetailSummaryView
+        view = TableDetailSummaryView()
+        self.table.yaml_data = "column_options: {}"
+        self.assertEqual(view.get_summary(self.table), None)
+        self.assertRaises(
+            Http404, view.render_to_response, {'object': self.table}
+        )
+        self.table.yaml_data = "column_options: {summary: {At bats: sum}}"
+        response = view.render_to_response({'object': self.table})
+        self.assertEqual(json.loads(response.content), {
+            'At bats': {'sum': 3224.0}
+        })
+
+    def test_tablefu_is_cached_until_its_inputs_change(self):
+        import os
+        from django.test.utils import override_settings
+        csv_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(csv_dir, 'books.csv')
+            with open(path, 'w') as f:
+                f.write(CSV)
+            table = Table(csv_name='books.csv', yaml_data='')
+            with override_settings(CSV_DIR=csv_dir):
+                first = table.get_tablefu()
+                self.assertTrue(table.get_tablefu() is first)
+                self.assertTrue(table.get_schema() is first.schema)
+                table.yaml_data = 'column_options: {per_page: 2}'
+                second = table.get_tablefu()
+                self.assertFalse(second is first)
+                self.assertEqual(second.per_page, 2)
+                with open(path, 'a') as f:
+                    f.write('Jane Austen,Emma,474,Satire\n')
+                self.assertEqual(len(table.get_tablefu()), 5)
+                self.assertEqual(table.schema['Author']['distinct'], 5)
+        finally:
+            shutil.rmtree(csv_dir)
+
+    def test_csv_is_linked_unless_it_needs_fixing(self):
+        import os
+        from django.test.utils import override_settings
+        from table_stacker.api import TableDetailCSVView
+        csv_dir = tempfile.mkdtemp()
+        build_dir = tempfile.mkdtemp()
+        try:
+            with open(os.path.join(csv_dir, 'unix.csv'), 'wb') as f:
+                f.write(CSV)
+            with open(os.path.join(csv_dir, 'mac.csv'), 'wb') as f:
+                f.write(CSV.replace('\n', '\r'))
+            view = TableDetailCSVView()
+            with override_settings(CSV_DIR=csv_dir, BUILD_DIR=build_dir):
+                for name in ('unix', 'mac'):
+                    table = Table(slug=name, csv_name=name + '.csv')
+                    response = view.render_to_response({'object': table})
+                    self.assertEqual(''.join(response.streaming_content), CSV)
+                    view.build_object(table)
+                    view.build_object(table)
+                    path = os.path.join(build_dir, 'api', name + '.csv')
+                    self.assertEqual(open(path, 'rb').read(), CSV)
+                source = os.path.join(csv_dir, 'unix.csv')
+                self.assertTrue(os.path.samefile(
+                    source, os.path.join(build_dir, 'api', 'unix.csv')
+                ))
+                self.assertEqual(response.get('Content-Length'), None)
+        finally:
+            shutil.rmtree(csv_dir)
+            shutil.rmtree(build_dir)
+
+    def test_xlsx(self):
+        import zipfile
+        from table_stacker import xlsx
+        from table_stacker.table_fu.schema import infer_schema
+        rows = [
+            ['Name', 'Pay', 'Share', 'Count', 'Zip'],
+            ['Smith & Co', '$1,200.50', '12.5%', '1,000', '01234'],
+            ['Jones', '(300)', '', '7', '90210'],
+            ['Smith & Co', '$5', '1%', 'n/a', '00501'],
+        ]
+        schema = infer_schema(rows[0], rows[1:3])
+        self.assertEqual(schema['Zip']['type'], 'text')
+        # Even a column typed as numbers keeps its codes as text
+        schema['Zip'] = dict(schema['Count'])
+        outfile = StringIO()
+        xlsx.write_xlsx(iter(rows), outfile, schema=schema, sheet_name='a/b')
+        workbook = zipfile.ZipFile(StringIO(outfile.getvalue()))
+        sheet = workbook.read('xl/worksheets/sheet1.xml')
+        self.assertTrue('<c r="B2" s="2"><v>1200.5</v></c>' in sheet)
+        self.assertTrue('<c r="B3" s="2"><v>-300</v></c>' in sheet)
+        self.assertTrue('<c r="C2" s="3"><v>0.125</v></c>' in sheet)
+        self.assertTrue('<c r="D2" s="1"><v>1000</v></c>' in sheet)
+        self.assertFalse('r="C3"' in sheet)
+        self.assertTrue('<c r="D4" t="s"><v>' in sheet)
+        self.assertTrue('<c r="E2" t="s"><v>' in sheet)
+        self.assertTrue('<c r="E3" s="1"><v>90210</v></c>' in sheet)
+        self.assertTrue('<c r="E4" t="s"><v>' in sheet)
+        self.assertTrue('00501' in workbook.read('xl/sharedStrings.xml'))
+        strings = workbook.read('xl/sharedStrings.xml')
+        self.assertEqual(strings.count('Smith &amp; Co'), 1)
+        self.assertTrue('name="ab"' in workbook.read('xl/workbook.xml'))
+        again = StringIO()
+        xlsx.write_xlsx(iter(rows), again, schema=schema, sheet_name='a/b')
+        self.assertEqual(again.getvalue(), outfile.getvalue())
+        self.assertEqual(xlsx.column_letter(27), 'AB')
+        # Shrink the ZIP64 threshold so the worksheet needs it
+        limit = zipfile.ZIP64_LIMIT
+        zipfile.ZIP64_LIMIT = 100
+        try:
+            large = StringIO()
+            xlsx.write_xlsx(iter(rows), large, schema=schema)
+        finally:
+            zipfile.ZIP64_LIMIT = limit
+        workbook = zipfile.ZipFile(StringIO(large.getvalue()))
+        self.assertEqual(workbook.read('xl/worksheets/sheet1.xml'), sheet)
+        self.assertNotEqual(large.getvalue(), outfile.getvalue())
+
+    def test_facet_slugs(self):
+        from table_stacker.views import unique_slug, get_facets
+        taken = set()
+        self.assertEqual(unique_slug('A B', taken), 'a-b')
+        self.assertEqual(unique_slug('A-B', taken), 'a-b-2')
+        self.assertEqual(unique_slug('', taken), 'blank')
+        self.assertEqual(unique_slug('Jos\xc3\xa9', taken), 'jose')
+        table = TableFu(StringIO(CSV), facets=['Style'])
+        facets = get_facets(self.table, table)
+        self.assertEqual(facets[0]['slug'], 'style')
+        self.assertEqual(facets[0]['values'][1], {
+            'value': 'Modernism',
+            'slug': 'modernism',
+            'count': 2,
+            'url': '/cubs-home-run-tracker/facets/style/modernism/',
+        })
+        from django.http import Http404
+        from table_stacker.views import TableFacetView
+        view = TableFacetView()
+        facet, value = view.find_facet(facets, 'style', 'modernism')
+        self.assertEqual(value['count'], 2)
+        self.assertRaises(Http404, view.find_facet, facets, 'style', 'pop')
+        context = view.get_facet_context(
+            self.table, table, facets, facet, value
+        )
+        self.assertEqual(len(context['table']), 2)
+
+    def test_page_fragments(self):
+        import json
+        from table_stacker.api import TableDetailPagesView
+        table = TableFu(StringIO(CSV), per_page=3, paginate_after=3,
+                        sorted_by=[{'Number of Pages': 'descending'}])
+        page = json.loads(TableDetailPagesView().render_page(table, 2))
+        self.assertEqual(page['page'], 2)
+        self.assertEqual(page['pages'], 2)
+        self.assertEqual(page['html'].count('<tr>'), 1)
+        self.assertTrue('Samuel Beckett' in page['html'])
+        self.assertEqual(
+            self.table.get_pages_url(),
+            '/api/cubs-home-run-tracker/pages/',
+        )
+
+    def test_search_index(self):
+        from table_stacker import search
+        self.assertEqual(
+            search.tokenize("O'Neil, Jos\xc3\xa9 &amp; co-op 3.5"),
+            [u'o', u'neil', u'jos\xe9', u'amp', u'co', u'op', u'3', u'5'],
+        )
+        self.assertEqual(search.get_text('<a href="#">A &amp; B</a>'), 'A & B')
+        table = TableFu(StringIO(CSV), formatting={
+            'Best Book': {'method': 'link', 'arguments': ['Author']},
+        })
+        shards = search.build_index(table)
+        self.assertEqual(search.get_manifest(table, shards)['rows'], 4)
+        modernism = shards[search.shard_name(u'mo')][u'modernism']
+        self.assertEqual(search.delta_decode(modernism), [0, 1])
+        self.assertEqual(shards[search.shard_name(u'ul')], {u'ulysses': [1]})
+        self.assertEqual(
+            self.table.get_search_url(),
+            '/api/cubs-home-run-tracker/search/',
+        )
+
+    def test_columns_json_and_ndjson(self):
+        import json
+        from table_stacker.api import iter_columns_json, iter_ndjson
+        rows = [
+            ['Name', 'Age', 'Zip'],
+            ['Ann', '31', '02134'],
+            ['Bob', '', '90012'],
+            ['Cy', '4.5'],
+        ]
+        data = json.loads(''.join(iter_columns_json(rows, chunk_size=8)))
+        self.assertEqual(data['columns'], ['Name', 'Age', 'Zip'])
+        self.assertEqual(data['data']['Name'], ['Ann', 'Bob', 'Cy'])
+        self.assertEqual(data['data']['Age'], [31, None, 4.5])
+        self.assertEqual(data['data']['Zip'], ['02134', '90012', ''])
+        self.assertEqual(
+            json.loads(''.join(iter_columns_json([]))),
+            {'columns': [], 'data': {}},
+        )
+        # Columns are spooled in blocks, however small
+        self.assertEqual(
+            json.loads(''.join(iter_columns_json(rows, spool_size=10))),
+            data,
+        )
+        lines = ''.join(iter_ndjson(rows)).splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(lines[0].startswith('{"Name": "Ann", "Age": "31"'))
+        self.assertEqual(json.loads(lines[2]), {'Name': 'Cy', 'Age': '4.5'})
+
+
+class CompressionTest(TestCase):
+
+    def setUp(self):
+        self.build_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.build_dir)
+
+    def write(self, name, data):
+        import os
+        path = os.path.join(self.build_dir, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_compress_tree(self):
+        import os
+        import gzip
+        from table_stacker import compression
+        big = self.write('big.json', '[1, 2, 3]' * 500)
+        self.write('small.html', '<p>Hi</p>')
+        self.write('image.png', 'x' * 5000)
+        self.write('gone.csv.gz', 'stale')
+        manifest = compression.compress_tree(self.build_dir, workers=2)
+        self.assertEqual(sorted(manifest['files']), ['big.json', 'small.html'])
+        self.assertEqual(manifest['files']['small.html'], {'size': 9})
+        sizes = manifest['files']['big.json']
+        self.assertEqual(sizes['size'], 4500)
+        self.assertTrue(sizes['gzip'] < 100)
+        self.assertEqual(gzip.open(big + '.gz').read(), '[1, 2, 3]' * 500)
+        self.assertFalse(os.path.exists(big[:-8] + 'gone.csv.gz'))
+        # Unchanged files are left alone the next time around, even
+        # if they've been touched since
+        compression.save_manifest(self.build_dir, manifest)
+        os.utime(big + '.gz', (0, 0))
+        os.utime(big, None)
+        self.assertEqual(compression.compress_tree(self.build_dir), manifest)
+        self.assertEqual(os.path.getmtime(big + '.gz'), 0)
+        # A file that's changed is compressed again, even with the
+        # same size and time
+        self.write('big.json', '[4, 5, 6]' * 500)
+        os.utime(big, (0, 0))
+        manifest = compression.compress_tree(self.build_dir)
+        self.assertEqual(gzip.open(big + '.gz').read(), '[4, 5, 6]' * 500)
+        self.assertNotEqual(manifest['files']['big.json']['md5'],
+                            sizes['md5'])
+        self.write('big.json', '[]')
+        compression.compress_tree(self.build_dir)
+        self.assertFalse(os.path.exists(big + '.gz'))
+
+
+class PublisherTest(TestCase):
+
+    def setUp(self):
+        import os
+        self.build_dir = tempfile.mkdtemp()
+        self.site_dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.build_dir, 'api'))
+        self.write('index.html', '<p>Tables</p>')
+        self.write('api/cubs.json', '[]')
+        self.write('api/cubs.json.gz', 'zipped')
+        self.write('.build-manifest.json', '{}')
+
+    def tearDown(self):
+        shutil.rmtree(self.build_dir)
+        shutil.rmtree(self.site_dir)
+
+    def write(self, name, data):
+        import os
+        with open(os.path.join(self.build_dir, name), 'wb') as f:
+            f.write(data)
+
+    def test_only_changes_are_published(self):
+        import os
+        from table_stacker.publishing import (
+            LocalTarget,
+            Publisher,
+            get_headers,
+        )
+        target = LocalTarget(self.site_dir)
+        publisher = Publisher(self.build_dir, target, workers=2)
+        plan = publisher.plan()
+        self.assertEqual(
+            plan['upload'],
+            ['api/cubs.json', 'api/cubs.json.gz', 'index.html'],
+        )
+        self.assertEqual(publisher.publish(plan), {})
+        self.assertTrue(os.path.exists(target.get_path('api/cubs.json.gz')))
+        self.assertFalse(os.path.exists(
+            target.get_path('.build-manifest.json')
+        ))
+        self.write('index.html', '<p>More tables</p>')
+        os.remove(os.path.join(self.build_dir, 'api/cubs.json.gz'))
+        plan = publisher.plan()
+        self.assertEqual(plan['upload'], ['index.html'])
+        self.assertEqual(plan['delete'], ['api/cubs.json.gz'])
+        self.assertEqual(plan['unchanged'], 1)
+        publisher.publish(plan)
+        self.assertFalse(os.path.exists(target.get_path('api/cubs.json.gz')))
+        self.assertEqual(publisher.plan()['upload'], [])
+        self.assertEqual(get_headers('api/cubs.json.gz'), {
+            'Content-Type': 'application/json',
+            'Content-Encoding': 'gzip',
+        })
+
+    def test_first_publish_deletes_files_left_by_other_tools(self):
+        import os
+        from table_stacker.publishing import LocalTarget, Publisher
+        target = LocalTarget(self.site_dir)
+        target.upload_string('index.html', '<p>Old tables</p>')
+        target.upload_string('api/sox.json', '[]')
+        plan = Publisher(self.build_dir, target).plan()
+        self.assertEqual(
+            plan['upload'],
+            ['api/cubs.json', 'api/cubs.json.gz', 'index.html'],
+        )
+        self.assertEqual(plan['delete'], ['api/sox.json'])
+        keep = Publisher(self.build_dir, target, delete=False)
+        self.assertEqual(keep.plan()['delete'], [])
+        Publisher(self.build_dir, target).publish(plan)
+        self.assertFalse(os.path.exists(target.get_path('api/sox.json')))
+        self.assertEqual(sorted(target.list_keys()), [
+            'api/cubs.json', 'api/cubs.json.gz', 'index.html'
+        ])
+
+    def test_s3_connections_are_not_shared_between_threads(self):
+        import sys
+        import types
+        import threading
+        from multiprocessing.pool import ThreadPool
+        from table_stacker.publishing import S3Target
+
+        connections = []
+
+        class FakeBucket(object):
+            def __init__(self):
+                self.thread = threading.current_thread()
+
+        class FakeConnection(object):
+            def get_bucket(self, name):
+                return FakeBucket()
+
+        def connect_s3():
+            connections.append(FakeConnection())
+            return connections[-1]
+
+        boto = types.ModuleType('boto')
+        boto.connect_s3 = connect_s3
+        sys.modules['boto'] = boto
+        try:
+            target = S3Target('tables')
+        finally:
+            del sys.modules['boto']
+        self.assertEqual(len(connections), 1)
+        self.assertTrue(target.bucket is target.bucket)
+        pool = ThreadPool(3)
+        try:
+            used = pool.map(
+                lambda i: (threading.current_thread(), target.bucket),
+                range(30)
+            )
+        finally:
+            pool.close()
+            pool.join()
+        # Each thread uses a bucket it connected to itself
+        for thread, bucket in used:
+            self.assertTrue(bucket.thread is thread)
+        self.assertEqual(len(connections), 1 + len(set(used)))
+
+    def test_failed_uploads_are_retried(self):
+        from table_stacker.publishing import LocalTarget, Publisher
+
+        class FlakyTarget(LocalTarget):
+            calls = []
+
+            def upload(self, path, key, headers):
+                self.calls.append(key)
+                if key == 'index.html' and self.calls.count(key) < 3:
+                    raise IOError("Connection reset")
+                if key == 'api/cubs.json':
+                    raise IOError("Forbidden")
+                super(FlakyTarget, self).upload(path, key, headers)
+
+        target = FlakyTarget(self.site_dir)
+        publisher = Publisher(self.build_dir, target, retries=2, backoff=0)
+        failed = publisher.publish()
+        self.assertEqual(failed.keys(), ['api/cubs.json'])
+        self.assertEqual(target.calls.count('index.html'), 3)
+        self.assertEqual(target.calls.count('api/cubs.json'), 3)
+        self.assertEqual(publisher.plan()['upload'], ['api/cubs.json'])
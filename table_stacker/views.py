@@ -1,7 +1,58 @@
+import os
+import shutil
+from django.conf import settings
+from django.http import Http404
 from table_stacker.models import Table
+from django.test.client import RequestFactory
+from django.template.defaultfilters import slugify
 from bakery.views import BuildableDetailView, BuildableListView
 
 
+def unique_slug(value, taken):
+    """
+    Slugifies a value, adding a number to the end if the slug is taken,
+    and adds it to the set of those that are.
+    """
+    if isinstance(value, str):
+        value = unicode(value, 'utf-8')
+    base = slugify(value) or 'blank'
+    slug, n = base, 2
+    while slug in taken:
+        slug = '%s-%s' % (base, n)
+        n += 1
+    taken.add(slug)
+    return slug
+
+
+def get_facets(obj, table):
+    """
+    Returns a list describing each column a table is faceted on.
+
+    Each is a dictionary with the column's name and slug, and a list of
+    its values with their slugs, URLs and how many rows they have.
+    """
+    facets = []
+    column_slugs = set()
+    for column in table.facet_columns:
+        column_slug = unique_slug(column, column_slugs)
+        value_slugs = set()
+        values = []
+        for value, count in table.facet_counts(column):
+            value_slug = unique_slug(value, value_slugs)
+            values.append({
+                'value': value,
+                'slug': value_slug,
+                'count': count,
+                'url': obj.get_facet_url(column_slug, value_slug),
+            })
+        facets.append({
+            'column': column,
+            'slug': column_slug,
+            'values': values,
+        })
+    return facets
+
+
 class TableListView(BuildableListView):
     """
     A list of all tables.
@@ -15,10 +66,109 @@ class TableDetailView(BuildableDetailView):
     """
     queryset = Table.live.all()
 
+    def build_object(self, obj):
+        # Render the Table we were handed rather than fetching it again,
+        # so the TableFu it has loaded is shared with the other views
+        self.built_object = obj
+        try:
+            super(TableDetailView, self).build_object(obj)
+        finally:
+            self.built_object = None
+
+    def get_object(self, queryset=None):
+        obj = getattr(self, 'built_object', None)
+        if obj is not None:
+            return obj
+        return super(TableDetailView, self).get_object(queryset)
+
     def get_context_data(self, **kwargs):
         context = super(TableDetailView, self).get_context_data(**kwargs)
+        table = context['object'].get_tablefu()
         context.update({
             'size_choices': [1, 2, 3, 4],
-            'table': context['object'].get_tablefu(),
+            'table': table,
+            'facets': get_facets(context['object'], table),
         })
         return context
+
+
+class TableFacetView(BuildableDetailView):
+    """
+    The rows of a table that share one value in a column, for every value
+    of every column listed in its `facets` option.
+    """
+    queryset = Table.live.all()
+    template_name = 'table_stacker/table_facet.html'
+
+    def get_facet_context(self, obj, table, facets, facet, value):
+        """
+        The context for the page of one value of a facet, picked out of
+        the facets that get_facets returned.
+        """
+        return {
+            'object': obj,
+            'parent': table,
+            'table': table.facet_by_value(facet['column'], value['value']),
+            'facet': facet,
+            'value': value,
+            'facets': facets,
+        }
+
+    def find_facet(self, facets, column_slug, value_slug):
+        """
+        Looks up a facet and one of its values by their slugs.
+        """
+        for facet in facets:
+            if facet['slug'] != column_slug:
+                continue
+            for value in facet['values']:
+                if value['slug'] == value_slug:
+                    return facet, value
+        raise Http404
+
+    def get_context_data(self, **kwargs):
+        context = super(TableFacetView, self).get_context_data(**kwargs)
+        obj = context['object']
+        table = obj.get_tablefu()
+        facets = get_facets(obj, table)
+        facet, value = self.find_facet(
+            facets,
+            self.kwargs['column'],
+            self.kwargs['value'],
+        )
+        context.update(
+            self.get_facet_context(obj, table, facets, facet, value)
+        )
+        return context
+
+    def get_build_path(self, obj):
+        return os.path.join(
+            settings.BUILD_DIR,
+            obj.get_absolute_url()[1:],
+            'facets'
+        )
+
+    def build_object(self, obj):
+        path = self.get_build_path(obj)
+        # Clear out values that have since disappeared
+        shutil.rmtree(path, ignore_errors=True)
+        table = obj.get_tablefu()
+        self.object = obj
+        # Worked out once, since every page lists every facet
+        facets = get_facets(obj, table)
+        for facet in facets:
+            for value in facet['values']:
+                self.request = RequestFactory().get(value['url'])
+                context = self.get_facet_context(
+                    obj,
+                    table,
+                    facets,
+                    facet,
+                    value
+                )
+                page_dir = os.path.join(path, facet['slug'], value['slug'])
+                os.makedirs(page_dir)
+                self.write(
+                    os.path.join(page_dir, 'index.html'),
+                    self.render_to_response(context).render().content
+                )
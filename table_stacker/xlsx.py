@@ -0,0 +1,277 @@
+"""
+A streaming writer for Excel workbooks in the XLSX format.
+
+Rows are written straight from a CSV reader into the worksheet, one at a
+time, so a table of any length takes the same memory. The worksheet is
+spooled to a temporary file and compressed into the workbook from there.
+
+Text that repeats is written once to the workbook's shared strings and
+referred to by number. Columns the schema says are numeric are written
+as numbers, formatted the way they were in the CSV.
+
+Workbooks are written with a fixed timestamp, so the same CSV always
+makes the same file.
+"""
+import os
+import re
+import time
+import zipfile
+import tempfile
+from xml.sax.saxutils import escape
+from table_stacker.table_fu import schema as schemas
+
+CONTENT_TYPE = (
+    'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+)
+# Shared strings are kept in memory, so past this many the rest of the
+# text is written into the cells
+SHARED_STRING_LIMIT = 65536
+TIMESTAMP = (1980, 1, 1, 0, 0, 0)
+# Characters XML doesn't allow, even escaped
+INVALID_XML = re.compile(u'[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]')
+INVALID_SHEET_NAME = re.compile(r'[\[\]:*?/\\"\']')
+
+# The position of each type's number format in STYLES
+NUMBER_STYLES = {
+    schemas.INTEGER: 1,
+    schemas.FLOAT: 0,
+    schemas.CURRENCY: 2,
+    schemas.PERCENT: 3,
+}
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\
+<Default Extension="rels" \
+ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\
+<Default Extension="xml" ContentType="application/xml"/>\
+<Override PartName="/xl/workbook.xml" ContentType="application/\
+vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>\
+<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/\
+vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>\
+<Override PartName="/xl/sharedStrings.xml" ContentType="application/\
+vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>\
+<Override PartName="/xl/styles.xml" ContentType="application/\
+vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>\
+</Types>"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships \
+xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/\
+officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>\
+</Relationships>"""
+
+WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook \
+xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" \
+xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">\
+<sheets><sheet name="%s" sheetId="1" r:id="rId1"/></sheets></workbook>"""
+
+WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships \
+xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\
+<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/\
+officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>\
+<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/\
+officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>\
+<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/\
+officeDocument/2006/relationships/styles" Target="styles.xml"/>\
+</Relationships>"""
+
+STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\
+<numFmts count="1"><numFmt numFmtId="164" formatCode="&quot;$&quot;#,##0.00"/>\
+</numFmts>\
+<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>\
+<fills count="1"><fill><patternFill patternType="none"/></fill></fills>\
+<borders count="1"><border/></borders>\
+<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/>\
+</cellStyleXfs>\
+<cellXfs count="4">\
+<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>\
+<xf numFmtId="3" fontId="0" fillId="0" borderId="0" xfId="0" \
+applyNumberFormat="1"/>\
+<xf numFmtId="164" fontId="0" fillId="0" borderId="0" xfId="0" \
+applyNumberFormat="1"/>\
+<xf numFmtId="10" fontId="0" fillId="0" borderId="0" xfId="0" \
+applyNumberFormat="1"/>\
+</cellXfs>\
+<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/>\
+</cellStyles></styleSheet>"""
+
+SHEET_START = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">\
+<sheetData>"""
+SHEET_END = "</sheetData></worksheet>"
+
+
+def column_letter(index):
+    """
+    Returns the letters Excel uses for a column, counting from zero.
+    """
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def clean_text(value):
+    """
+    Returns a cell's text escaped for XML, as UTF-8.
+    """
+    if not isinstance(value, unicode):
+        value = unicode(value, 'utf-8', 'replace')
+    return escape(INVALID_XML.sub(u'', value)).encode('utf-8')
+
+
+def clean_sheet_name(name):
+    return INVALID_SHEET_NAME.sub('', name)[:31] or 'Sheet1'
+
+
+def format_number(number):
+    if number.is_integer() and abs(number) < 1e15:
+        return '%d' % number
+    return repr(number)
+
+
+class SharedStrings(object):
+    """
+    The workbook's table of text, numbering each string as it's added.
+    """
+    def __init__(self, limit=SHARED_STRING_LIMIT):
+        self.limit = limit
+        self.index = {}
+        self.strings = []
+        self.count = 0
+
+    def add(self, text):
+        """
+        Returns the number of a string, or None if the table is full.
+        """
+        try:
+            i = self.index[text]
+        except KeyError:
+            if len(self.strings) >= self.limit:
+                return None
+            i = self.index[text] = len(self.strings)
+            self.strings.append(text)
+        self.count += 1
+        return i
+
+    def to_xml(self):
+        head = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml'
+            '/2006/main" count="%s" uniqueCount="%s">'
+        ) % (self.count, len(self.strings))
+        body = ''.join(
+            '<si><t xml:space="preserve">%s</t></si>' % s
+            for s in self.strings
+        )
+        return head + body + '</sst>'
+
+
+def get_column_types(headers, schema):
+    """
+    Returns the numeric type of each column, or None for the rest.
+    """
+    types = []
+    seen = set()
+    for header in headers:
+        header = header.strip()
+        # The schema only describes the first column with a name
+        stats = schema.get(header) if header not in seen else None
+        seen.add(header)
+        if stats and stats['type'] in NUMBER_STYLES:
+            types.append(stats['type'])
+        else:
+            types.append(None)
+    return types
+
+
+def write_sheet(rows, outfile, strings, schema):
+    """
+    Writes the worksheet for CSV rows, headers first, to a file, adding
+    its text to a SharedStrings table.
+    """
+    outfile.write(SHEET_START)
+    types = []
+    letters = []
+    for r, row in enumerate(rows, 1):
+        if r == 1:
+            types = get_column_types(row, schema)
+        while len(letters) < len(row):
+            letters.append(column_letter(len(letters)))
+        cells = []
+        for c, value in enumerate(row):
+            if not value.strip():
+                continue
+            ref = '%s%s' % (letters[c], r)
+            kind = types[c] if r > 1 and c < len(types) else None
+            if kind is not None:
+                # Anything that wouldn't read the same as a number, like a
+                # code with a leading zero, is kept as text
+                number = schemas.read_number(value)
+                if number is not None:
+                    if kind == schemas.PERCENT:
+                        number = number / 100
+                    cells.append('<c r="%s" s="%s"><v>%s</v></c>' % (
+                        ref, NUMBER_STYLES[kind], format_number(number)
+                    ))
+                    continue
+            text = clean_text(value)
+            i = strings.add(text)
+            if i is None:
+                cells.append(
+                    '<c r="%s" t="inlineStr"><is><t xml:space="preserve">'
+                    '%s</t></is></c>' % (ref, text)
+                )
+            else:
+                cells.append('<c r="%s" t="s"><v>%s</v></c>' % (ref, i))
+        outfile.write('<row r="%s">%s</row>' % (r, ''.join(cells)))
+    outfile.write(SHEET_END)
+
+
+def write_xlsx(rows, outfile, schema=None, sheet_name='Sheet1'):
+    """
+    Writes CSV rows, headers first, as an XLSX workbook to outfile, which
+    can be a path or an open file.
+
+    The schema, as made by table_fu.schema, decides which columns are
+    written as numbers.
+    """
+    strings = SharedStrings()
+    fd, sheet_path = tempfile.mkstemp(suffix='.xml')
+    try:
+        with os.fdopen(fd, 'wb') as sheet:
+            write_sheet(rows, sheet, strings, schema or {})
+        # zipfile dates an entry written from a file by its mtime
+        stamp = time.mktime(TIMESTAMP + (0, 0, -1))
+        os.utime(sheet_path, (stamp, stamp))
+
+        # Without ZIP64 a worksheet over 2 GB can't be stored
+        workbook = zipfile.ZipFile(
+            outfile, 'w', zipfile.ZIP_DEFLATED, allowZip64=True
+        )
+        try:
+            for name, data in (
+                ('[Content_Types].xml', CONTENT_TYPES),
+                ('_rels/.rels', ROOT_RELS),
+                ('xl/workbook.xml', WORKBOOK % clean_text(
+                    clean_sheet_name(sheet_name)
+                )),
+                ('xl/_rels/workbook.xml.rels', WORKBOOK_RELS),
+                ('xl/styles.xml', STYLES),
+                ('xl/sharedStrings.xml', strings.to_xml()),
+            ):
+                info = zipfile.ZipInfo(name, TIMESTAMP)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0644 << 16
+                workbook.writestr(info, data)
+            workbook.write(sheet_path, 'xl/worksheets/sheet1.xml')
+        finally:
+            workbook.close()
+    finally:
+        os.remove(sheet_path)
@@ -16,10 +16,22 @@ urlpatterns = patterns('',
     url(r'^$', views.TableListView.as_view(), name='table-list'),
     
     # Serialization
-    url(r'^api/(?P<slug>[-\w]+).xls$', api.TableDetailXLSView.as_view(),
-        name='table-xls'),
+    url(r'^api/(?P<slug>[-\w]+).xlsx$', api.TableDetailXLSXView.as_view(),
+        name='table-xlsx'),
     url(r'^api/(?P<slug>[-\w]+).json$', api.TableDetailJSONView.as_view(),
         name='table-json'),
+    url(r'^api/(?P<slug>[-\w]+).columns.json$',
+        api.TableDetailColumnsJSONView.as_view(), name='table-columns-json'),
+    url(r'^api/(?P<slug>[-\w]+).ndjson$', api.TableDetailNDJSONView.as_view(),
+        name='table-ndjson'),
+    url(r'^api/(?P<slug>[-\w]+)/pages/(?P<page>\d+).json$',
+        api.TableDetailPagesView.as_view(), name='table-page'),
+    url(r'^api/(?P<slug>[-\w]+)/search/(?P<shard>\w+).json$',
+        api.TableDetailSearchView.as_view(), name='table-search'),
+    url(r'^api/(?P<slug>[-\w]+)/facets.json$',
+        api.TableDetailFacetsView.as_view(), name='table-facets-json'),
+    url(r'^api/(?P<slug>[-\w]+)/summary.json$',
+        api.TableDetailSummaryView.as_view(), name='table-summary-json'),
     url(r'^api/(?P<slug>[-\w]+).csv$', api.TableDetailCSVView.as_view(),
         name='table-csv'),
     
@@ -28,6 +40,10 @@ urlpatterns = patterns('',
         name="table-feed"),
     url(r'^sitemap.xml$', sitemaps.SitemapView.as_view(), name='sitemap'),
     
+    # Table facets
+    url(r'^(?P<slug>[-\w]+)/facets/(?P<column>[-\w]+)/(?P<value>[-\w]+)/$',
+        views.TableFacetView.as_view(), name='table-facet'),
+
     # Table detail
     url(r'^(?P<slug>[-\w]+)/$', views.TableDetailView.as_view(),
         name='table-detail'),